@@ -1,15 +1,28 @@
-import win32gui
 import traceback
 from typing import Union
 from pathlib import Path
 from abc import ABC, abstractmethod
-from win32ui import CreateFileDialog
 
-import pandas as pd
+from .lazy import lazy, exports
+from . import services
+from .services import Service
 
-from .office import FileManager, Excel, Word, Outlook, SharePoint, Access
-from .shared import Table, Console, Browser, Notify, WindowManager
-from .scheduler import Task, Scheduler
+
+# [NOTE] Nothing heavier than the standard library is imported with the
+#  package. win32, pandas and office365 load the first time a class
+#  needing them is used, see process.lazy.
+win32gui = lazy("win32gui")
+win32ui = lazy("win32ui")
+office = lazy(".office", __package__)
+shared = lazy(".shared", __package__)
+scheduler = lazy(".scheduler", __package__)
+
+__getattr__, __dir__ = exports(__name__, {
+    "FileManager": ".office", "Excel": ".office", "Word": ".office",
+    "Outlook": ".office", "SharePoint": ".office", "Access": ".office",
+    "Table": ".shared", "Console": ".shared", "Browser": ".shared",
+    "Notify": ".shared", "WindowManager": ".shared",
+    "Task": ".scheduler", "Scheduler": ".scheduler"})
 
 
 class Process(ABC):
@@ -20,7 +33,7 @@ class Process(ABC):
                "download_sharepoint_folder", "download_sharepoint_file",
                "sharepoint_folder_contents", "sharepoint_file_to_dataframe", 
                "local_file_to_dataframe", "export_dataframe_to_worksheet",
-               "execute_workbook_macro"]
+               "execute_workbook_macro", "warmup", "close"]
 
 
     def __init__(self, username: str=None, password: str=None):
@@ -67,20 +80,74 @@ class Process(ABC):
         
          User notifications are built in using self.notify, with
          the option of notification via win native messagebox
-         or a taskbar popup._
+         or a taskbar popup.
+         
+         Each of these is built the first time it is used, see 
+         process.services: a process only using Excel does not sign
+         in to SharePoint. self.warmup() builds them ahead of use, 
+         self.close() releases them, and self.timings holds the 
+         seconds each one took to build._
+        """
+
+        # [NOTE] Kept until self.sharepoint is built, then dropped.
+        self.__credentials = (username, password)
+
+    def __sharepoint(self):
+        try:
+            username, password = self.__credentials
+            del self.__credentials
+        except AttributeError:
+            # [NOTE] Rebuilt after close, SharePoint asks for them again.
+            username, password = None, None
+        return office.SharePoint(username, password)
+
+    # [NOTE] The factories take the process. Names inside them are the
+    #  module's (shared, office, scheduler), not these attributes.
+    editor = Service(lambda process: shared.Table)
+    sharepoint = Service(__sharepoint)
+    filemanager = Service(lambda process: office.FileManager())
+    window = Service(lambda process: shared.WindowManager())
+    scheduler = Service(lambda process: scheduler.Scheduler())
+    webbrowser = Service(lambda process: shared.Browser())
+    outlook = Service(lambda process: office.Outlook())
+    console = Service(lambda process: shared.Console())
+    notify = Service(lambda process: shared.Notify())
+    excel = Service(lambda process: office.Excel())
+    word = Service(lambda process: office.Word())
+
+    @property
+    def timings(self) -> dict:
+        """
+        _Seconds each service took to build, in the order built._
+        """
+
+        return dict(services.timings(self))
+
+    def warmup(self, *names: str) -> dict:
+        """_Builds services ahead of use, e.g. before a scheduled run starts.
+            A service failing to build is printed and built again on first use._
+
+        Args:
+            names (str, optional): _services to build_. Defaults to every service.
+
+        Returns:
+            dict: _seconds each service built so far took to build_
+        """
+
+        return services.warmup(self, names)
+
+    def close(self, *names: str) -> list:
+        """_Releases built services, the Office applications quit once they
+            are no longer referenced. Services closed are rebuilt on next use._
+
+        Args:
+            names (str, optional): _services to close_. Defaults to every service.
+
+        Returns:
+            list: _names of the services closed_
         """
 
-        self.editor = Table
-        self.sharepoint = SharePoint(username, password)         
-        self.filemanager = FileManager()
-        self.window = WindowManager()
-        self.scheduler = Scheduler()
-        self.webbrowser = Browser() 
-        self.outlook = Outlook()
-        self.console = Console()
-        self.notify = Notify()
-        self.excel = Excel()
-        self.word = Word()
+        return services.close(self, names)
         
     
     @abstractmethod
@@ -102,7 +169,7 @@ class Process(ABC):
         return self.word.app
 
     def get_desktop_access():
-        return Access() # to be completed...
+        return office.Access() # to be completed...
 
     def start_task(self, specifications: dict):
         """_Creates and starts a scheduler.Task_
@@ -112,13 +179,13 @@ class Process(ABC):
         """
 
         try:
-            task = Task(specifications)
+            task = scheduler.Task(specifications)
             task.main()
         
         except:
-            Task()
+            scheduler.Task()
 
-    def schedule_task(self, task: Task):
+    def schedule_task(self, task: "scheduler.Task"):
         """_Schedules a scheduler.Task._
 
         Args:
@@ -129,7 +196,7 @@ class Process(ABC):
             self.scheduler.add_task(task)
         
         except:
-            Scheduler()
+            scheduler.Scheduler()
 
     def download_sharepoint_folder(self, url_or_list_of_folders_from_shared_documents: Union[str, list],
                                    destination: Union[str, Path]=None) -> str:
@@ -214,7 +281,7 @@ class Process(ABC):
 
         print(prompt)
         
-        fileDialog = CreateFileDialog(False,None,None,False)
+        fileDialog = win32ui.CreateFileDialog(False,None,None,False)
         fileDialog.DoModal() # blocking, required
         
         return fileDialog.GetPathName()
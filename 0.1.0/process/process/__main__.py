@@ -1,8 +1,26 @@
 import os
+import json
+import typing
+import hashlib
 import inspect
+import tempfile
 import traceback
-from time import sleep
 from pprint import pprint
+from dataclasses import dataclass, asdict
+
+
+"""[Menu Summary]
+    The Process Menu lists the public functions of the Process class. The
+    entries, and how to parse each parameter typed in from its annotation,
+    are read from the class once, without constructing its services, and
+    cached on disk by module mtime and hash:
+
+        : MenuRegistry.of(Process)    from memory, the disk cache, or built
+        : registry.bind(api)          {option: (entry, bound method)}
+
+    A changed mtime with unchanged contents (e.g. a checkout) keeps the
+    cache. Menu actions call the bound methods directly.
+"""
 
 
 class TypeMismatchDataIn2DataOut(Exception):
@@ -25,6 +43,201 @@ class TooManyFunctionParameters(Exception):
     pass
 
 
+MENU_CACHE = os.path.join(tempfile.gettempdir(), "process", "menus")
+
+
+def _list(value: str) -> list:
+    value = value.strip().strip("[]()")
+    return [v.strip() for v in value.split(",")] if value else list()
+
+
+def _dict(value: str) -> dict:
+    try:
+        pairs = [kv.split(":", 1) for kv in _list(value.strip().strip("{}"))]
+        return {k.strip(): v.strip() for k, v in pairs}
+    except ValueError:
+        raise Failed2ParseParameterValue(value)
+
+
+def _bool(value: str) -> bool:
+    if value.lower() in ["y", "yes", "true", "1"]:
+        return True
+    if value.lower() in ["n", "no", "false", "0"]:
+        return False
+    raise ValueError(value)
+
+
+# [NOTE] Keyed by annotation name, string annotations parse the same.
+PARSERS = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": _bool,
+    "list": _list,
+    "tuple": lambda value: tuple(_list(value)),
+    "dict": _dict}
+
+
+def _kind(annotation: typing.Any) -> str:
+    """_Name of the parser of an annotation, str if there is none._"""
+
+    if annotation is inspect.Parameter.empty:
+        return "str"
+    if isinstance(annotation, str):
+        name = annotation
+    else:
+        name = getattr(typing.get_origin(annotation) or annotation, "__name__", "")
+    name = name.split("[")[0].strip()
+    return name if name in PARSERS else "str"
+
+
+@dataclass
+class MenuEntry:
+
+    name: str
+    title: str
+    parameters: list # [name, parser, required]
+
+
+def _sources(Process: type) -> list:
+    files = list()
+    for klass in Process.__mro__:
+        try:
+            files.append(inspect.getsourcefile(klass))
+        except (TypeError, OSError):
+            pass # [NOTE] builtins, e.g. object, or classes without a source file
+    # [NOTE] This file is included, changes to Console.__all__ rebuild the menus.
+    files.append(__file__)
+    return list(dict.fromkeys(os.path.abspath(f) for f in files if f))
+
+
+def _digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class MenuRegistry:
+    """
+    _Process Menu entries of a Process class, see the menu summary._
+    """
+
+    _built = dict() # (Process class, excluded names): MenuRegistry
+
+    def __init__(self, entries: list):
+        self.entries = entries
+
+    @classmethod
+    def of(cls, Process: type, exclude: list=(), cache: str=MENU_CACHE) -> "MenuRegistry":
+        """_Returns the registry of a Process class, built once per class and
+            excluded names._
+
+        Args:
+            Process (type): _Process class_
+            exclude (list, optional): _function names left off the menu_. Defaults to ().
+            cache (str, optional): _folder of the disk cache, None to skip it_. Defaults to MENU_CACHE.
+
+        Returns:
+            MenuRegistry: _entries in declaration order_
+        """
+
+        key = (Process, tuple(sorted(exclude)))
+        if key in cls._built:
+            return cls._built[key]
+
+        registry = None
+        if cache:
+            excluded = hashlib.sha1(",".join(key[1]).encode()).hexdigest()[:12]
+            path = os.path.join(cache, f"{Process.__module__}.{Process.__qualname__}.{excluded}.json")
+            sources = _sources(Process)
+            registry = cls._load(path, sources)
+        if registry is None:
+            registry = cls.build(Process, exclude)
+            if cache:
+                registry._save(path, [[s, os.stat(s).st_mtime_ns, _digest(s)] for s in sources])
+        cls._built[key] = registry
+        return registry
+
+    @classmethod
+    def build(cls, Process: type, exclude: list=()) -> "MenuRegistry":
+        """_Reads the entries from the class, services are not constructed._
+
+        Args:
+            Process (type): _Process class_
+            exclude (list, optional): _function names left off the menu_. Defaults to ().
+
+        Returns:
+            MenuRegistry: _entries in declaration order_
+        """
+
+        functions = dict()
+        for klass in reversed(Process.__mro__):
+            for name, member in vars(klass).items():
+                if inspect.isfunction(member) and not name.startswith("_") and not name in exclude:
+                    functions[name] = member
+
+        entries = list()
+        for name, func in functions.items():
+            parameters = list(inspect.signature(func).parameters.values())[1:]
+            entries.append(MenuEntry(
+                name, " ".join(w.title() for w in name.split("_")),
+                [[p.name, _kind(p.annotation), p.default is inspect.Parameter.empty]
+                 for p in parameters if not p.kind in [p.VAR_POSITIONAL, p.VAR_KEYWORD]]))
+        return cls(entries)
+
+    @classmethod
+    def _load(cls, path: str, sources: list) -> "MenuRegistry":
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if [c[0] for c in cached["sources"]] != sources:
+            return None
+        touched = False
+        try:
+            for source in cached["sources"]:
+                mtime = os.stat(source[0]).st_mtime_ns
+                if mtime != source[1]:
+                    if _digest(source[0]) != source[2]:
+                        return None
+                    source[1], touched = mtime, True
+        except OSError:
+            return None # [NOTE] A source was removed since.
+
+        registry = cls([MenuEntry(**entry) for entry in cached["entries"]])
+        if touched:
+            registry._save(path, cached["sources"])
+        return registry
+
+    def _save(self, path: str, sources: list):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                json.dump({"sources": sources, "entries": [asdict(e) for e in self.entries]}, f)
+        except OSError:
+            pass # [NOTE] Without a writable cache the menu is built at each launch.
+
+    def options(self) -> dict:
+        """_Menu options, numbered from 1, followed by Go Back To Main._"""
+
+        options = {i: entry.title for i, entry in enumerate(self.entries, 1)}
+        options[len(options)+1] = "Go Back To Main"
+        return options
+
+    def bind(self, api: typing.Any) -> dict:
+        """_Resolves each entry once to the bound method of a Process instance._
+
+        Args:
+            api (typing.Any): _Process instance_
+
+        Returns:
+            dict: _{option: (MenuEntry, bound method)}_
+        """
+
+        return {i: (entry, getattr(api, entry.name)) for i, entry in enumerate(self.entries, 1)}
+
+
 class Console:
     """_The console interface to the Process Class._
 
@@ -32,10 +245,9 @@ class Console:
         Process.Console (_Process.shared.Console_): _Process.shared.Console_
     """
 
-    # [TODO] For menu ordering. Does it depend on the
-    # order in which functions appear in this file,
-    # and in the inheriting Process file?
-    # Should functions get listed by inspect as found?
+    # [NOTE] Process Menu functions are listed in the order they are
+    # declared, those of Process first, see MenuRegistry. The names
+    # below are left off it.
     __all__ = ['process_menu', 'developer_help'
                'shared_documents','create_table'
                'shutdown','create_new_table'
@@ -46,9 +258,6 @@ class Console:
                "submit_a_feature_request", 
                "go_back_to_main", "shutdown"]
 
-    GET_OBJMEM_NAME = lambda m: m[0]
-    GET_OBJMEM_TYPE = lambda m: str(m[1]).split()[0].strip()[1:]
-    
     def __init__(self, Process, **kwargs):
         self._dataIn = None # placeholder for return from .dataIn
         
@@ -68,22 +277,11 @@ class Console:
         except:
             raise ProcessFailed2Initalize
 
-        opt = 0 # option number for Process Menu
-        self.OPTIONS["Process Menu"]= dict()
-        
-        for member in inspect.getmembers(self.api):
-            name = self.GET_OBJMEM_NAME(member)
-        
-            if not name[0] == "_":
-                func = self.GET_OBJMEM_TYPE(member)
-        
-                if func == 'function' and not name in self.__all__:
-                    opt += 1 # starting with 1 provides a better ux.
-                    functionAsTitledName = "".join([w.title() for w in name.split("_")])
-                    self.OPTIONS["Process Menu"][opt] = functionAsTitledName
-        
-        opts = len(self.OPTIONS["Process Menu"])
-        self.OPTIONS["Process Menu"][opts+1] = "Go Back To Main"
+        # [NOTE] Read from the class, reading the members of self.api
+        #  would construct every service of the process.
+        self.menu = MenuRegistry.of(Process, self.__all__)
+        self.OPTIONS = {"Process Menu": self.menu.options()}
+        self.ACTIONS = self.menu.bind(self.api)
 
     def __process_fail(self, exception: Exception):
         # Does not return to a menu as it is unknown from which menu this process
@@ -99,6 +297,10 @@ class Console:
         # to the application running the destkop script would show the message
         # below when selected. Other functions, streamed dataframe operations
         # from SharePoint, would not be impacted.
+        # [NOTE] Nobody is there to read it in a batch run, see process.batch.
+        if self.api.console.batch_mode():
+            raise exception
+
         self.api.console.clear()
         pprint("This process is currently unavaiable.")
         
@@ -116,79 +318,60 @@ class Console:
             if self.api.console.get_yesno("Continue?") == "no":
                 os._exit(0)
 
-    def __process_menu(self, selection: str):
+    def __process_menu(self, selection: int):
         # Parameters must be fetched from the command line using the tools
         # provided through self.console if the process is being run from 
         # the console, with the exception of .dataOut (which should only include
         # parameters are are equal to the return from .dataIn).
 
         # Args: 
-        #   selection, _str_ : _the selection option value_ 
-        titledNameAsFunction = '_'.join([w.lower() for w in self.OPTIONS["Process Menu"][selection]])
-        if titledNameAsFunction == "Process Menu":
-            return self.process_menu()
-        elif titledNameAsFunction == "Console Menu":
-            return self.console_menu()
+        #   selection, _int_ : _the selection option key_ 
+        entry, func = self.ACTIONS[selection]
         
-        func = eval(f"self.api.{titledNameAsFunction}")
-        try:
-            func((self._dataIn))
+        if entry.name == "dataOut" and self._dataIn is not None:
+            parameters = self._dataIn
         
-        except:
-            parameters_types = func.__annotations__
-            if len(parameters_types) != len(self._dataIn):
-                self.__process_fail(TooManyFunctionParameters)
-
-            parameters = list() # short for parameters
-            for name, t in parameters_types.items():
-                value = input(f"{name}?: ").strip()
-                
-                if t == dict:
-                    param = dict()
-                    value.replace("{","")
-                    value.replace("}","")
-                    pairs = [kv.strip() for kv in value.split(",")]
-                    pairs = [kv.split(":") for kv in pairs]
+        else:
+            parameters = dict()
+            for name, parser, required in entry.parameters:
+                value = self.api.console._input(f"{name}?: ").strip()
+                if not value and not required:
+                    continue
                 
-                    try:
-                        for pair in pairs:
-                            k, v = pair[0].strip(), pair[1].strip()
-                            param[k] = v
-                        parameters.append(tuple(name,param))
+                try:
+                    parameters[name] = PARSERS[parser](value)
                 
-                    except:       
-                        self.__process_fail(Failed2ParseParameterValue)
-
-                elif t in [list, tuple]:
-                    value.replace("[","")
-                    value.replace("]","")
-                    value.replace("(","")
-                    value.replace(")","")
-
-                    value = [v.strip() for v in value.split(",")]
-                    parameters[name] = value if t == list else tuple(value)
-
-                elif t in [str, int, float]:
-                    try:
-                        parameters.append(name, t(value))
-                    
-                    except:
-                        self.__process_fail(Failed2ConvertParameterValueType)
+                except Failed2ParseParameterValue as e:
+                    self.__process_fail(e)
+                    return self.process_menu()
                 
-                else:
-                    self.__process_fail(Failed2ConvertParameterValueType)
+                except (ValueError, TypeError):
+                    self.__process_fail(Failed2ConvertParameterValueType(f"{name}: {value}"))
+                    return self.process_menu()
+
+        try:
+            if type(parameters) == dict:
+                result = func(**parameters)
+            elif type(parameters) in [list, tuple]:
+                result = func(*parameters)
+            else:
+                raise TypeMismatchDataIn2DataOut(type(parameters))
+        
+        except Exception as e:
+            self.__process_fail(e)
+            return self.process_menu()
 
-            func((parameters.values))
+        if entry.name == "dataIn":
+            self._dataIn = result
         
         return self.process_menu()
 
     def process_menu(self):
         menu = self.OPTIONS["Process Menu"]
-        sel = self.console.get_option_selection(menu)
+        sel = self.api.console.get_option_selection("Process Menu", menu)
         
-        selection = self.OPTIONS["Process Menu"][sel]
-        if selection == "Back To Main": return self.main()
-        return self.__process_menu(selection)
+        if not sel in self.ACTIONS: return self.main()
+        return self.__process_menu(sel)
 
     def create_table(self):
         menu = {
@@ -205,17 +388,16 @@ class Console:
     def setup_text_msg_alerts(self):
         while True:
             try:
-                areacode = int(input("Area Code [###]: ").strip())
-                phonenum = input("Phone Number [###-####]: ")
+                areacode = str(int(self.api.console._input("Area Code [###]: ").strip()))
+                phonenum = self.api.console._input("Phone Number [###-####]: ")
                 phonenum = "".join([i for i in list(phonenum) if i.isnumeric()])
                 phonenum = areacode + phonenum
                 if not len(phonenum) == 10:
                     raise ValueError
                 break
             
-            except:
-                print("???\033[0K\r")
-                sleep(2)
+            except ValueError:
+                self.api.console._reject("???\033[0K\r")
 
         options = {
             1 : "AT&T",
@@ -248,12 +430,12 @@ class Console:
             pprint("Please 'Setup Text Msg Alerts' first from the startup menu.")
 
     def exec_console_function(self, selection: str):
-        titledNameAsFunction = '_'.join([w.lower() for w in selection])
-        return eval(f"self.{titledNameAsFunction}")()
+        titledNameAsFunction = '_'.join([w.lower() for w in selection.split()])
+        return getattr(self, titledNameAsFunction)()
 
     def exec_console_submenu_function(self, selection: str):
-        titledNameAsFunction = '_'.join([w.lower() for w in selection])
-        return eval(f"self.__{titledNameAsFunction}")()
+        titledNameAsFunction = '_'.join([w.lower() for w in selection.split()])
+        return getattr(self, f"_Console__{titledNameAsFunction}")()
    
     def console_menu(self):
         """_summary_
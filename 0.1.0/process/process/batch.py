@@ -0,0 +1,237 @@
+import os
+import re
+import json
+from pathlib import Path
+from typing import Any, Union
+
+
+"""[Batch Summary]
+    Unattended runs of Console driven processes, e.g. on the scheduler or
+    in CI. While a Batch is running, every Console prompt is answered from
+    it instead of input(), validated by the same rules, and an answer that
+    is missing or rejected raises at once instead of sleeping and asking
+    again.
+
+    Answers are given in order (a script file, one answer per line, or a
+    JSON list), by prompt (a JSON map), or both, {"answers": [...], key:
+    ...}. A prompt's key is its message, lower case, without the [hint]
+    and punctuation: "Please enter the date [mm/dd/yyyy]: " is
+    please_enter_the_date. Each answer is used once, those of the
+    prompt's key first (a list is used in turn), then the ordered ones.
+
+    ```python
+    with Batch.from_json({"selection": "1-10", "process_menu": [1, 3]}):
+        app.main()
+    ```
+
+    Environment variables start a batch without changing the script:
+    PROCESS_BATCH is the path of a script or JSON file, and each
+    PROCESS_ANSWER_<KEY> answers a key (PROCESS_ANSWER_PROCESS_MENU=1).
+
+    Every answer is recorded in .transcript, and save writes it as a JSON
+    file which from_json replays.
+"""
+
+
+BATCH_FILE = "PROCESS_BATCH"
+ANSWER_PREFIX = "PROCESS_ANSWER_"
+
+
+class InvalidBatchAnswer(Exception):
+    """
+    _A batch answer was rejected by the Console prompt's validation._
+    """
+    pass
+
+
+class MissingBatchAnswer(InvalidBatchAnswer):
+    """
+    _The batch has no answer left for a Console prompt._
+    """
+    pass
+
+
+def prompt_key(prompt: str) -> str:
+    """_Key of a prompt, see the module summary._
+
+    Args:
+        prompt (str): _prompt or message_
+
+    Returns:
+        str: _e.g. please_enter_the_date_
+    """
+
+    prompt = re.sub(r"\[[^\]]*\]", "", prompt)
+    return "_".join(re.findall(r"[a-z0-9]+", prompt.lower()))
+
+
+def _text(answer: Any) -> str:
+    if isinstance(answer, bool):
+        return "y" if answer else "n"
+    return str(answer)
+
+
+class Batch:
+    """
+    _Answers to Console prompts, see the module summary._
+    """
+
+    current = None # the running Batch
+    _environment = False # PROCESS_BATCH and PROCESS_ANSWER_* read
+
+    def __init__(self, answers: list = None, keyed: dict = None):
+        """
+        Args:
+            answers (list, optional): _answers in order_. Defaults to None.
+            keyed (dict, optional): _{prompt key: answer or list of answers}_. Defaults to None.
+        """
+
+        self.answers = [_text(a) for a in answers or list()]
+        self.keyed = dict()
+        for key, answer in (keyed or dict()).items():
+            answer = answer if isinstance(answer, list) else [answer]
+            self.keyed[prompt_key(key)] = [_text(a) for a in answer]
+        self.transcript = list()
+
+    @classmethod
+    def from_script(cls, path: Union[str, Path]) -> "Batch":
+        """_Answers in order, one per line. Blank lines and lines starting
+            with # are skipped._
+
+        Args:
+            path (Union[str, Path]): _script file_
+
+        Returns:
+            Batch: _process.batch.Batch_
+        """
+
+        with open(path) as f:
+            lines = [line.rstrip("\n") for line in f]
+        return cls([line for line in lines if line.strip() and not line.lstrip().startswith("#")])
+
+    @classmethod
+    def from_json(cls, source: Union[str, Path, dict, list]) -> "Batch":
+        """_Answers from a JSON file, a map or a list. A list may be a saved
+            transcript._
+
+        Args:
+            source (Union[str, Path, dict, list]): _path, {key: answer} or [answers]_
+
+        Returns:
+            Batch: _process.batch.Batch_
+        """
+
+        if isinstance(source, (str, Path)):
+            with open(source) as f:
+                source = json.load(f)
+        if isinstance(source, dict):
+            keyed = dict(source)
+            answers = keyed.pop("answers") if isinstance(keyed.get("answers"), list) else None
+            return cls(answers, keyed)
+        return cls([a["answer"] if isinstance(a, dict) else a for a in source])
+
+    @classmethod
+    def from_environment(cls, environ: dict = None) -> "Batch":
+        """_Answers from PROCESS_BATCH and PROCESS_ANSWER_*, see the module summary._
+
+        Args:
+            environ (dict, optional): _environment_. Defaults to os.environ.
+
+        Returns:
+            Batch: _process.batch.Batch, or None if neither is set_
+        """
+
+        environ = os.environ if environ is None else environ
+        keyed = {name[len(ANSWER_PREFIX):]: value for name, value in environ.items()
+                 if name.startswith(ANSWER_PREFIX)}
+        path = environ.get(BATCH_FILE)
+        if not path and not keyed:
+            return None
+
+        if not path:
+            batch = cls()
+        elif Path(path).suffix.lower() == ".json":
+            batch = cls.from_json(path)
+        else:
+            batch = cls.from_script(path)
+        batch.keyed.update(cls(keyed=keyed).keyed)
+        return batch
+
+    @classmethod
+    def running(cls) -> "Batch":
+        """_The running batch, started from the environment on first use._
+
+        Returns:
+            Batch: _process.batch.Batch, or None when running interactively_
+        """
+
+        if cls.current is None and not cls._environment:
+            cls._environment = True
+            batch = cls.from_environment()
+            if batch is not None:
+                batch.start()
+        return cls.current
+
+    def start(self) -> "Batch":
+        Batch.current = self
+        return self
+
+    def stop(self):
+        if Batch.current is self:
+            Batch.current = None
+
+    def __enter__(self) -> "Batch":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def answer(self, prompt: str, key: str = None) -> str:
+        """_Next answer to a prompt, recorded in the transcript._
+
+        Args:
+            prompt (str): _prompt shown to the user_
+            key (str, optional): _prompt key_. Defaults to the key of the prompt.
+
+        Raises:
+            MissingBatchAnswer: _no answer is left for the prompt_
+
+        Returns:
+            str: _answer_
+        """
+
+        key = prompt_key(key or prompt)
+        if self.keyed.get(key):
+            answer = self.keyed[key].pop(0)
+        elif self.answers:
+            answer = self.answers.pop(0)
+        else:
+            raise MissingBatchAnswer(f"No answer for {prompt.strip()!r} ({key}).")
+        self.transcript.append({"key": key, "prompt": prompt.strip(), "answer": answer})
+        return answer
+
+    def reject(self, reason: str):
+        """_Fails on the last answer, which the prompt's validation rejected._
+
+        Args:
+            reason (str): _validation message_
+
+        Raises:
+            InvalidBatchAnswer: _always_
+        """
+
+        reason = re.sub(r"\x1b\[[0-9;]*[A-Za-z]", "", reason).strip() # [NOTE] Console erase codes.
+        last = self.transcript[-1] if self.transcript else dict()
+        if last:
+            last["rejected"] = reason
+        raise InvalidBatchAnswer(f"{last.get('answer')!r} for {last.get('prompt')!r}: {reason}")
+
+    def save(self, path: Union[str, Path]):
+        """_Writes the transcript, which from_json replays._
+
+        Args:
+            path (Union[str, Path]): _JSON file_
+        """
+
+        with open(path, "w") as f:
+            json.dump(self.transcript, f, indent=2)
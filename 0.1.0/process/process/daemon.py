@@ -0,0 +1,393 @@
+import io
+import os
+import sys
+import pickle
+import socket
+import secrets
+import getpass
+import importlib
+import traceback
+from pathlib import Path
+from time import perf_counter
+from contextlib import redirect_stdout, redirect_stderr
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client
+from typing import Any, Callable, Union
+
+from .batch import Batch
+
+
+"""[Daemon Summary]
+    A resident process runtime, keeping pandas, pywin32 and office365
+    imported and the services of each Process built (SharePoint signed in,
+    Excel dispatched) between runs. A cold `python -m name_of_your_package`
+    pays for those at every run, a job submitted to the daemon does not.
+
+    Start it once per user session, e.g. from the startup folder or as a
+    scheduler.Task:
+
+    ```bash
+    python -m process.daemon
+    ```
+
+    Jobs name a Process class by "package.module:Class" (the class defaults
+    to Process) and the function to run on it, dataIn, dataOut or main. The
+    daemon imports the package once, builds the Process once per username
+    and re-imports the package when any of its module files changes, after
+    closing the Processes built from it (see Process.close). Whatever the
+    job prints is streamed back to the caller while it runs:
+
+    ```python
+    from process import daemon
+    parameters = daemon.submit("name_of_your_package:Process", "dataIn")
+    daemon.submit("name_of_your_package:Process", "dataOut", args=parameters)
+    ```
+
+    The daemon has no console, jobs run in batch mode (see process.batch).
+    Answers are sent with the job, by default those of the caller's
+    PROCESS_BATCH and PROCESS_ANSWER_* variables, and a prompt left without
+    one fails the job instead of waiting.
+
+    Connections are local only, a named pipe on Windows and the loopback
+    interface elsewhere, and authenticated with a key kept in the user's
+    home folder. Jobs run one at a time, in the daemon's main thread, as
+    the COM objects of the Office applications are bound to it.
+"""
+
+
+if sys.platform == "win32":
+    ADDRESS = rf"\\.\pipe\process-daemon-{getpass.getuser()}"
+else:
+    ADDRESS = ("127.0.0.1", 50617)
+
+AUTHKEY_FILE = Path.home() / ".process" / "daemon.key"
+
+# [NOTE] Imported when the daemon starts, those missing are skipped.
+PRELOAD = ["pandas", "numpy", "dateutil.parser", "win32com.client", "win32api", "win32gui",
+           "office365.sharepoint.client_context", "process.shared", "process.table",
+           "process.office", "process.scheduler"]
+
+CALLS = ["dataIn", "dataOut", "main"]
+
+
+class DaemonUnavailable(Exception):
+    """
+    _No daemon is listening at the address, or it refused the key._
+    """
+    pass
+
+
+class JobFailed(Exception):
+    """
+    _The job raised in the daemon, the message holds its traceback._
+    """
+    pass
+
+
+def authkey(path: Union[str, Path] = AUTHKEY_FILE) -> bytes:
+    """_The daemon's key, created on first use and readable by the user only._
+
+    Args:
+        path (Union[str, Path], optional): _key file_. Defaults to AUTHKEY_FILE.
+
+    Returns:
+        bytes: _key_
+    """
+
+    path = Path(path)
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        key = secrets.token_bytes(32)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        return key
+
+
+def _nodelay(connection: Any, address: Union[str, tuple]) -> Any:
+    # [NOTE] On TCP, a small message sent right after another waits out the
+    #  delayed acknowledgement of the first, ~40ms per job. Pipes are left as is.
+    if not isinstance(address, tuple):
+        return connection
+    sock = socket.socket(fileno=connection.fileno())
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    finally:
+        sock.detach()
+    return connection
+
+
+def _picklable(value: Any) -> Any:
+    # [NOTE] e.g. a COM object returned by a job comes back as its repr.
+    try:
+        pickle.dumps(value)
+        return value
+    except Exception:
+        return repr(value)
+
+
+class _Stream(io.TextIOBase):
+    """
+    _Sends what a job writes to the caller, as (name, text) messages._
+    """
+
+    def __init__(self, connection: Any, name: str):
+        self.connection = connection
+        self.name = name
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            self.connection.send((self.name, text))
+        return len(text)
+
+
+class Daemon:
+    """
+    _The resident runtime, see the module summary._
+    """
+
+    def __init__(self, address: Union[str, tuple] = None, key: bytes = None, preload: list = PRELOAD):
+        """
+        Args:
+            address (Union[str, tuple], optional): _pipe name or (host, port)_. Defaults to ADDRESS.
+            key (bytes, optional): _authentication key_. Defaults to authkey().
+            preload (list, optional): _modules imported at start_. Defaults to PRELOAD.
+        """
+
+        self.listener = Listener(address or ADDRESS, authkey=key or authkey())
+        self.address = self.listener.address
+        self.processes = dict() # {(module, class, username): Process}
+        self.modules = dict() # {package: {module: (file, modification time)}}
+        self.preloaded = self.preload(preload)
+        self.jobs = 0
+        self.running = False
+
+    def preload(self, names: list) -> dict:
+        """_Imports modules ahead of the first job._
+
+        Args:
+            names (list): _module names_
+
+        Returns:
+            dict: _{name: seconds}, of the modules imported_
+        """
+
+        imported = dict()
+        for name in names:
+            start = perf_counter()
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                continue
+            imported[name] = perf_counter() - start
+        return imported
+
+    def serve_forever(self):
+        """
+        _Serves connections, one job at a time, until a stop command._
+        """
+
+        self.running = True
+        print(f"Process daemon listening on {self.address}")
+        try:
+            while self.running:
+                try:
+                    connection = _nodelay(self.listener.accept(), self.address)
+                except (OSError, EOFError, AuthenticationError) as e:
+                    # [NOTE] e.g. a client with the wrong key.
+                    print(f"Connection refused: {e!r}")
+                    continue
+                with connection:
+                    try:
+                        self.handle(connection, connection.recv())
+                    except (OSError, EOFError):
+                        pass # [NOTE] The client left before the job ended.
+        finally:
+            self.listener.close()
+
+    def handle(self, connection: Any, request: dict):
+        """_Runs one request, sending its output then ("result", value) or
+            ("error", (exception, traceback))._
+
+        Args:
+            connection (Any): _multiprocessing Connection_
+            request (dict): _job or command, see submit and command_
+        """
+
+        command = request.get("command")
+        if command == "ping":
+            return connection.send(("result", self.status()))
+        if command == "close":
+            closed = [key[0] for key in self.processes]
+            self.evict(lambda key: True)
+            return connection.send(("result", closed))
+        if command == "stop":
+            self.running = False
+            return connection.send(("result", True))
+
+        self.jobs += 1
+        stdout, stderr = _Stream(connection, "stdout"), _Stream(connection, "stderr")
+        batch = Batch.from_json(request.get("answers") or list())
+        try:
+            with redirect_stdout(stdout), redirect_stderr(stderr), batch:
+                process = self.process(request["process"], request.get("credentials"))
+                if not request["call"] in CALLS:
+                    raise ValueError(f"call must be one of {CALLS}, not {request['call']!r}")
+                result = getattr(process, request["call"])(*request.get("args", ()), **request.get("kwargs", {}))
+        except Exception as e:
+            connection.send(("error", (_picklable(e), "".join(traceback.format_exception(e)))))
+        else:
+            connection.send(("result", _picklable(result)))
+
+    def process(self, spec: str, credentials: tuple = None) -> Any:
+        """_The cached Process of a "package.module:Class" spec, built on
+            first use and again once a module file of its package changed._
+
+        Args:
+            spec (str): _"package.module:Class", the class defaults to Process_
+            credentials (tuple, optional): _(username, password)_. Defaults to None.
+
+        Returns:
+            Any: _Process instance_
+        """
+
+        name, _, classname = spec.partition(":")
+        classname = classname or "Process"
+        username, password = credentials or (None, None)
+
+        package = name.partition(".")[0]
+        if package in self.modules and self._modified(self.modules[package]):
+            self.evict(lambda key: key[0].partition(".")[0] == package)
+            # [NOTE] Dropped rather than reloaded one by one, importing the
+            #  package again runs its modules in their import order.
+            for moduleName in [m for m in sys.modules if m == package or m.startswith(package + ".")]:
+                del sys.modules[moduleName]
+            importlib.invalidate_caches()
+        module = importlib.import_module(name)
+        self.modules[package] = self._files(package)
+
+        key = (name, classname, username)
+        if not key in self.processes:
+            self.processes[key] = getattr(module, classname)(username, password)
+        return self.processes[key]
+
+    def _files(self, package: str) -> dict:
+        """_{module: (file, modification time)} of the modules of the package imported so far._"""
+
+        files = dict()
+        for moduleName, module in list(sys.modules.items()):
+            if moduleName == package or moduleName.startswith(package + "."):
+                path = getattr(module, "__file__", None)
+                files[moduleName] = (path, os.stat(path).st_mtime_ns if path and os.path.exists(path) else None)
+        return files
+
+    def _modified(self, files: dict) -> bool:
+        for path, modified in files.values():
+            if path and (os.stat(path).st_mtime_ns if os.path.exists(path) else None) != modified:
+                return True
+        return False
+
+    def evict(self, which: Callable):
+        """_Closes the cached Processes whose key is selected, then drops them.
+            A Process failing to close is printed and dropped all the same._
+
+        Args:
+            which (Callable): _takes a (module, class, username) key, True to evict_
+        """
+
+        for key in [key for key in self.processes if which(key)]:
+            process = self.processes.pop(key)
+            try:
+                process.close()
+            except Exception as e:
+                traceback.print_exception(e)
+
+    def status(self) -> dict:
+        return {"pid": os.getpid(), "jobs": self.jobs, "processes": [":".join(k[:2]) for k in self.processes],
+                "preloaded": list(self.preloaded)}
+
+
+def _connect(address: Union[str, tuple], key: bytes) -> Any:
+    address = address or ADDRESS
+    try:
+        return _nodelay(Client(address, authkey=key or authkey()), address)
+    except (OSError, EOFError, AuthenticationError) as e:
+        raise DaemonUnavailable(f"{address}: {e!r}") from None
+
+
+def _request(request: dict, address: Union[str, tuple], key: bytes, stdout: Any, stderr: Any) -> Any:
+    with _connect(address, key) as connection:
+        connection.send(request)
+        while True:
+            kind, payload = connection.recv()
+            if kind == "stdout":
+                (stdout or sys.stdout).write(payload)
+            elif kind == "stderr":
+                (stderr or sys.stderr).write(payload)
+            elif kind == "error":
+                exception, text = payload
+                raise JobFailed(text) from (exception if isinstance(exception, BaseException) else None)
+            else:
+                return payload
+
+
+def submit(process: str, call: str = "main", args: Union[list, tuple] = (), kwargs: dict = None,
+           answers: Union[list, dict] = None, credentials: tuple = None, address: Union[str, tuple] = None,
+           key: bytes = None, stdout: Any = None, stderr: Any = None) -> Any:
+    """_Runs a job in the daemon, printing its output as it comes._
+
+    Args:
+        process (str): _"package.module:Class", the class defaults to Process_
+        call (str, optional): _dataIn, dataOut or main_. Defaults to "main".
+        args (Union[list, tuple], optional): _positional arguments of the call_. Defaults to ().
+        kwargs (dict, optional): _keyword arguments of the call_. Defaults to None.
+        answers (Union[list, dict], optional): _batch answers, see process.batch_. Defaults to the environment's.
+        credentials (tuple, optional): _(username, password) of the Process_. Defaults to None.
+        address (Union[str, tuple], optional): _daemon address_. Defaults to ADDRESS.
+        key (bytes, optional): _authentication key_. Defaults to authkey().
+        stdout (Any, optional): _receives the job's stdout_. Defaults to sys.stdout.
+        stderr (Any, optional): _receives the job's stderr_. Defaults to sys.stderr.
+
+    Raises:
+        DaemonUnavailable: _no daemon is listening, the job can be run locally_
+        JobFailed: _the job raised_
+
+    Returns:
+        Any: _what the call returned_
+    """
+
+    if answers is None:
+        batch = Batch.from_environment()
+        answers = dict(batch.keyed, answers=batch.answers) if batch is not None else list()
+    request = {"process": process, "call": call, "args": list(args), "kwargs": kwargs or dict(),
+               "answers": answers, "credentials": credentials}
+    return _request(request, address, key, stdout, stderr)
+
+
+def command(name: str, address: Union[str, tuple] = None, key: bytes = None) -> Any:
+    """_Sends a command: ping (the daemon's status), close (drops the cached
+        processes) or stop._
+
+    Args:
+        name (str): _ping, close or stop_
+        address (Union[str, tuple], optional): _daemon address_. Defaults to ADDRESS.
+        key (bytes, optional): _authentication key_. Defaults to authkey().
+
+    Raises:
+        DaemonUnavailable: _no daemon is listening_
+
+    Returns:
+        Any: _the command's result_
+    """
+
+    return _request({"command": name}, address, key, None, None)
+
+
+if __name__ == "__main__":
+
+    Daemon().serve_forever()
@@ -0,0 +1,90 @@
+import sys
+from importlib import import_module
+from typing import Any
+
+
+"""[Lazy Summary]
+    Deferred imports, so that importing process only costs what is used.
+
+    Packages re-export their classes through exports, a module __getattr__
+    (PEP 562) importing the submodule defining a name the first time the
+    name is looked up. The value is then stored on the package, and later
+    lookups are plain attribute reads:
+
+    ```python
+    __getattr__, __dir__ = exports(__name__, {"Excel": ".desktop.excel"})
+    ```
+
+    Modules using a heavy dependency throughout hold it as a LazyModule,
+    imported on the first attribute read:
+
+    ```python
+    pd = lazy("pandas")
+    df = pd.DataFrame()  # pandas is imported here
+    ```
+"""
+
+
+class LazyModule:
+    """
+    _Stands in for a module until one of its attributes is read._
+    """
+
+    def __init__(self, name: str, package: str = None):
+        """
+        Args:
+            name (str): _module name, relative names need package_
+            package (str, optional): _anchor of a relative name, __package___. Defaults to None.
+        """
+
+        self.__name = name
+        self.__package = package
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name!r}>"
+
+    def __getattr__(self, attr: str) -> Any:
+        module = import_module(self.__name, self.__package)
+        # [NOTE] The attributes are copied over, later reads skip __getattr__.
+        self.__dict__.update(vars(module))
+        return getattr(module, attr)
+
+
+def lazy(name: str, package: str = None) -> LazyModule:
+    """_Returns a module imported on its first attribute read._
+
+    Args:
+        name (str): _module name, relative names need package_
+        package (str, optional): _anchor of a relative name, __package___. Defaults to None.
+
+    Returns:
+        LazyModule: _stand in for the module_
+    """
+
+    return LazyModule(name, package)
+
+
+def exports(name: str, names: dict) -> tuple:
+    """_Builds the __getattr__ and __dir__ of a package re-exporting names
+        from its submodules, each imported on the first lookup of a name._
+
+    Args:
+        name (str): ___name__ of the package_
+        names (dict): _{name: relative submodule}_
+
+    Returns:
+        tuple: _(__getattr__, __dir__)_
+    """
+
+    def __getattr__(attr: str) -> Any:
+        if not attr in names:
+            raise AttributeError(f"module {name!r} has no attribute {attr!r}")
+        module = sys.modules[name]
+        value = getattr(import_module(names[attr], module.__package__), attr)
+        setattr(module, attr, value)
+        return value
+
+    def __dir__() -> list:
+        return sorted(set(vars(sys.modules[name])) | set(names))
+
+    return __getattr__, __dir__
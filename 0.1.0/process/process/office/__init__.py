@@ -1,8 +1,13 @@
-from .o365.sharepoint import SharePoint
+from ..lazy import exports
 
-#from .desktop.access import Access
-from .desktop.word import Word
-from .desktop.excel import Excel
-from .desktop.outlook import Outlook
-from .desktop.filemanager import FileManager
-Access = lambda: print("This feature is not yet avaiable.")
\ No newline at end of file
+
+# [NOTE] Each class is imported from its module on first use, e.g. SharePoint
+#  loads office365 while Word only loads win32com.
+__getattr__, __dir__ = exports(__name__, {
+    "SharePoint": ".o365.sharepoint",
+    #"Access": ".desktop.access",
+    "Word": ".desktop.word",
+    "Excel": ".desktop.excel",
+    "Outlook": ".desktop.outlook",
+    "FileManager": ".desktop.filemanager"})
+Access = lambda: print("This feature is not yet avaiable.")
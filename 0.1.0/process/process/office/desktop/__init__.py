@@ -1,11 +1,19 @@
 import inspect
-from .word import Word
-from .excel import Excel
-from .access import Access
-from .outlook import Outlook
-from .shared import (Console, 
-    Table,FileManager,Notify,
-    WindowManager,Browser)
 
+from ...lazy import exports
 
-def GetMembers(obj): return [m[0] for m in inspect.getmembers(obj) if m[0][0] != "_"]
\ No newline at end of file
+
+__getattr__, __dir__ = exports(__name__, {
+    "Word": ".word",
+    "Excel": ".excel",
+    "Access": ".access",
+    "Outlook": ".outlook",
+    "Console": ".shared",
+    "Table": ".shared",
+    "FileManager": ".shared",
+    "Notify": ".shared",
+    "WindowManager": ".shared",
+    "Browser": ".shared"})
+
+
+def GetMembers(obj): return [m[0] for m in inspect.getmembers(obj) if m[0][0] != "_"]
@@ -9,6 +9,11 @@ from threading import Thread
 import msoffcrypto
 import pandas as pd
 
+from ...table import export
+from ...table.store import FrameStore
+from ...table.compact import compact as compact_dtypes
+from ...table.chunked import read_xlsx_chunks
+
 
 class FailedToDecrypt(Exception):
     pass
@@ -25,7 +30,8 @@ class Excel:
     """
 
     def __init__(self):
-        self._df = pd.DataFrame()
+        self.store = FrameStore()
+        self.compaction = None # report of the last dtype compaction
         self.thread = None
     
     def __del__(self):
@@ -44,14 +50,14 @@ class Excel:
 
     @property
     def df(self):
-        # [NOTE] DataFrames, even dataframe splices
-        # should be copied for table operations
-        # then reassigned after operation.
-        return self._df.copy()
+        # [NOTE] Reads are shared views of self.store, table operations
+        # return new dataframes which are then reassigned. Writes into
+        # existing cells must go through self.store.edit().
+        return self.store.read()
 
     @df.setter
     def df(self, value: pd.DataFrame):
-        self._df = value
+        self.store.commit(value)
 
     @property
     def app(self):
@@ -75,13 +81,18 @@ class Excel:
 
     def _get_local__as_dataframe(self, path: Union[str, Path] = None,
                                     sheetNameOrNum: Union[str, int] = 0,
-                                    password: str = None) -> pd.DataFrame:
-        """_Returns a data frame from the requested source._
+                                    password: str = None, compact: bool = True,
+                                    arrow: bool = False, **read) -> pd.DataFrame:
+        """_Returns a data frame from the requested source. Additional keywords
+            (usecols, skiprows, nrows) are passed to the pandas reader, which lets
+            Table.lazy pipelines push their column and row selections down._
 
         Args:
             path (Union[str, Path]): _description_
             sheetNameOrNum (Union[str, int], optional): _description_. Defaults to 0.
             password (str, optional): _description_. Defaults to None.
+            compact (bool, optional): _compact the dtypes, see process.table.compact_. Defaults to True.
+            arrow (bool, optional): _Arrow-backed strings for compacted text columns_. Defaults to False.
 
         Raises:
             FileNotFoundError: _as named_
@@ -90,6 +101,15 @@ class Excel:
             pandas.DataFrame: _pd.DataFrame_
         """
 
+        df = self._read_local(path, sheetNameOrNum, password, **read)
+        if compact and isinstance(df, pd.DataFrame):
+            df, self.compaction = compact_dtypes(df, arrow=arrow)
+        return df
+
+    def _read_local(self, path: Union[str, Path] = None,
+                    sheetNameOrNum: Union[str, int] = 0,
+                    password: str = None, **read) -> pd.DataFrame:
+        # Reads the file as the pandas reader returns it, see _get_local__as_dataframe.
         path = Path(path)
         if not path.exists():
             raise FileNotFoundError
@@ -97,9 +117,9 @@ class Excel:
         try:
             if not path: return pd.read_clipboard()
             
-            if path.suffix == ".csv": return pd.read_csv(path)
+            if path.suffix == ".csv": return pd.read_csv(path, **read)
             
-            if path.suffix == ".pkl": return pd.read_pickle(path)
+            if path.suffix == ".pkl": return self._read_pickle(path, **read)
             
             if path.suffix in [".xlsx", ".xls", ".xlsm"]:
             
@@ -109,10 +129,16 @@ class Excel:
                         contents = msoffcrypto.OfficeFile(f)
                         contents.load_key(password=password)
                         contents.decrypt(iobuffer)
-                    return pd.read_excel(iobuffer)
+                    if "chunksize" in read:
+                        return read_xlsx_chunks(iobuffer, **read)
+                    return pd.read_excel(iobuffer, **read)
             
+                elif "chunksize" in read:
+                    # [NOTE] read_excel has no chunksize, rows are streamed with openpyxl.
+                    return read_xlsx_chunks(path, sheetNameOrNum, **read)
+
                 else:
-                    return pd.read_excel(path, sheet_name=sheetNameOrNum)
+                    return pd.read_excel(path, sheet_name=sheetNameOrNum, **read)
             
             else:
                 print("Unknown file type.")
@@ -121,6 +147,18 @@ class Excel:
             traceback.print_exception(e)
             print("Failed to read file.")
 
+    def _read_pickle(self, path: Path, usecols: list=None,
+                     skiprows: Union[int, range]=None, nrows: int=None) -> pd.DataFrame:
+        # [NOTE] read_pickle has no reader options, they are applied after load.
+        df = pd.read_pickle(path)
+        if usecols is not None:
+            df = df[[c for c in df.columns if c in usecols]]
+        if skiprows is not None:
+            df = df.iloc[skiprows if type(skiprows) == int else len(skiprows):]
+        if nrows is not None:
+            df = df.iloc[:nrows]
+        return df
+
     def _load_dataframe(self, path: Union[str,Path], df: pd.DataFrame,
                         sheet: Union[str, int]=None, delete_if_existing: bool=False):
         """_Loads a pandas dataframe into an Excel Worksheet._
@@ -148,26 +186,65 @@ class Excel:
             print("A sheet name or index is required to add a DataFrame to a Workbook.")
             return
 
-        if not path.exists():
+        existing = path.exists()
+        if existing:
+            workbook = self.app.Workbooks.Open(str(path))
+        else:
             workbook = self.app.Workbooks.Add()
             sheet = 1 # [NOTE] sheet index starts at 1
 
-        workbook = self.app.Workbooks.Open(str(path))
         shtNames = [wksht.Name for wksht in workbook.Worksheets]
         shtNameExists = False
         if type(sheet) == int:
-            # [NOTE] + 2: sheet index starts at 1, then after the last.
-            if sheet != len(shtNames) + 2: shtNameExists = True
+            # [NOTE] sheet index starts at 1, anything past the last is added.
+            if sheet <= len(shtNames): shtNameExists = True
         else:
             if sheet in shtNames: shtNameExists = True
-        
-        if (shtNameExists and delete_if_existing) or not shtNameExists: 
-                df.to_excel(self.app, sheet_name=sheet)
+
+        if shtNameExists and not existing:
+            # [NOTE] The blank sheet of a new workbook is always written to.
+            self._write_worksheet(workbook.Worksheets(sheet), df)
+        elif shtNameExists and delete_if_existing:
+            worksheet = workbook.Worksheets(sheet)
+            worksheet.Cells.Clear()
+            self._write_worksheet(worksheet, df)
+        elif not shtNameExists:
+            worksheet = workbook.Worksheets.Add(After=workbook.Worksheets(len(shtNames)))
+            if type(sheet) == str:
+                worksheet.Name = sheet
+            self._write_worksheet(worksheet, df)
         else:
             print("Nothing done. Worksheet already exists.")
-        
-        workbook.Save()
+
+        if existing:
+            workbook.Save()
+        else:
+            workbook.SaveAs(str(path))
         workbook.Close()
+
+    def _write_worksheet(self, worksheet, df: pd.DataFrame, chunksize: int=export.CHUNKSIZE):
+        """_Writes the headers and rows of df onto a worksheet, starting at A1.
+            Rows are streamed from the DataFrame chunksize rows at a time, each
+            chunk is written with a single Range assignment._
+
+        Args:
+            worksheet (_Worksheet_): _win32com Worksheet obj_
+            df (pd.DataFrame): _pandas.DataFrame_
+            chunksize (int, optional): _rows per Range assignment_. Defaults to export.CHUNKSIZE.
+        """
+
+        numCols = len(df.columns)
+        if not numCols:
+            return
+
+        cells = worksheet.Cells
+        worksheet.Range(cells(1, 1), cells(1, numCols)).Value = [[str(c) for c in df.columns]]
+
+        row = 2 # [NOTE] Row 1 holds the headers.
+        # [NOTE] None is written to COM as an empty cell, NaN is not.
+        for chunk in export.iter_matrix(df, chunksize, na_value=None):
+            worksheet.Range(cells(row, 1), cells(row + len(chunk) - 1, numCols)).Value = chunk
+            row += len(chunk)
     
     def _open_encrypted(self, strpath, undatelinks, readonly, password):
         """_Directs Excel to open a encrypted Workbook and return the opened
@@ -282,13 +359,16 @@ class Excel:
 
     def get_local_xlsx_as_dataframe(self, path: Union[str, Path] = None,
                                     sheetNameOrNum: Union[str, int] = 0,
-                                    password: str = None) -> pd.DataFrame:
+                                    password: str = None, compact: bool = True,
+                                    arrow: bool = False, **read) -> pd.DataFrame:
         """_Returns a data frame from the requested source._
 
         Args:
             path (Union[str, Path]): _description_
             sheetNameOrNum (Union[str, int], optional): _description_. Defaults to 0.
             password (str, optional): _description_. Defaults to None.
+            compact (bool, optional): _compact the dtypes, the report is kept in self.compaction_. Defaults to True.
+            arrow (bool, optional): _Arrow-backed strings for compacted text columns_. Defaults to False.
 
         Raises:
             FileNotFoundError: _as named_
@@ -297,17 +377,20 @@ class Excel:
             pandas.DataFrame: _pd.DataFrame_
         """
         
-        return self._get_local__as_dataframe(path, sheetNameOrNum, password)
+        return self._get_local__as_dataframe(path, sheetNameOrNum, password, compact, arrow, **read)
 
     def get_local_csv_as_dataframe(self, path: Union[str, Path] = None,
                                     sheetNameOrNum: Union[str, int] = 0,
-                                    password: str = None) -> pd.DataFrame:
+                                    password: str = None, compact: bool = True,
+                                    arrow: bool = False, **read) -> pd.DataFrame:
         """_Returns a data frame from the requested source._
 
         Args:
             path (Union[str, Path]): _description_
             sheetNameOrNum (Union[str, int], optional): _description_. Defaults to 0.
             password (str, optional): _description_. Defaults to None.
+            compact (bool, optional): _compact the dtypes, the report is kept in self.compaction_. Defaults to True.
+            arrow (bool, optional): _Arrow-backed strings for compacted text columns_. Defaults to False.
 
         Raises:
             FileNotFoundError: _as named_
@@ -316,17 +399,20 @@ class Excel:
             pandas.DataFrame: _pd.DataFrame_
         """
         
-        return self._get_local__as_dataframe(path, sheetNameOrNum, password)
+        return self._get_local__as_dataframe(path, sheetNameOrNum, password, compact, arrow, **read)
     
     def get_local_pkl_as_dataframe(self, path: Union[str, Path] = None,
                                     sheetNameOrNum: Union[str, int] = 0,
-                                    password: str = None) -> pd.DataFrame:
+                                    password: str = None, compact: bool = False,
+                                    arrow: bool = False, **read) -> pd.DataFrame:
         """_Returns a data frame from the requested source._
 
         Args:
             path (Union[str, Path]): _description_
             sheetNameOrNum (Union[str, int], optional): _description_. Defaults to 0.
             password (str, optional): _description_. Defaults to None.
+            compact (bool, optional): _compact the dtypes, the report is kept in self.compaction_. Defaults to False.
+            arrow (bool, optional): _Arrow-backed strings for compacted text columns_. Defaults to False.
 
         Raises:
             FileNotFoundError: _as named_
@@ -335,7 +421,7 @@ class Excel:
             pandas.DataFrame: _pd.DataFrame_
         """
         
-        return self._get_local__as_dataframe(path, sheetNameOrNum, password)
+        return self._get_local__as_dataframe(path, sheetNameOrNum, password, compact, arrow, **read)
 
     def load_dataframe_into_worksheet(self, path: Union[str,Path], sheet_name: str,
                                       df: pd.DataFrame=None, delete_if_existing: bool=False):
@@ -348,7 +434,8 @@ class Excel:
             delete_if_existing (bool, optional): _overwrite the worksheet if existing_. Defaults to False.
         """
 
-        self._load_dataframe(path, sheet_name, df, delete_if_existing)
+        df = self.df if df is None else df
+        self._load_dataframe(path, df, sheet_name, delete_if_existing)
 
     def load_dataframe_into_csv(self, path: Union[str,Path], df: pd.DataFrame=None,
                                 delete_if_existing: bool=False):
@@ -362,7 +449,8 @@ class Excel:
         """
 
         __sheet_name = 1
-        self._load_dataframe(path, __sheet_name, df, delete_if_existing)
+        df = self.df if df is None else df
+        self._load_dataframe(path, df, __sheet_name, delete_if_existing)
 
     def exec_macro(self, path: Union[str,Path], module:str, macro: str,
                   readonly: bool = True, password: str = None):
@@ -1,5 +1,6 @@
 import os
 import traceback
+import tempfile
 from time import sleep
 from io import BytesIO
 from pathlib import Path
@@ -15,6 +16,9 @@ from office365.sharepoint import folders, files
 from office365.sharepoint.folders import folder
 from office365.sharepoint.files import file
 
+from ...table.compact import compact as compact_dtypes
+from ...table.chunked import read_xlsx_chunks
+
 
 """[o365 Summary] 
     A minimal wrapper around pyOffice365RestApiClient.
@@ -270,6 +274,7 @@ class SharePoint(Api):
         """
 
         super().__init__(username, password)
+        self.compaction = None # report of the last dtype compaction
 
     def __create_local_download_folder(self, folderName: str, parentFolder: Union[str, Path]=None) -> Path:
         """_Hidden, creates a local folder for download to avoid downstream conflicts._
@@ -353,16 +358,31 @@ class SharePoint(Api):
             return path
 
     def __doc__2dataframe(self, urlPathlist: Union[str, list],
-                          sheet_name: str=None, sheet_number: int=None) -> pd.DataFrame:
+                          sheet_name: str=None, sheet_number: int=None,
+                          compact: bool=True, arrow: bool=False, **read) -> pd.DataFrame:
         # Streams a Excel file stored in SharePoint directly into a pandas.DataFrame.
         # Args:
         #    urlPathlist (Union[str, list]): _description_
         #    sheet_name (str, optional): _description_. Defaults to None.
         #    sheet_number (int, optional): _description_. Defaults to None.
+        #    compact (bool, optional): _compact the dtypes, the report is kept in self.compaction_. Defaults to True.
+        #    arrow (bool, optional): _Arrow-backed strings for compacted text columns_. Defaults to False.
+        #    **read: _pandas reader options (usecols, skiprows, nrows)_
         # Returns:
         #    pd.DataFrame: _description
+        df = self.__read_doc(urlPathlist, sheet_name, sheet_number, **read)
+        if compact and isinstance(df, pd.DataFrame):
+            df, self.compaction = compact_dtypes(df, arrow=arrow)
+        return df
+
+    def __read_doc(self, urlPathlist: Union[str, list],
+                   sheet_name: str=None, sheet_number: int=None, **read) -> pd.DataFrame:
+        if "chunksize" in read:
+            return self.__read_doc_chunks(urlPathlist, sheet_name, sheet_number, **read)
+
         xfile, iobuff = self.doc_file(urlPathlist), BytesIO()
         xfile.download(iobuff).execute_query()
+        iobuff.seek(0)
         
         if sheet_number:
             sheet_name = sheet_number # doesn't take into account conflicts    
@@ -371,15 +391,34 @@ class SharePoint(Api):
             sheet_name = 0
         
         try:
-            return pd.read_excel(iobuff, sheet_name=sheet_name)
+            return pd.read_excel(iobuff, sheet_name=sheet_name, **read)
         
         except:
 
             try:
-                return pd.read_csv(iobuff)
+                iobuff.seek(0)
+                return pd.read_csv(iobuff, **read)
             
             except:
                 print("File Types: csv, xls, xlsx, xlsm, xlsb, odf, ods and odt")
+
+    def __read_doc_chunks(self, urlPathlist: Union[str, list],
+                          sheet_name: str=None, sheet_number: int=None, **read):
+        # Downloads the file to %TEMP% rather than memory and yields it in chunks,
+        # see process.table.chunked. The file is deleted once read.
+        xfile = self.doc_file(urlPathlist)
+        suffix = Path(xfile.name).suffix.lower()
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                xfile.download(f).execute_query()
+            if suffix in [".xlsx", ".xlsm"]:
+                yield from read_xlsx_chunks(path, sheet_number or 0, **read)
+            else:
+                with pd.read_csv(path, **read) as chunks:
+                    yield from chunks
+        finally:
+            os.remove(path)
     
     def doc_folder_upload(self, urlPathlist: Union[str, list], localPath: Union[str, Path]):
         """_summary_
@@ -707,11 +746,13 @@ class SharePoint(Api):
         xfile = self.ctx.web.get_file_by_server_relative_path(relPath)
         return xfile.get().execute_query()
 
-    def doc_csv2dataframe(self, urlPathlist: Union[str, list]) -> pd.DataFrame:
-        return self.__doc__2dataframe(self, urlPathlist)
+    def doc_csv2dataframe(self, urlPathlist: Union[str, list], compact: bool=True,
+                          arrow: bool=False, **read) -> pd.DataFrame:
+        return self.__doc__2dataframe(urlPathlist, compact=compact, arrow=arrow, **read)
 
-    def doc_xlsx2dataframe(self, urlPathlist: Union[str, list]) -> pd.DataFrame:
-        return self.__doc__2dataframe(self, urlPathlist)
+    def doc_xlsx2dataframe(self, urlPathlist: Union[str, list], compact: bool=True,
+                           arrow: bool=False, **read) -> pd.DataFrame:
+        return self.__doc__2dataframe(urlPathlist, compact=compact, arrow=arrow, **read)
 
     def doc_encrypted_xlsx2dataframe(self, urlPathlist: Union[str, list], password: str) -> pd.DataFrame:
         """_Streams a encrypted Excel file stored in SharePoint directly into a pandas.DataFrame.
@@ -0,0 +1,147 @@
+import traceback
+from time import perf_counter
+from typing import Any, Callable
+
+
+"""[Services Summary]
+    Process attributes constructed on first use instead of in __init__.
+
+    A Service is declared on the class with a factory taking the process:
+
+    ```python
+    class Process(ABC):
+        excel = Service(lambda process: office.Excel())
+    ```
+
+    The first read of process.excel calls the factory, times it and stores
+    the result on the instance under the same name, where later reads find
+    it without going through the descriptor. A process that only uses Excel
+    never authenticates to SharePoint or dispatches Outlook.
+
+    warmup builds services ahead of use, close drops the built ones so that
+    they are released (their finalizers quit the Office applications) and
+    rebuilt if used again, and timings holds the seconds each construction
+    took.
+"""
+
+
+class UnknownService(Exception):
+    """
+    _The name is not a service of the process._
+    """
+    pass
+
+
+class Service:
+    """
+    _A lazily constructed, cached attribute, see the module summary._
+    """
+
+    def __init__(self, factory: Callable):
+        """
+        Args:
+            factory (Callable): _takes the process, returns the service_
+        """
+
+        self.factory = factory
+        self.name = None
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Service({self.name!r})"
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        if instance is None:
+            return self
+        start = perf_counter()
+        value = self.factory(instance)
+        # [NOTE] A non-data descriptor, the instance attribute now shadows it.
+        instance.__dict__[self.name] = value
+        timings(instance)[self.name] = perf_counter() - start
+        return value
+
+
+def services(cls: type) -> dict:
+    """_Services of a class and its bases, in declaration order._
+
+    Args:
+        cls (type): _class declaring services_
+
+    Returns:
+        dict: _{name: Service}_
+    """
+
+    found = dict()
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, Service):
+                found[name] = value
+    return found
+
+
+def timings(instance: Any) -> dict:
+    """_Seconds taken by the construction of each service built, in order._
+
+    Args:
+        instance (Any): _process_
+
+    Returns:
+        dict: _{name: seconds}_
+    """
+
+    return instance.__dict__.setdefault("_timings", dict())
+
+
+def _names(instance: Any, names: tuple) -> list:
+    declared = services(type(instance))
+    unknown = [name for name in names if not name in declared]
+    if unknown:
+        raise UnknownService(", ".join(unknown))
+    return list(names or declared)
+
+
+def warmup(instance: Any, names: tuple = ()) -> dict:
+    """_Builds services ahead of use. A service failing to build is printed
+        and left to be built on first use._
+
+    Args:
+        instance (Any): _process_
+        names (tuple, optional): _services to build_. Defaults to every service.
+
+    Raises:
+        UnknownService: _a name is not a service of the process_
+
+    Returns:
+        dict: _{name: seconds}, of every service built so far_
+    """
+
+    for name in _names(instance, names):
+        if not name in instance.__dict__:
+            try:
+                getattr(instance, name)
+            except Exception as e:
+                traceback.print_exception(e)
+    return dict(timings(instance))
+
+
+def close(instance: Any, names: tuple = ()) -> list:
+    """_Drops built services, which are released once no longer referenced,
+        and rebuilt on their next use._
+
+    Args:
+        instance (Any): _process_
+        names (tuple, optional): _services to close_. Defaults to every service.
+
+    Raises:
+        UnknownService: _a name is not a service of the process_
+
+    Returns:
+        list: _names of the services closed_
+    """
+
+    closed = [name for name in _names(instance, names) if name in instance.__dict__]
+    for name in closed:
+        del instance.__dict__[name]
+    return closed
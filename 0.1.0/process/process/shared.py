@@ -1,28 +1,47 @@
+from __future__ import annotations
+
 import os
 import webbrowser
 from time import sleep
 from pathlib import Path
 from pprint import pprint
 from threading import Thread
-from typing import Union, Any
+from typing import Union, Any, Callable, TYPE_CHECKING
 from urllib.parse import quote_plus
 from datetime import datetime as dt
-from dateutil.parser import parse as dtparse
-
-import win32com
-from ctypes import wintypes, windll, byref
-from win32api import GetModuleHandle, GetSystemMetrics
-from win32gui import (DestroyWindow, Shell_NotifyIcon,
-    UnregisterClass, CreateWindow, WNDCLASS, 
-    RegisterClass, UpdateWindow, LoadImage,
-    NIF_ICON, NIF_MESSAGE, NIM_ADD, NIM_MODIFY,
-    NIF_TIP, NIF_INFO, ShowWindow, SetWindowPos,
-    SendMessage, PostMessage, GetWindowText, 
-    GetForegroundWindow, ShowWindow, 
-    IsWindowVisible, GetWindowRect,
-    FindWindow, EnumWindows)
 
-import pandas as pd
+from .lazy import lazy
+from .batch import Batch
+
+
+# [NOTE] win32, pandas, dateutil and the table engines are imported the
+#  first time a class needing them is used, see process.lazy. Annotations
+#  are not evaluated, pd.DataFrame in a signature costs nothing.
+ctypes = lazy("ctypes")
+wintypes = lazy("ctypes.wintypes")
+win32com = lazy("win32com")
+win32api = lazy("win32api")
+win32gui = lazy("win32gui")
+dtparser = lazy("dateutil.parser")
+pd = lazy("pandas")
+np = lazy("numpy")
+
+masks = lazy(".table.masks", __package__)
+export = lazy(".table.export", __package__)
+select = lazy(".table.select", __package__)
+# [NOTE] The engines re-exported by process.table. Not named table,
+#  columns or index, which are parameter names of the Table functions.
+engines = lazy(".table", __package__)
+
+if TYPE_CHECKING:
+    from .table.builder import TableBuilder
+    from .table.journal import EditJournal
+    from .table.plan import Pipeline
+    from .table.index import KeyIndex
+    from .table.chunked import ChunkedTable
+    from .table.diff import ChangeSet
+    from .table.lookup import LookupResult
+    from .table.rules import Schema, Violations
 
 
 class WindowNotFound(Exception):
@@ -68,11 +87,52 @@ class MismatchRowLengthColNum(Exception):
 
 class Console:
     """
-    _Contains static components for fetching verified inputs from the user._
+    _Contains static components for fetching verified inputs from the user.
+     While a process.batch.Batch is running, the inputs are read from it._
     """
 
     def clear():
-        os.system("cls || clear")
+        if Batch.running() is None:
+            os.system("cls || clear")
+
+    def _input(prompt: str, key: str=None) -> str:
+        """_input(), or the next answer of the running batch._
+
+        Args:
+            prompt (str): _prompt shown to the user_
+            key (str, optional): _batch answer key_. Defaults to the key of the prompt.
+
+        Returns:
+            str: _answer_
+        """
+
+        batch = Batch.running()
+        return input(prompt) if batch is None else batch.answer(prompt, key)
+
+    def batch_mode() -> bool:
+        """
+        _Whether the inputs are read from a running process.batch.Batch._
+        """
+
+        return Batch.running() is not None
+
+    def _reject(msg: str, seconds: float=2):
+        """_Shows why an input was rejected before asking again. A batch
+            answer rejected fails at once, see process.batch._
+
+        Args:
+            msg (str): _message to user_
+            seconds (float, optional): _pause before asking again_. Defaults to 2.
+
+        Raises:
+            InvalidBatchAnswer: _while a batch is running_
+        """
+
+        batch = Batch.running()
+        if batch is not None:
+            batch.reject(msg)
+        print(msg)
+        sleep(seconds)
 
     def print_centered_to_screen(msg: str):
         width = os.get_terminal_size.columns
@@ -94,78 +154,61 @@ class Console:
             
             try:
                 print(f"Options: {filter}")
-                sel = input("Selection?: ")
+                sel = Console._input("Selection?: ", msg)
                 assert sel in filter
                 return sel
             
-            except:
-                print("???\033[0K\r")
+            except (AssertionError, TypeError):
+                Console._reject("???\033[0K\r", 0)
 
 
-    def get_row_selection(filter: list=None):
-        """_Usage includes bulk-fetching row numbers or column names from the user.
+    def get_row_selection(filter: list=None, length: int=None, names: list=None,
+                          base: int=0) -> Union[slice, np.ndarray]:
+        """_Usage includes bulk-fetching row numbers or column names from the user,
+            as a selection expression: #, #-#, #,#,#, open ranges (#-, -#), steps
+            (#-#/#), negation (!#), * and column names with wildcards (Sal*),
+            see process.table.select.
             
             Does not clear the screen._
 
         Args:
-            filter (list, optional): _possible entries to filter the re_. Defaults to [].
+            filter (list, optional): _numbers that may be selected, as displayed_. Defaults to None.
+            length (int, optional): _number of rows or columns_. Defaults to the highest number in filter.
+            names (list, optional): _column names, for name and wildcard terms_. Defaults to None.
+            base (int, optional): _number of the first row or column as displayed_. Defaults to 0.
 
         Returns:
-            _(any || list)_: _the item selected in its original form or a list of the same_
+            Union[slice, np.ndarray]: _positions selected, counted from 0_
         """
 
-        try:
-            assert [int(f) for f in filter]
-        except:
-            print("Only numeric values are allowed in the filters list.")
-            return
+        if filter is not None:
+            try:
+                filter = np.asarray([int(f) for f in filter], dtype=np.int64) - base
+            except:
+                print("Only numeric values are allowed in the filters list.")
+                return
+
+        if length is None:
+            if names is not None:
+                length = len(names)
+            elif filter is not None and len(filter):
+                length = int(filter.max()) + 1
+            else:
+                print("The number of rows or columns is required for a selection.")
+                return
 
         while True:
-            
+            res = Console._input("Selection? [#, #-#, #,#,#, #-#/#, !#, *]: ").strip()
             try:
-            
-                res = input("Selection? [#, #-#, #,#,#]: ").strip()
-            
-                if "-" in res and "," in res:
-                    raise ValueError
-            
-                elif not "-" in res and not "," in res:
-                    if filter and not int(res) in filter:
-                        print("Not among the filter options.")
-                    else:
-                        return int(res)
-                
-                elif "-" in res:
-                    start, end = (res.split("-"))
-                    start, end = start.strip(), end.strip()
-                    rng = list(range(int(start), int(end)+1))
-                    
-                    if filter:
-                        filteredRng = [i for i in rng if not i in filter]
-                    
-                        if len(filteredRng) != len(rng):
-                            print("At least some choices are not among the filter options.")
-                    
-                        else:
-                            return rng
-                
-                elif "," in res:
-                    selections = res.split(",")
-                    selections = [int(i.strip()) for i in selections]
-                    
-                    if filter:
-                    
-                        filteredSelections = [i for i in rng if not i in filter]
-                    
-                        if len(filteredSelections) != len(selections):
-                            print("At least some choices are not among the filter options.")
-                    
-                        else:
-                            return selections
-            
-            except:
-                print("???\033[0K\r")
-                sleep(2)
+                positions = select.Selection(res, base).positions(length, names)
+            except select.InvalidSelection as e:
+                Console._reject(str(e))
+                continue
+
+            if filter is not None and not np.isin(np.arange(length)[positions], filter).all():
+                Console._reject("At least some choices are not among the filter options.")
+                continue
+            return positions
 
     def get_option_selection(msg: str, options: dict,
                              accept_numbers: bool=False,
@@ -199,24 +242,17 @@ class Console:
         
         Console.clear()
         for oKey, o in options.items(): pprint(f"[{oKey}] {o}")
-        retValues = {str(oKey).lower(): o for oKey, o in options}
-        optionKeys = list(options.keys())
+        optionKeys = {str(oKey).lower(): oKey for oKey in options}
         
         while True:
-            res = input(f"{msg} [?]: ").strip().lower()
-            try:
-                if accept_enter and not res:
-                    return res
-                elif accept_numbers and res.isnumeric():
-                    return int(res)
-                elif accept_numbers and not res.isnumeric():
-                    raise ValueError
-                else:
-                    idx = retValues.index(res)
-                    return optionKeys[idx]
-            except:
-                print("???\033[0K\r")
-                sleep(2)
+            res = Console._input(f"{msg} [?]: ").strip().lower()
+            if accept_enter and not res:
+                return res
+            elif accept_numbers and res.isnumeric():
+                return int(res)
+            elif not accept_numbers and res in optionKeys:
+                return optionKeys[res]
+            Console._reject("???\033[0K\r")
 
     def get_datetime(title: str, asDt: bool = True) -> Union[dt, str]:
         """_gets a date and time from the user either as a string or as datetime.datime.
@@ -250,7 +286,7 @@ class Console:
         
         if asDt:
             try:
-                return dtparse(datetime)
+                return dtparser.parse(datetime)
             except:
                 raise DtFrmtStrMistyped 
         else:
@@ -266,13 +302,12 @@ class Console:
         Console.clear()
         while True:
             try:
-                hours = input(f"{msg} [Hour]: ").strip()
-                mins = input(f"{msg} [Minutes]: ").strip()
-                _ = dtparse(f"{dt.today().strftime('%m/%d/%Y')} {hours}:{mins}")
+                hours = Console._input(f"{msg} [Hour]: ", f"{msg} hour").strip()
+                mins = Console._input(f"{msg} [Minutes]: ", f"{msg} minutes").strip()
+                _ = dtparser.parse(f"{dt.today().strftime('%m/%d/%Y')} {hours}:{mins}")
                 return (int(hours), int(mins))
-            except:
-                print("???\033[0K\r") # auto erase flash temp error message
-                sleep(1)
+            except (ValueError, OverflowError):
+                Console._reject("???\033[0K\r", 1) # auto erase flash temp error message
 
     def get_date(msg: str) -> str:
         """
@@ -284,13 +319,12 @@ class Console:
         Console.clear()
         while True:
             try:
-                date = input(f"{msg} [mm/dd/yyyy]: ")
-                date = dtparse(date) # verify that the date is parsable.
+                date = Console._input(f"{msg} [mm/dd/yyyy]: ")
+                date = dtparser.parse(date) # verify that the date is parsable.
                 date = date.strftime("%m/%d/%Y")
                 return date
-            except Exception as e:
-                print("???\033[0K\r")
-                sleep(2)
+            except (ValueError, OverflowError):
+                Console._reject("???\033[0K\r")
 
     def get_yesno(msg: str, default: str="yes") -> str:
         """
@@ -307,7 +341,7 @@ class Console:
         
         msg = f"{msg} [Y/n]: " if default else f"{msg} [y/N]: " 
         
-        res = input(msg).strip()
+        res = Console._input(msg).strip()
         if res and res == "n":
             return "no"
         else:
@@ -325,7 +359,7 @@ class Table(Console):
         _Clears the system prompt._
         """
 
-        os.system('cls||clear')
+        Console.clear()
 
 
     def get_table_row(headers: list):
@@ -342,16 +376,16 @@ class Table(Console):
             Console.clear()
             print(f"Columns: {headers}") # column heading reference for the user
             
-            row = input(f"[, , , <Enter> to Verify]: ").strip().split(",")
+            row = Console._input(f"[, , , <Enter> to Verify]: ", "table row").strip().split(",")
             row = [col.strip() for col in row] # cleanup any extra spaces
             
             if len(headers) != len(row): 
                 # asymmetric matrix
                 msg = "[!] There was a mismatch in the number of columns provided."
-                pprint(msg)
+                Console._reject(msg, 0)
                 res = input("Type '!' for details or just <Enter> to try again: ").strip()
                 if res == "!":
-                    msg = "The number of columns in the printed Columns Headers must match the number " & \
+                    msg = "The number of columns in the printed Columns Headers must match the number " + \
                           "of commas provided, even if some commas are followed by empty place holders: , ,"
                     pprint(msg)
                     _ = input("<Enter> to continue: ")
@@ -359,90 +393,447 @@ class Table(Console):
             else:
                 return row
 
-    def dataframe2matrix(df: pd.DataFrame):
-        """_Converts a dataframe into a nested matrix._
+    def dataframe2matrix(df: pd.DataFrame, chunksize: int=None):
+        """_Converts a dataframe into a nested matrix. The columns are read once,
+            see process.table.export. If chunksize is passed, a generator of
+            chunksize-row matrices is returned instead, for streaming large tables._
 
         Args:
             df (pd.DataFrame): _pandas.DataFrame_
+            chunksize (int, optional): _rows per yielded chunk_. Defaults to None.
 
         Returns:
-            _list_: _converted list_
+            _list_: _converted list, or a generator of lists if chunksize is passed_
         """
 
-        data = list()
-        # [NOTE] pd.DataFrame does not have a to_list option.
-        for idx in df.index:
-            # row and columns have a to_list option.
-            data.append(df.loc[idx].to_list())
-        return data
+        if chunksize:
+            return export.iter_matrix(df, chunksize)
+        return export.to_matrix(df)
 
     def add_column(df: pd.DataFrame, header: Union[str,int],
                    value: Any, colIdx: int=None,
                    after: bool=True, overwrite: bool=False) -> pd.DataFrame:
-        """_Add a column to a dataframe._
+        """_Add a column to a dataframe. Values are aligned to the rows without
+            loops, see process.table.columns: scalars are broadcast, Series are
+            aligned by index, dicts are looked up by index, lists and arrays are
+            taken by position, and callables are passed the dataframe._
 
         Args:
+            df (pd.DataFrame): _pandas.DataFrame_
             header (str): _column header_
-            value (Any): __
-            df (pd.DataFrame): _description_
+            value (Any): _scalar, Series, dict, list, array or callable_
+            colIdx (int, optional): _column index, appended if None_. Defaults to None.
+            after (bool, optional): _insert after the index column_. Defaults to True.
+            overwrite (bool, optional): _overwrite an existing column_. Defaults to False.
+
+        Raises:
+            RowCountMismatchValue4Df: _a list or array does not have one value per row_
 
         Returns:
-            pd.DataFrame: _description_
+            pd.DataFrame: _pandas.DataFrame, sharing the buffers of the other columns_
         """
 
         try:
-            if not overwrite and header in df.columns:
-                print("To overwrite an existing column, \
-                      please change the overwrite parameter to True.")
-                return
-
-            if type(value) in [str,int,float]:
-                value = [value] * len(df)
-            elif type(value) == dict():
-                # [NOTE] all components of a dataframe will 
-                # raise an exception if place in a if/and.
-                idx = df.index.to_list()
-                try:
-                    assert list(value.keys()) == idx
-                    value = list(value.values())
-                except:
-                    rearrangedValue = list()
-                    for idx in df.index:
-                        rearrangedValue.append(value[idx])
-                    value = rearrangedValue
-            
-            df[header] = value
-            
-            if colIdx:
-                colIdx = colIdx+1 if after else colIdx    
-                columns = df.columns[:-1]
-                columns = columns[:colIdx]+[header]+columns[colIdx:]
-                df = df[[(columns)]].copy()
-            return df                
-        except:
-            RowCountMismatchValue4Df
+            return engines.add_column(df, header, value, colIdx, after, overwrite)
+        except engines.columns.ColumnLengthMismatch as e:
+            raise RowCountMismatchValue4Df(e)
 
-    def add_row(df: pd.DataFrame, value: list, rowIdx: int=None, after: bool=True) -> pd.DataFrame:
-        """_Add a row into a dataframe._
+    def add_row(df: pd.DataFrame, value: list, rowIdx: int=None, after: bool=True,
+                index: KeyIndex=None) -> pd.DataFrame:
+        """_Add a row into a dataframe. To add many rows, use add_rows or
+            Table.builder, which materialize the dataframe once._
 
         Args:
             df (pd.DataFrame): _pandas.DataFrame_
+            value (list): _one value per column_
             rowIdx (int, optional): _row number for insert_. Defaults to None.
             after (bool, optional): _insert after the row_. Defaults to True.
+            index (KeyIndex, optional): _key index kept in sync with the result_. Defaults to None.
 
         Returns:
             pd.DataFrame: _description_
         """
-        dfrow = pd.DataFrame([value], columns=df.columns)
-        if rowIdx:
-            rowIdx = rowIdx + 1 if after else rowIdx
-            if not rowIdx >= len(df):
-                dfs = [df[:rowIdx].copy(), dfrow, df[rowIdx:].copy()]
+
+        return Table.add_rows(df, [value], rowIdx, after, index)
+
+    def add_rows(df: pd.DataFrame, values: list, rowIdx: int=None, after: bool=True,
+                 index: KeyIndex=None) -> pd.DataFrame:
+        """_Add rows into a dataframe with a single concat._
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+            values (list): _[[row], [row], ...]_
+            rowIdx (int, optional): _row number for insert, appended if None_. Defaults to None.
+            after (bool, optional): _insert after the row_. Defaults to True.
+            index (KeyIndex, optional): _key index kept in sync with the result_. Defaults to None.
+
+        Returns:
+            pd.DataFrame: _pandas.DataFrame_
+        """
+
+        if index is not None:
+            # [NOTE] Duplicate keys are rejected before the table is touched.
+            keys = [index.key(value) for value in values]
+            for i, key in enumerate(keys):
+                if key in index or key in keys[:i]:
+                    raise engines.index.DuplicateKey(key)
+
+        rows = Table.builder(df, threshold=len(values)+1)
+        for value in values:
+            if rowIdx is None:
+                rows.append(value)
             else:
-                dfs = [df, dfrow]    
-        else:
-            dfs = [df, dfrow]
-        return pd.concat(dfs)
+                rows.insert(rowIdx, value, after)
+        result = rows.to_dataframe()
+
+        if index is not None:
+            if rowIdx is None:
+                for i, key in enumerate(keys):
+                    index.add(key, len(df) + i)
+            else:
+                # [NOTE] Rows below the insert moved down, renumbered at once.
+                index.rebuild(result)
+        return result
+
+    def index(df: pd.DataFrame, keys: Union[str, int, list]) -> KeyIndex:
+        """_Returns a hash index of the rows of df by key, see process.table.index.
+            Pass it to add_row, replace_row and filter_rows to keep it in sync._
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+            keys (Union[str, int, list]): _key column header, or a list of headers_
+
+        Returns:
+            KeyIndex: _process.table.index.KeyIndex_
+        """
+
+        return engines.KeyIndex(df, keys)
+
+    def upsert(df: pd.DataFrame, index: KeyIndex, values: list) -> pd.DataFrame:
+        """_Replaces the rows whose key is in the index and appends the others.
+            Rows are lists with one value per column. Only the columns set are
+            copied, df itself is left unchanged._
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+            index (KeyIndex): _key index of df_
+            values (list): _a row, or a list of rows_
+
+        Returns:
+            pd.DataFrame: _pandas.DataFrame_
+        """
+
+        if values and not pd.api.types.is_list_like(values[0]):
+            values = [values]
+
+        positions = index.positions([index.key(value) for value in values])
+        existing = positions >= 0
+        if existing.any():
+            replaced = [value for value, e in zip(values, existing) if e]
+            # [NOTE] df may be a view sharing the buffers of a FrameStore.
+            df = df.copy(deep=False)
+            for colIdx, column in enumerate(zip(*replaced)):
+                df.isetitem(colIdx, df.iloc[:, colIdx].copy())
+                engines.assign(df, colIdx, positions[existing], list(column))
+
+        added = [value for value, e in zip(values, existing) if not e]
+        if added:
+            df = Table.add_rows(df, added, index=index)
+        return df
+
+    def update_by_key(df: pd.DataFrame, index: KeyIndex, keys: list,
+                      column: Union[str, int], values: Any) -> pd.DataFrame:
+        """_Sets one column for many keys with a single assignment. Only that
+            column is copied, df itself is left unchanged._
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+            index (KeyIndex): _key index of df_
+            keys (list): _keys of the rows to update_
+            column (Union[str, int]): _column header or number_
+            values (Any): _one value, or one value per key_
+
+        Raises:
+            KeyNotFound: _at least one key is not in the index_
+
+        Returns:
+            pd.DataFrame: _pandas.DataFrame_
+        """
+
+        positions = index.positions(keys)
+        if (positions < 0).any():
+            raise engines.index.KeyNotFound([k for k, p in zip(keys, positions) if p < 0])
+        colIdx = column if type(column) == int and not column in df.columns else df.columns.get_loc(column)
+        # [NOTE] df may be a view sharing the buffers of a FrameStore.
+        df = df.copy(deep=False)
+        df.isetitem(colIdx, df.iloc[:, colIdx].copy())
+        engines.assign(df, colIdx, positions, values)
+        return df
+
+    def builder(df: pd.DataFrame=None, columns: list=None,
+                threshold: int=None) -> TableBuilder:
+        """_Returns a row buffer for df. Rows appended or inserted into the
+            buffer are materialized into a dataframe once, see process.table.builder._
+
+        Args:
+            df (pd.DataFrame, optional): _pandas.DataFrame_. Defaults to None.
+            columns (list, optional): _headers, if df is not passed_. Defaults to None.
+            threshold (int, optional): _buffered rows that trigger materialization_. Defaults to TableBuilder.THRESHOLD.
+
+        Returns:
+            TableBuilder: _process.table.builder.TableBuilder_
+        """
+
+        threshold = engines.TableBuilder.THRESHOLD if threshold is None else threshold
+        return engines.TableBuilder(df, columns, threshold)
+
+    def journal(df: pd.DataFrame, copy: bool=True) -> EditJournal:
+        """_Returns an edit journal over df. Table operations applied through the
+            journal can be undone, redone and replayed onto a fresh base dataframe,
+            at the memory cost of the edits only, see process.table.journal._
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+            copy (bool, optional): _False hands ownership of df to the journal_. Defaults to True.
+
+        Returns:
+            EditJournal: _process.table.journal.EditJournal_
+        """
+
+        return engines.EditJournal(df, copy)
+
+    def lazy(source: Union[pd.DataFrame, Callable], *args, **kwargs) -> Pipeline:
+        """_Returns a lazy pipeline over a dataframe or a reader. Table operations
+            are recorded on the pipeline, optimized, and run once on .collect(),
+            see process.table.plan.
+
+            ```python
+            df = Table.lazy(self.excel.get_local_csv_as_dataframe, path) \
+                      .filter_rows(Where("Status", "==", "Open"), out=False) \
+                      .reorder_columns(["Name", "Status"]) \
+                      .collect()
+            ```_
+
+        Args:
+            source (Union[pd.DataFrame, Callable]): _dataframe, or a reader accepting usecols, skiprows and nrows_
+            *args, **kwargs: _passed to the reader_
+
+        Returns:
+            Pipeline: _process.table.plan.Pipeline_
+        """
+
+        if isinstance(source, pd.DataFrame):
+            return engines.Pipeline(source)
+        return engines.Pipeline.scan(source, *args, **kwargs)
+
+    def chunked(reader: Callable, *args, budget: int=None, chunksize: int=None,
+                **kwargs) -> ChunkedTable:
+        """_Returns a chunked table over a reader, for files larger than memory.
+            Table operations are recorded on it and applied chunk by chunk while
+            the result is streamed into a csv or parquet file, see process.table.chunked.
+
+            ```python
+            stats = Table.chunked(self.excel.get_local_csv_as_dataframe, path) \
+                         .filter_rows(Where("Status", "==", "Open"), out=False) \
+                         .reorder_columns(["Name", "Status"]) \
+                         .to_csv(output)
+            ```_
+
+        Args:
+            reader (Callable): _reader accepting chunksize and returning an iterable of dataframes_
+            budget (int, optional): _bytes a chunk may use while processed_. Defaults to BUDGET.
+            chunksize (int, optional): _rows per chunk, derived from budget if None_. Defaults to None.
+            *args, **kwargs: _passed to the reader_
+
+        Returns:
+            ChunkedTable: _process.table.chunked.ChunkedTable_
+        """
+
+        budget = engines.chunked.BUDGET if budget is None else budget
+        return engines.ChunkedTable(reader, *args, budget=budget, chunksize=chunksize, **kwargs)
+
+    def diff(old: pd.DataFrame, new: pd.DataFrame, key: Union[str, int, list]) -> ChangeSet:
+        """_Compares two snapshots of a table by key, e.g. yesterday's and today's
+            copy of a workbook, see process.table.diff._
+
+        Args:
+            old (pd.DataFrame): _previous snapshot_
+            new (pd.DataFrame): _current snapshot_
+            key (Union[str, int, list]): _key column header, or a list of headers_
+
+        Returns:
+            ChangeSet: _inserted and deleted rows, and one row per changed cell_
+        """
+
+        return engines.diff(old, new, key)
+
+    def parallel_apply(df: pd.DataFrame, func: Callable, columns: list=None,
+                       workers: int=None, chunksize: int=None,
+                       threshold: int=None) -> pd.Series:
+        """_Runs a row-wise function on every core. func is called with one value
+            per column and must be defined at module level, see process.table.parallel.
+
+            ```python
+            df = Table.add_column(df, "Name", Table.parallel_apply(df, normalize, ["First", "Last"]))
+            ```_
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+            func (Callable): _module-level function taking one value per column_
+            columns (list, optional): _columns passed to func, in order_. Defaults to every column.
+            workers (int, optional): _worker processes_. Defaults to os.cpu_count().
+            chunksize (int, optional): _rows per chunk_. Defaults to 4 chunks per worker.
+            threshold (int, optional): _fewest rows run in parallel, smaller inputs run serially_. Defaults to THRESHOLD.
+
+        Returns:
+            pd.Series: _one result per row, aligned to df_
+        """
+
+        threshold = engines.parallel.THRESHOLD if threshold is None else threshold
+        return engines.parallel_apply(df, func, columns, workers, chunksize, threshold)
+
+    def lookup(df: pd.DataFrame, table: pd.DataFrame, on: Union[str, list],
+               columns: list=None, key: Union[str, list]=None,
+               mode: str="exact") -> LookupResult:
+        """_VLOOKUP/XLOOKUP of df's on column(s) in the key column(s) of table,
+            with a hash table built once on the keys, see process.table.lookup._
+
+        Args:
+            df (pd.DataFrame): _table holding the lookup values_
+            table (pd.DataFrame): _lookup table_
+            on (Union[str, list]): _column(s) of df holding the lookup values_
+            columns (list, optional): _columns of table to return_. Defaults to every non-key column.
+            key (Union[str, list], optional): _key column(s) of table_. Defaults to on.
+            mode (str, optional): _exact, first, last or approximate_. Defaults to "exact".
+
+        Returns:
+            LookupResult: _.values aligned to df, .unmatched lookup values_
+        """
+
+        return engines.lookup(df, table, on, columns, key, mode)
+
+    def join(df: pd.DataFrame, table: pd.DataFrame, on: Union[str, list],
+             columns: list=None, key: Union[str, list]=None, mode: str="exact",
+             how: str="left") -> pd.DataFrame:
+        """_Appends the columns looked up in table to df, see Table.lookup._
+
+        Args:
+            how (str, optional): _left keeps every row of df, inner only the matched rows_. Defaults to "left".
+
+        Returns:
+            pd.DataFrame: _pandas.DataFrame_
+        """
+
+        return engines.join(df, table, on, columns, key, mode, how)
+
+    def pivot(df: pd.DataFrame, rows: Union[str, list], values: Union[str, list],
+              columns: Union[str, list]=None, agg: Union[str, dict]="sum",
+              subtotals: bool=False, grand_total: bool=True) -> pd.DataFrame:
+        """_Summarizes df as an Excel pivot table in tabular form, with vectorized
+            group-bys. The result has one header row and can be written to a
+            worksheet in one shot, see process.table.pivot._
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+            rows (Union[str, list]): _row fields_
+            values (Union[str, list]): _value fields_
+            columns (Union[str, list], optional): _column fields_. Defaults to None.
+            agg (Union[str, dict], optional): _sum, count, avg or distinct count, or {value field: aggregation}_. Defaults to "sum".
+            subtotals (bool, optional): _subtotal rows after each group of the outer row fields_. Defaults to False.
+            grand_total (bool, optional): _grand total row and column_. Defaults to True.
+
+        Returns:
+            pd.DataFrame: _pandas.DataFrame_
+        """
+
+        return engines.pivot(df, rows, values, columns, agg, subtotals, grand_total)
+
+    def group_by(df: pd.DataFrame, rows: Union[str, list], values: Union[str, list],
+                 agg: Union[str, dict]="sum", subtotals: bool=False,
+                 grand_total: bool=False) -> pd.DataFrame:
+        """_Summarizes df by its row fields, see Table.pivot._
+
+        Returns:
+            pd.DataFrame: _pandas.DataFrame_
+        """
+
+        return engines.group_by(df, rows, values, agg, subtotals, grand_total)
+
+    def fuzzy_match(left: pd.DataFrame, right: pd.DataFrame, on: Union[str, list],
+                    right_on: Union[str, list]=None, threshold: float=0.8,
+                    weights: list=None, block: str=None,
+                    blocking: Union[str, list]=None, best: bool=False,
+                    workers: int=None) -> pd.DataFrame:
+        """_Matches the records of two tables whose names and spellings differ,
+            pruning the pairs compared with soundex and trigram blocking, see
+            process.table.fuzzy._
+
+        Args:
+            left (pd.DataFrame): _pandas.DataFrame_
+            right (pd.DataFrame): _pandas.DataFrame_
+            on (Union[str, list]): _column(s) of left compared_
+            right_on (Union[str, list], optional): _column(s) of right compared, in the same order_. Defaults to on.
+            threshold (float, optional): _lowest score kept, 0 to 1_. Defaults to 0.8.
+            weights (list, optional): _weight of each column_. Defaults to equal weights.
+            block (str, optional): _column of left blocked on_. Defaults to the first column of on.
+            blocking (Union[str, list], optional): _soundex and/or ngram_. Defaults to both.
+            best (bool, optional): _keep only the best match of each left record_. Defaults to False.
+            workers (int, optional): _worker processes_. Defaults to os.cpu_count().
+
+        Returns:
+            pd.DataFrame: _left and right index labels and score_
+        """
+
+        blocking = engines.fuzzy.BLOCKING if blocking is None else blocking
+        return engines.fuzzy_match(left, right, on, right_on, threshold, weights, block,
+                                   blocking, best, workers)
+
+    def normalize_dates(df: pd.DataFrame, columns: Union[str, list], source: str=None,
+                        format: str=None, dayfirst: bool=False, text: str=None) -> pd.DataFrame:
+        """_Parses date columns as a whole: the format is inferred once from a
+            sample and cached by (source, column), only the values it does not
+            parse go through dateutil, see process.table.dates._
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+            columns (Union[str, list]): _date columns_
+            source (str, optional): _source of the table, e.g. the workbook name_. Defaults to None.
+            format (str, optional): _strftime format, skips the inference_. Defaults to None.
+            dayfirst (bool, optional): _prefer dd/mm/yyyy over mm/dd/yyyy_. Defaults to False.
+            text (str, optional): _strftime format to write the dates back as text, e.g. "%m/%d/%Y"_. Defaults to None.
+
+        Returns:
+            pd.DataFrame: _pandas.DataFrame_
+        """
+
+        return engines.normalize_dates(df, columns, source, format, dayfirst, text)
+
+    def validate(df: pd.DataFrame, rules: Union[Schema, dict, list],
+                 failfast: bool=False) -> Violations:
+        """_Validates df against declarative rules (required, range, regex,
+            unique, allowed) compiled into vectorized masks, e.g. before
+            dataOut uploads or emails it, see process.table.rules._
+
+        ```python
+        violations = Table.validate(df, {"ID": {"required": True, "unique": True}})
+        if not violations.valid:
+            return violations.report # rows to fix before the upload
+        ```
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+            rules (Union[Schema, dict, list]): _Schema, {column: {rule: argument}} or Rule objects_
+            failfast (bool, optional): _stop at the first rule violated_. Defaults to False.
+
+        Returns:
+            Violations: _report of (row, column, rule, value), one row per violation_
+        """
+
+        violations = engines.validate(df, rules, failfast)
+        if not violations.valid:
+            print(f"{len(violations.report)} violations of {violations.rules} rules:")
+            print(violations.summary().to_string(index=False))
+        return violations
 
     def replace_column(df: pd.DataFrame, header: str,
                        value: Any, colIdx: int=None,
@@ -462,13 +853,15 @@ class Table(Console):
         
         return Table.add_column(df,header,value,colIdx,after,True)
 
-    def replace_row(df: pd.DataFrame, value: list, rowIdx: int=None) -> pd.DataFrame:
+    def replace_row(df: pd.DataFrame, value: list, rowIdx: int=None,
+                    index: KeyIndex=None) -> pd.DataFrame:
         """_Replace a row in the dataframe._
 
         Args:
             df (pd.DataFrame): _pandas.DataFrame_
             value (list): _column header_
             rowIdx (int, optional): _row index_. Defaults to None.
+            index (KeyIndex, optional): _key index kept in sync with the result_. Defaults to None.
 
         Returns:
             pd.DataFrame: _description_
@@ -477,69 +870,98 @@ class Table(Console):
         if len(value) != len(df.columns):
             print(f"The length of the value parameter must match the length of df.columns: {len(df.columns)}")
         else:
+            if index is not None:
+                old = index.key(df.iloc[rowIdx].to_list())
+                index.replace(rowIdx, old, index.key(value))
             dfreplacement = pd.DataFrame([value], columns=df.columns)
             return pd.concat([df[:rowIdx], dfreplacement, df[rowIdx+1:]])
 
     def change_value(df: pd.DataFrame, column: Union[str, int], row: int, value: Any):
-        """_Changes a value of a single cell in the assigned table_
+        """_Changes a value of a single cell in the assigned table. Only its
+            column is copied, df itself is left unchanged. To change many cells,
+            use Table.patch once rather than this in a loop._
 
         Args:
-            columnName (str): _name of the column_
-            rowIdx (int): __
-            newValue (Any): _description_
+            df (pd.DataFrame): _pandas.DataFrame_
+            column (Union[str, int]): _column header or number_
+            row (int): _row number_
+            value (Any): _new value_
+
+        Returns:
+            pd.DataFrame: _pandas.DataFrame_
         """
 
-        if type(column) == int:
-            column = df.columns[column]
-        
         try:
-            df[column][row] = value
-            return df
-        except:
+            return engines.patch(df, row, column, value)
+        except (IndexError, KeyError, engines.PatchShapeMismatch):
             print("The table value could not changed.")
-        
 
-    def filter_rows(df: pd.DataFrame, selections: list, out: bool=True):
-        """_Filters the rows of a dataframe_
+    def patch(df: pd.DataFrame, rows: Any, cols: Any, values: Any,
+              return_previous: bool=False, inplace: bool=False) -> Union[pd.DataFrame, tuple]:
+        """_Changes many cells with one assignment per column. rows, cols and
+            values hold one entry per cell, or a single value for every cell,
+            see process.table.patch._
+
+        ```python
+        df = Table.patch(df, rows=[3, 10, 42], cols="Status", values="Closed")
+        df, previous = Table.patch(df, rows, cols, values, return_previous=True)
+        ```
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+            rows (Any): _row number, or one row number per cell_
+            cols (Any): _column header or number, or one per cell_
+            values (Any): _value, or one value per cell_
+            return_previous (bool, optional): _also return the values replaced, one per cell_. Defaults to False.
+            inplace (bool, optional): _change df itself, when the caller owns it_. Defaults to False.
+
+        Raises:
+            PatchShapeMismatch: _rows, cols and values do not have one entry per cell_
+
+        Returns:
+            Union[pd.DataFrame, tuple]: _pandas.DataFrame, and the previous values if return_previous_
+        """
+
+        return engines.patch(df, rows, cols, values, return_previous, inplace)
+
+    def filter_rows(df: pd.DataFrame, selections: Any, out: bool=True, index: KeyIndex=None):
+        """_Filters the rows of a dataframe. Selections are compiled into a single
+            boolean mask, see process.table.masks for the accepted selections:
+            row numbers, ranges, column predicates (Where) and compound expressions._
 
         Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+            selections (Any): _rows to select_
             out (bool, optional): _whether to filter the selected rows out_. Defaults to True.
+            index (KeyIndex, optional): _key index kept in sync with the result_. Defaults to None.
+
+        Returns:
+            pd.DataFrame: _the retained rows_
         """
         print("Warning: Filtered tables cannot be unfiltered.")
-        if type(selections) == int:
-            return df[selections].copy
-        else:
-            headers = df.columns
-            matrix = Table.dataframe2matrix(df)
-            matrix4filteredDf = list()
-        
-            for row in matrix:
-                if out:
-                    if not row in selections:
-                        matrix4filteredDf.append(row)
-                else:
-                    if row in selections:
-                        matrix4filteredDf.append(row)
-            return pd.DataFrame(matrix, columns=headers)
-
-    def filter_columns(df: pd.DataFrame, selections: list, out: bool=True):
-        """_Filters the columns of a dataFrame_
+        df = masks.filter_rows(df, selections, out)
+        if index is not None:
+            index.rebuild(df)
+        return df
+
+    def filter_columns(df: pd.DataFrame, selections: Any, out: bool=True):
+        """_Filters the columns of a dataFrame. Selections are column names or
+            numbers, positions (slice, numpy array) or a selection expression
+            such as "Emp*, !Notes", see process.table.select._
 
         Args:
-            df (_type_): _description_
-            out (bool, optional): _description_. Defaults to True.
+            df (pd.DataFrame): _pandas.DataFrame_
+            selections (Any): _columns to select_
+            out (bool, optional): _whether to filter the selected columns out_. Defaults to True.
 
         Returns:
-            _type_: _description_
+            pd.DataFrame: _the retained columns, in the order selected if out is False_
         """
-        if out:
-            columns = list()
-            for i, column in df.columns:
-                if not i in selections:
-                    columns.append(column)    
-        else:
-            columns = [df.columns[i] for i in selections]
-        return df[[(columns)]].copy()
+
+        if isinstance(selections, (list, tuple)):
+            selections = [c if type(c) == int and not c in df.columns else df.columns.get_loc(c)
+                          for c in selections]
+        return select.take(df, selections, axis=1, out=out)
 
     def reorder_columns(df: pd.DataFrame, columns: list):
         """
@@ -556,7 +978,7 @@ class Table(Console):
             _type_: _A dataframe with only the reordered columns._
         """
     
-        return df[[(columns)]].copy()
+        return Table.filter_columns(df, columns, out=False)
 
 
 class Console(Console):
@@ -573,17 +995,33 @@ class Console(Console):
             from the console and exported to file._
         """
 
-        self._df = pd.DataFrame() # empty worksheet
+        self.store = engines.FrameStore() # empty worksheet, copy-on-write
+        self._rows = None # row buffer for append_row and insert_row
         self.table = Table # excel for dataframes on console
 
     @property
     def df(self) -> pd.DataFrame:
-        # A copy is operated on, then the property reassigned.
-        return self._df.copy()
+        # Buffered rows are materialized on read.
+        if self._rows is not None and self._rows.pending:
+            self.store.commit(self._rows.to_dataframe())
+        # [NOTE] A shared view is operated on, then the property reassigned.
+        # Writes into existing cells must go through self.store.edit().
+        return self.store.read()
 
     @df.setter
     def df(self, value: pd.DataFrame):
-        self._df = value
+        self.store.commit(value)
+        self._rows = None
+
+    @property
+    def rows(self) -> TableBuilder:
+        """
+        _Row buffer over self.df, used by append_row and insert_row._
+        """
+
+        if self._rows is None:
+            self._rows = self.table.builder(self.store.read())
+        return self._rows
 
     def request_table(self, headers: Union[str, list]) -> df:
         """
@@ -607,94 +1045,82 @@ class Console(Console):
         print(".df has been assigned")
 
     def page_navigate(self, linesPerScreen: int=50, page=0):
-        """_Multipage navigation of self.df._
+        """_Multipage navigation of self.df. Only the visible page is rendered,
+            see process.table.pager._
 
         Args:
             linesPerScreen (int, optional): _lines per screen_. Defaults to 50.
             page (int, optional): _page_. Defaults to 0.
-
-        Returns:
-            _type_: _description_
         """
 
-        startIdx = page * linesPerScreen
-        try:
-            df = self.df
-            print(df[startIdx:linesPerScreen])
-            menu = {
-                "#": "Go to Page",
-                ">": "Next Page",
-                "<": "Previous Page",
-                "" : "Press Enter to exit"}
-
-            res = self.table.get_option_selection(options=menu)
-            if res == "#":
-                print("A number is required for page selection.")
-            elif type(res) == int:
-                page = res
-            elif res == ">":
-                page += 1
-            elif res == "<":
-                page -= 1
-            return self.page_navigate(df,linesPerScreen,page)
+        pager = engines.Pager(self.df, linesPerScreen)
+        menu = "  ".join(f"[{key}] {option}" for key, option in engines.Pager.COMMANDS.items() if key)
         
-        except:
-            if page == 0:
-                raise UnknownlistDf4pagenavigate
-            else:
-                page = 0
-                return self.page_navigate(df,linesPerScreen,page)
+        while page is not None:
+            self.table.clear()
+            page = pager.page(page)
+            print(pager.render(page))
+            print(menu)
+            page = pager.navigate(page, Console._input("Selection? [#, >, <, Enter]: ", "page"))
   
-    def insert_row(self, after: bool=True):
+    def insert_row(self, after: bool=True, rowIdx: int=None, row: list=None):
         """
-        _Inserts a row into the assigned table._
+        _Inserts a row into the assigned table. The row number and row are
+         requested from the user if not passed. Rows are buffered and
+         materialized on the next read of self.df._
 
         Args:
-            after (bool, optional): _description_. Defaults to True.
+            after (bool, optional): _insert after the row_. Defaults to True.
+            rowIdx (int, optional): _row number_. Defaults to None.
+            row (list, optional): _one value per column_. Defaults to None.
         """
 
-        self.table.clear()
-        df = self.df
-        print(df.head())
-        while True:
-            try:
-                idx = input("Index Number?: ")
-                assert type(idx) == int
+        if rowIdx is None:
+            self.table.clear()
+            df = self.df
+            print(df.head())
+            while True:
+                try:
+                    rowIdx = int(Console._input("Index Number?: ").strip())
+                    break
+                except ValueError:
+                    Console._reject("The insert index should be one number.")
 
-                row = self.table.get_table_row(df.columns)
-                self.df = self.table.add_row(df,row,idx,after)
-                break      
-            except:
-                print("The insert index should be one number.")
-                sleep(2)
+        if row is None:
+            row = self.table.get_table_row(self.rows.columns)
+        self.rows.insert(rowIdx, row, after)
   
-    def append_row(self):
+    def append_row(self, row: list=None):
         """
-        _Appends a row into the assigned table._
+        _Appends a row into the assigned table. The row is requested from
+         the user if not passed. Rows are buffered and materialized on the
+         next read of self.df._
+
+        Args:
+            row (list, optional): _one value per column_. Defaults to None.
         """
 
-        df = self.df
-        row = self.table.get_table_row(df.columns)
-        self.df = pd.concat(
-                    [df, pd.DataFrame([row],
-                    columns=df.columns)])
+        if row is None:
+            row = self.table.get_table_row(self.rows.columns)
+        self.rows.append(row)
 
     def delete_rows(self):
+        df = self.df
         print(f"Please provide row numbers to filter out?")
-        selections = Table.get_selection()
+        selections = Table.get_row_selection(length=len(df))
         
         print("Warning: Row deletions are permanent.")
-        self.df = Table.filter_rows(self.df, selections, out=True)
+        self.df = Table.filter_rows(df, selections, out=True)
 
     def delete_columns(self):
         print("Warning: Filtered tables cannot be unfiltered.")
-        df = self.df.copy()
+        df = self.df
         
         for i, column in enumerate(df.columns):
             print(f"[{i+1}] {column}")
         
-        selections = Table.get_selection(list(range(1,len(df)-1)))
-        self.df = Table.filter_columns(self.df, selections, out=True)
+        selections = Table.get_row_selection(names=df.columns, base=1)
+        self.df = Table.filter_columns(df, selections, out=True)
 
 
 class Notify:
@@ -717,29 +1143,29 @@ class Notify:
             title (_type_): _description_
         """
         
-        wc = WNDCLASS()
-        hinst = wc.hInstance = GetModuleHandle(None)
+        wc = win32gui.WNDCLASS()
+        hinst = wc.hInstance = win32api.GetModuleHandle(None)
         wc.lpszClassName = f"{title} Notifier"
-        classAtom = RegisterClass(wc)
+        classAtom = win32gui.RegisterClass(wc)
         style = win32com.WS_OVERLAPPED | win32com.WS_SYSMENU
-        hwnd = CreateWindow(
+        hwnd = win32gui.CreateWindow(
                 classAtom, "Taskbar", style,
                 0, 0, win32com.CW_USEDEFAULT, win32com.CW_USEDEFAULT,
                 0, 0, hinst, None)
-        UpdateWindow(hwnd)
+        win32gui.UpdateWindow(hwnd)
         
         icon_flags = win32com.LR_LOADFROMFILE | win32com.LR_DEFAULTSIZE
-        hicon = LoadImage(hinst, self.ICO, win32com.IMAGE_ICON, 0, 0, icon_flags)
-        flags = NIF_ICON | NIF_MESSAGE | NIF_TIP
+        hicon = win32gui.LoadImage(hinst, self.ICO, win32com.IMAGE_ICON, 0, 0, icon_flags)
+        flags = win32gui.NIF_ICON | win32gui.NIF_MESSAGE | win32gui.NIF_TIP
         nid = (hwnd, 0, flags, win32com.WM_USER+20, hicon, "tooltip")
-        Shell_NotifyIcon(NIM_ADD, nid)
-        Shell_NotifyIcon(
-            NIM_MODIFY, 
-            (hwnd, 0, NIF_INFO, win32com.WM_USER+20,
+        win32gui.Shell_NotifyIcon(win32gui.NIM_ADD, nid)
+        win32gui.Shell_NotifyIcon(
+            win32gui.NIM_MODIFY, 
+            (hwnd, 0, win32gui.NIF_INFO, win32com.WM_USER+20,
              hicon, "Notification", msg, 200, title))
         sleep(3)
-        DestroyWindow(hwnd)
-        UnregisterClass(classAtom, hinst)
+        win32gui.DestroyWindow(hwnd)
+        win32gui.UnregisterClass(classAtom, hinst)
         
     def message(self, msg: str, icon: str="inform", title: str="DXC Office") -> str:
         """
@@ -763,7 +1189,7 @@ class Notify:
             "warn": 48,
             "stop": 16,
             "inform": 64}
-        _ = windll.user32.MessageBoxW(0,msg,title,0|icons[icon]|0)
+        _ = ctypes.windll.user32.MessageBoxW(0,msg,title,0|icons[icon]|0)
                
     def taskbar(self, msg: str, title: str="DXC Office"):
         """_Triggers a taskbar notification. The notification title
@@ -846,7 +1272,7 @@ class Keyboard:
         """
         
         key = Keyboard.KEYMAP[key] if type(key) == str else key
-        SendMessage(hwnd, Keyboard.WM_KEYDOWN, key, 0)
+        win32gui.SendMessage(hwnd, Keyboard.WM_KEYDOWN, key, 0)
 
     def release(key: Union[str,int], hwnd: int):
         """
@@ -855,7 +1281,7 @@ class Keyboard:
         """
         
         key = Keyboard.KEYMAP[key] if type(key) == str else key
-        SendMessage(hwnd, Keyboard.WM_KEYUP, key, 0)
+        win32gui.SendMessage(hwnd, Keyboard.WM_KEYUP, key, 0)
     
     def press(key: Union[str,int], hwnd: int):
         """
@@ -925,13 +1351,13 @@ class WindowManager:
             title (str, optional): _partial titles accepted_. Defaults to None.
         """
         
-        self.taskbarOffSet = GetSystemMetrics(self.SM_CYSIZEFRAME)
+        self.taskbarOffSet = win32api.GetSystemMetrics(self.SM_CYSIZEFRAME)
         # [NOTE] Visual estimate.
         self.hoverEffect = self.taskbarOffSet // 5 
         
         # Resolves the taskbar issue.
         workingArea = wintypes.RECT()
-        _ = windll.user32.SystemParametersInfoW(48,0,byref(workingArea),0)
+        _ = ctypes.windll.user32.SystemParametersInfoW(48,0,ctypes.byref(workingArea),0)
         self.sw = workingArea.right - workingArea.left
         self.sh = workingArea.bottom - workingArea.top
         
@@ -996,7 +1422,7 @@ class WindowManager:
         self.showMaximized(self)
 
     def close(self):
-        PostMessage(self.hwnd,self.WM_CLOSE,0,0)
+        win32gui.PostMessage(self.hwnd,self.WM_CLOSE,0,0)
 
     def move_top_center(self):
         self.move_center()
@@ -1019,9 +1445,9 @@ class WindowManager:
         
         titles = list()
         def getTitle(hwnd, _x): # [NOTE] Bug patch.
-            if IsWindowVisible(hwnd):
-                titles.append(titles.append(GetWindowText(hwnd)))
-        EnumWindows(getTitle, None)
+            if win32gui.IsWindowVisible(hwnd):
+                titles.append(titles.append(win32gui.GetWindowText(hwnd)))
+        win32gui.EnumWindows(getTitle, None)
         return [t for t in titles if t]
 
     @staticmethod
@@ -1058,7 +1484,7 @@ class WindowManager:
         """
         
         try:
-            hwndTitle = GetWindowText(self.hwnd)
+            hwndTitle = win32gui.GetWindowText(self.hwnd)
             if self._title != hwndTitle:
                 self._title = hwndTitle
         except:
@@ -1108,7 +1534,7 @@ class WindowManager:
         # window.
         
         try:
-            hwnd = FindWindow(None, self.title)
+            hwnd = win32gui.FindWindow(None, self.title)
             if not hwnd:
                 raise ValueError
             return hwnd
@@ -1124,7 +1550,7 @@ class WindowManager:
             _bool_: _current window is in the foreground_
         """
         
-        return self.title == GetWindowText(GetForegroundWindow())
+        return self.title == win32gui.GetWindowText(win32gui.GetForegroundWindow())
         
     @property
     def visible(self) -> bool:
@@ -1135,7 +1561,7 @@ class WindowManager:
             _bool_: _current window visible_
         """
         
-        return IsWindowVisible(self.hwnd)
+        return win32gui.IsWindowVisible(self.hwnd)
 
     @property
     def position(self) -> tuple:
@@ -1146,7 +1572,7 @@ class WindowManager:
             _tuple_: _(x, y)_
         """
         
-        rect = GetWindowRect(self.hwnd)
+        rect = win32gui.GetWindowRect(self.hwnd)
         x = rect[0] + 7
         y = rect[1]
         return (x, y)
@@ -1160,7 +1586,7 @@ class WindowManager:
             _tuple_: _(w, h)_
         """
         
-        rect = GetWindowRect(self.hwnd)
+        rect = win32gui.GetWindowRect(self.hwnd)
         w = rect[2] - self.position[0] - 7
         h = rect[3] - self.position[1] - 7
         return (w, h)
@@ -1172,7 +1598,7 @@ class WindowManager:
                 "position": self.position}
 
     def _showWindow(self, state: str):
-        ShowWindow(self.hwnd,self.SW_STATES[state])
+        win32gui.ShowWindow(self.hwnd,self.SW_STATES[state])
 
     def keep_on_top(self):
         """
@@ -1182,7 +1608,7 @@ class WindowManager:
         self._showWindow("displayActivate")
         w, h = self.size
         x, y = self.position
-        SetWindowPos(self.hwnd,self.HWND_TOPMOST,x,y,w,h,0)
+        win32gui.SetWindowPos(self.hwnd,self.HWND_TOPMOST,x,y,w,h,0)
 
     def move(self, x: int, y: int):
         """
@@ -1198,7 +1624,7 @@ class WindowManager:
         # change the window's position.
         x, y = int(x), int(y)
         w, h = self.size
-        SetWindowPos(self.hwnd,0,x,y,w,h,0)
+        win32gui.SetWindowPos(self.hwnd,0,x,y,w,h,0)
 
     def move_center(self):
         """
@@ -1246,7 +1672,7 @@ class WindowManager:
         # change the window's size.
         w, h = int(w), int(h)
         x, y = self.position
-        SetWindowPos(self.hwnd,0,x,y,w,h,0)
+        win32gui.SetWindowPos(self.hwnd,0,x,y,w,h,0)
 
     def table_reference(self):
         """
@@ -0,0 +1,20 @@
+from .masks import Where, build_mask, filter_rows
+from .export import column_arrays, iter_matrix, iter_rows, to_matrix
+from .builder import TableBuilder
+from .store import FrameStore
+from .journal import EditJournal
+from .plan import Pipeline
+from .index import KeyIndex
+from .compact import compact
+from .chunked import ChunkedTable
+from .diff import ChangeSet, diff
+from .pager import Pager
+from .columns import add_column, column_values
+from .parallel import parallel_apply
+from .lookup import join, lookup
+from .pivot import group_by, pivot
+from .fuzzy import fuzzy_match, soundex
+from .dates import normalize_dates, parse_dates
+from .rules import Schema, validate
+from .patch import patch, assign, PatchShapeMismatch
+from .select import Selection, take
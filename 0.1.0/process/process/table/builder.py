@@ -0,0 +1,201 @@
+import numpy as np
+import pandas as pd
+
+
+"""[Builder Summary]
+    Row buffering for Table.add_row, Console.append_row and Console.insert_row.
+
+    Appending a row to a DataFrame copies the entire DataFrame, so building
+    a table row by row costs O(rows^2). TableBuilder instead writes incoming
+    rows into preallocated columnar buffers (grown by doubling) and only
+    materializes the DataFrame when it is asked for, or when the number of
+    buffered rows reaches the threshold.
+
+    Inserted rows are placed by row number. Row numbers refer to the table
+    as it was at the last flush() or to_dataframe(), which is the table the
+    user was last shown. All pending inserts and appends are resolved in a
+    single pass when the DataFrame is materialized. Rows materialized in
+    between because the threshold was reached do not shift the row numbers
+    of later inserts: the points they were placed at are kept, and later
+    points are moved past the rows placed at or before them.
+"""
+
+
+class RowLengthMismatch(Exception):
+    """
+    _The row does not have one value per column._
+    """
+    pass
+
+
+class TableBuilder:
+    """
+    _Collects rows and materializes them into a DataFrame at once.
+
+     ```python
+     builder = Table.builder(df)
+     for row in rows:
+         builder.append(row)
+     builder.insert(0, ["first", "row"])
+     df = builder.to_dataframe()
+     ```_
+    """
+
+    CAPACITY = 1024
+    THRESHOLD = 250000
+
+    def __init__(self, df: pd.DataFrame = None, columns: list = None,
+                 threshold: int = THRESHOLD):
+        """
+        Args:
+            df (pd.DataFrame, optional): _table the rows are added to_. Defaults to None.
+            columns (list, optional): _headers, if df is not passed_. Defaults to None.
+            threshold (int, optional): _buffered rows that trigger materialization_. Defaults to THRESHOLD.
+        """
+
+        if df is None:
+            df = pd.DataFrame(columns=columns if columns is not None else [])
+        self._df = df
+        self.threshold = threshold
+        # [NOTE] Points of the rows materialized by the threshold since the last flush(), sorted.
+        self._moved = np.empty(0, dtype=np.int64)
+        self._reset()
+
+    def _reset(self):
+        self._size = 0
+        self._capacity = self.CAPACITY
+        self._buffers = [np.empty(self._capacity, dtype=object) for _ in self._df.columns]
+        # [NOTE] Row number each buffered row is placed before, len(df) for appends.
+        self._points = np.empty(self._capacity, dtype=np.int64)
+        self._inserted = False
+
+    @property
+    def _shown(self) -> int:
+        """
+        _Length of the table row numbers refer to._
+        """
+
+        return len(self._df) - len(self._moved)
+
+    def __len__(self) -> int:
+        return len(self._df) + self._size
+
+    @property
+    def columns(self) -> pd.Index:
+        return self._df.columns
+
+    @property
+    def pending(self) -> int:
+        """
+        _Number of rows that have not been materialized._
+        """
+
+        return self._size
+
+    def _grow(self):
+        self._capacity *= 2
+        for i, buffer in enumerate(self._buffers):
+            grown = np.empty(self._capacity, dtype=object)
+            grown[:self._size] = buffer[:self._size]
+            self._buffers[i] = grown
+        points = np.empty(self._capacity, dtype=np.int64)
+        points[:self._size] = self._points[:self._size]
+        self._points = points
+
+    def _add(self, row: list, point: int):
+        if len(row) != len(self._buffers):
+            raise RowLengthMismatch(f"Expected {len(self._buffers)} values, got {len(row)}.")
+
+        if self._size == self._capacity:
+            self._grow()
+
+        for buffer, value in zip(self._buffers, row):
+            buffer[self._size] = value
+        self._points[self._size] = point
+        self._size += 1
+
+        if self._size >= self.threshold:
+            self._materialize()
+
+    def append(self, row: list):
+        """_Adds a row to the end of the table._
+
+        Args:
+            row (list): _one value per column_
+        """
+
+        self._add(row, self._shown)
+
+    def extend(self, rows: list):
+        """_Adds rows to the end of the table._
+
+        Args:
+            rows (list): _[[row], [row], ...]_
+        """
+
+        for row in rows:
+            self._add(row, self._shown)
+
+    def insert(self, rowIdx: int, row: list, after: bool = False):
+        """_Inserts a row by row number. Rows inserted at the same row number
+            keep the order in which they were inserted._
+
+        Args:
+            rowIdx (int): _row number, as of the last flush_
+            row (list): _one value per column_
+            after (bool, optional): _insert after the row_. Defaults to False.
+        """
+
+        point = rowIdx + 1 if after else rowIdx
+        point = min(max(point, 0), self._shown)
+        if point != self._shown:
+            self._inserted = True
+        self._add(row, point)
+
+    def flush(self):
+        """
+        _Materializes the buffered rows into the table with a single concat.
+         Row numbers of later inserts refer to the table flushed._
+        """
+
+        self._materialize()
+        self._moved = np.empty(0, dtype=np.int64)
+
+    def _materialize(self):
+        if not self._size:
+            return
+
+        size, base = self._size, self._df
+        rows = pd.DataFrame(
+            {i: buffer[:size] for i, buffer in enumerate(self._buffers)},
+            index=pd.RangeIndex(len(base), len(base) + size)).infer_objects()
+        rows.columns = base.columns
+
+        defaultIndex = base.index.equals(pd.RangeIndex(len(base)))
+        df = pd.concat([base, rows]) if len(base) else rows
+
+        points = self._points[:size]
+        if self._inserted:
+            # [NOTE] Past the rows materialized at or before the same point, which came first.
+            moved = points + np.searchsorted(self._moved, points, side="right")
+            order = np.argsort(points, kind="stable")
+            positions = np.insert(
+                np.arange(len(base)), moved[order], len(base) + order)
+            df = df.take(positions)
+
+        if defaultIndex:
+            df = df.reset_index(drop=True)
+
+        self._df = df
+        self._moved = np.sort(np.concatenate([self._moved, points]))
+        self._reset()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """_Returns the table with all buffered rows in place._
+
+        Returns:
+            pd.DataFrame: _pandas.DataFrame_
+        """
+
+        self.flush()
+        return self._df
@@ -0,0 +1,357 @@
+from dataclasses import replace
+from typing import Any, Callable, Iterator, Union
+
+import numpy as np
+import pandas as pd
+
+from .plan import AddColumn, FilterRows, Pipeline, Scan, _positional
+
+
+"""[Chunked Summary]
+    Out-of-core Table operations for files larger than memory.
+
+    A ChunkedTable reads its source in bounded chunks, applies the recorded
+    Table operations (filter_rows, filter_columns, add_column,
+    reorder_columns) to each chunk, and streams the result into a csv or
+    parquet writer. Only one chunk is held at a time, and the chunk size is
+    derived from a memory budget and a sample of the source:
+
+    ```python
+    table = Table.chunked(excel.get_local_csv_as_dataframe, path, budget=512 * 2**20)
+    table.filter_rows(Where("Status", "==", "Terminated"), out=False) \\
+         .add_column("Bonus", lambda df: df.Salary * 0.1, uses=["Salary"]) \\
+         .filter_columns(["Notes"])
+    stats = table.to_csv(output)
+    ```
+
+    The operations are recorded and optimized as in a Pipeline, see
+    process.table.plan. Row numbers passed to filter_rows and positional
+    column values passed to add_column refer to the whole table, as they
+    would without chunking. Callables are run once per chunk and must
+    therefore be row-wise.
+
+    Readers are any callable that accept chunksize and return an iterable
+    of DataFrames: pd.read_csv, Excel.get_local_csv_as_dataframe,
+    Excel.get_local_xlsx_as_dataframe, SharePoint.doc_csv2dataframe or
+    read_xlsx_chunks.
+"""
+
+
+BUDGET = 256 * 2**20
+# [NOTE] Copies alive at once per chunk: reader buffers, the chunk, step results and the writer's.
+OVERHEAD = 4
+SAMPLE = 1000
+
+
+class NotStreamable(Exception):
+    """
+    _The selection needs the length of the whole table, e.g. negative row numbers._
+    """
+    pass
+
+
+def chunksize_for(sample: pd.DataFrame, budget: int = BUDGET) -> int:
+    """_Returns the number of rows per chunk that keeps the memory used by
+        one chunk under budget, from the bytes per row of a sample._
+
+    Args:
+        sample (pd.DataFrame): _first rows of the source_
+        budget (int, optional): _bytes_. Defaults to BUDGET.
+
+    Returns:
+        int: _rows per chunk_
+    """
+
+    if not len(sample):
+        return SAMPLE
+    perRow = sample.memory_usage(index=True, deep=True).sum() / len(sample)
+    return max(1, int(budget // (perRow * OVERHEAD)))
+
+
+def read_xlsx_chunks(io: Any, sheet_name: Union[str, int] = 0, chunksize: int = SAMPLE,
+                     usecols: list = None, skiprows: Union[int, range] = None,
+                     nrows: int = None) -> Iterator[pd.DataFrame]:
+    """_Reads a worksheet in chunks of rows with openpyxl's read-only mode,
+        which does not load the workbook into memory. The first row holds
+        the headers._
+
+    Args:
+        io (Any): _path or file-like object of a xlsx/xlsm workbook_
+        sheet_name (Union[str, int], optional): _worksheet name or number_. Defaults to 0.
+        chunksize (int, optional): _rows per chunk_. Defaults to SAMPLE.
+        usecols (list, optional): _headers of the columns to keep_. Defaults to None.
+        skiprows (Union[int, range], optional): _lines to skip, as pd.read_csv_. Defaults to None.
+        nrows (int, optional): _rows to read_. Defaults to None.
+
+    Yields:
+        pd.DataFrame: _chunk_
+    """
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(io, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name] if type(sheet_name) == str else workbook.worksheets[sheet_name]
+        if type(skiprows) == int:
+            skiprows = range(skiprows)
+        lines = (line for i, line in enumerate(worksheet.iter_rows(values_only=True))
+                 if skiprows is None or not i in skiprows)
+
+        headers = list(next(lines, ()))
+        keep = list(range(len(headers))) if usecols is None else \
+               [i for i, header in enumerate(headers) if header in usecols]
+        columns = [headers[i] for i in keep]
+
+        rows, read = list(), 0
+        for line in lines:
+            if nrows is not None and read == nrows:
+                break
+            rows.append([line[i] if i < len(line) else None for i in keep])
+            read += 1
+            if len(rows) == chunksize:
+                yield pd.DataFrame(rows, columns=columns, index=pd.RangeIndex(read - len(rows), read))
+                rows = list()
+        if rows or not read:
+            yield pd.DataFrame(rows, columns=columns, index=pd.RangeIndex(read - len(rows), read))
+    finally:
+        workbook.close()
+
+
+class CsvWriter:
+    """
+    _Appends chunks to a csv file, the headers are written once._
+    """
+
+    def __init__(self, path: str, **options):
+        self.path = path
+        self.options = options
+        self._file = open(path, "w", newline="", encoding=options.pop("encoding", "utf-8"))
+        self._headers = True
+
+    def write(self, df: pd.DataFrame):
+        df.to_csv(self._file, header=self._headers, index=False, **self.options)
+        self._headers = False
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter:
+    """
+    _Appends chunks to a parquet file as row groups, requires pyarrow.
+     The schema is taken from the first chunk._
+    """
+
+    def __init__(self, path: str, **options):
+        import pyarrow.parquet
+
+        self.path = path
+        self.options = options
+        self._parquet = pyarrow.parquet
+        self._writer = None
+
+    def write(self, df: pd.DataFrame):
+        import pyarrow
+
+        if self._writer is None:
+            table = pyarrow.Table.from_pandas(df, preserve_index=False)
+            self._writer = self._parquet.ParquetWriter(self.path, table.schema, **self.options)
+        else:
+            table = pyarrow.Table.from_pandas(df, schema=self._writer.schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+class ChunkScan(Scan):
+    """
+    _Scan of a chunked reader, the headers come from the sample chunk._
+    """
+
+    def __init__(self, reader: Callable, args: tuple, kwargs: dict, headers: list):
+        super().__init__(reader, args, kwargs)
+        self.headers = headers
+
+    def columns(self) -> list:
+        return list(self.headers)
+
+
+def _window(selections: Any, start: int, length: int) -> Any:
+    """_Translates whole-table row numbers into a mask over the chunk
+        [start, start + length). Other selections are returned as they are._"""
+
+    if isinstance(selections, (bool, np.bool_)):
+        return selections
+    if isinstance(selections, (int, np.integer)):
+        selections = [selections]
+    if isinstance(selections, slice):
+        if (selections.start or 0) < 0 or (selections.stop or 0) < 0 or (selections.step or 1) < 0:
+            raise NotStreamable(selections)
+        selections = range(selections.start or 0,
+                           np.iinfo(np.int64).max if selections.stop is None else selections.stop,
+                           selections.step or 1)
+    positions = np.arange(start, start + length)
+    if isinstance(selections, range):
+        if selections.start < 0 or selections.stop < 0 or selections.step < 0:
+            raise NotStreamable(selections)
+        return (positions >= selections.start) & (positions < selections.stop) & \
+               ((positions - selections.start) % selections.step == 0)
+    if isinstance(selections, (list, tuple, np.ndarray)):
+        selections = np.asarray(selections)
+        if selections.dtype == bool:
+            return selections[start:start + length]
+        if selections.dtype.kind in "iu":
+            if (selections < 0).any():
+                raise NotStreamable("negative row numbers")
+            return np.isin(positions, selections)
+    return selections
+
+
+class ChunkedTable(Pipeline):
+    """
+    _Table operations over a source read in chunks, see the module summary._
+    """
+
+    # [NOTE] Callables run once per chunk, they must be row-wise already.
+    ROWWISE = True
+
+    def __init__(self, reader: Callable, *args, budget: int = BUDGET,
+                 chunksize: int = None, **kwargs):
+        """
+        Args:
+            reader (Callable): _reader accepting chunksize and returning an iterable of DataFrames_
+            budget (int, optional): _bytes a chunk may use while processed_. Defaults to BUDGET.
+            chunksize (int, optional): _rows per chunk, derived from budget if None_. Defaults to None.
+            *args, **kwargs: _passed to the reader_
+        """
+
+        chunks = reader(*args, chunksize=SAMPLE, **kwargs)
+        try:
+            sample = next(iter(chunks))
+        finally:
+            self._close(chunks)
+
+        self.source = ChunkScan(reader, args, kwargs, list(sample.columns))
+        self.steps = list()
+        self.columns = list(sample.columns)
+        self.budget = budget
+        self.chunksize = chunksize or chunksize_for(sample, budget)
+        self.stats = dict()
+
+    def _close(self, chunks: Any):
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+    def _windowed(self, step: Any, start: int, length: int) -> Any:
+        if isinstance(step, FilterRows):
+            return replace(step, selections=_window(step.selections, start, length))
+        if isinstance(step, AddColumn) and _positional(step.value):
+            return replace(step, value=step.value[start:start + length])
+        return step
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """_Reads the source chunk by chunk and yields each chunk once the
+            optimized plan has been applied to it._
+
+        Yields:
+            pd.DataFrame: _processed chunk_
+        """
+
+        steps = self.optimize()
+        scan = steps.pop(0)
+        chunks = scan.reader(*scan.args, chunksize=self.chunksize, **scan.options())
+        # [NOTE] Rows that entered each step so far, row numbers are relative to the step's input.
+        offsets = [0] * len(steps)
+        self.stats = {"chunksize": self.chunksize, "chunks": 0, "rows_in": 0,
+                      "rows_out": 0, "peak_bytes": 0}
+        try:
+            for df in chunks:
+                df = scan.relabel(df)
+                self.stats["chunks"] += 1
+                self.stats["rows_in"] += len(df)
+                peak = df.memory_usage(index=True, deep=True).sum()
+
+                owned = True
+                for i, step in enumerate(steps):
+                    length = len(df)
+                    if isinstance(step, AddColumn) and not owned:
+                        df = df.copy(deep=False)
+                    df = self._windowed(step, offsets[i], length).run(df)
+                    offsets[i] += length
+                    owned = isinstance(step, AddColumn)
+
+                self.stats["rows_out"] += len(df)
+                self.stats["peak_bytes"] = int(max(self.stats["peak_bytes"], peak,
+                                                   df.memory_usage(index=True, deep=True).sum()))
+                yield df
+        finally:
+            self._close(chunks)
+
+    def _nonempty(self) -> Iterator[pd.DataFrame]:
+        """_The processed chunks left with rows, or the first chunk if none is._"""
+
+        # [NOTE] A chunk emptied by a filter holds no values to infer dtypes
+        # from, its columns would upcast the others (ints to floats) once concatenated.
+        first, rows = None, False
+        for df in self.iter_chunks():
+            if len(df):
+                rows = True
+                yield df
+            elif first is None:
+                first = df
+        if not rows and first is not None:
+            yield first
+
+    def write(self, writer: Any) -> dict:
+        """_Streams the processed chunks into writer, which is closed after
+            the last chunk._
+
+        Args:
+            writer (Any): _CsvWriter, ParquetWriter, or any object with write(df) and close()_
+
+        Returns:
+            dict: _{"chunksize", "chunks", "rows_in", "rows_out", "peak_bytes"}_
+        """
+
+        try:
+            for df in self._nonempty():
+                writer.write(df)
+        finally:
+            writer.close()
+        if self.stats["peak_bytes"] > self.budget:
+            print(f"Warning: a chunk used {self.stats['peak_bytes']} bytes, pass a smaller chunksize to stay within budget.")
+        return self.stats
+
+    def to_csv(self, path: str, **options) -> dict:
+        """_Streams the processed chunks into a csv file._
+
+        Returns:
+            dict: _see write_
+        """
+
+        return self.write(CsvWriter(path, **options))
+
+    def to_parquet(self, path: str, **options) -> dict:
+        """_Streams the processed chunks into a parquet file, requires pyarrow._
+
+        Returns:
+            dict: _see write_
+        """
+
+        return self.write(ParquetWriter(path, **options))
+
+    def collect(self) -> pd.DataFrame:
+        """_Returns the processed chunks as one DataFrame, for results that
+            fit in memory (e.g. after a selective filter)._
+
+        Returns:
+            pd.DataFrame: _the result_
+        """
+
+        chunks = list(self._nonempty())
+        if not chunks:
+            return pd.DataFrame(columns=self.columns)
+        return pd.concat(chunks)
@@ -0,0 +1,106 @@
+from collections.abc import Mapping
+from typing import Any, Union
+
+import pandas as pd
+
+
+"""[Columns Summary]
+    Column assignment for Table.add_column, Table.replace_column, the edit
+    journal and lazy pipelines.
+
+    Values are aligned to the rows of the table without python loops:
+
+        : scalars are broadcast by pandas
+        : Series are aligned by index label (reindex), missing labels are NaN
+        : dicts and other mappings are looked up by index label (map),
+          missing labels are NaN
+        : lists and numpy arrays are taken by position and must have one
+          value per row
+        : callables are passed the DataFrame and may return any of the above
+
+    New columns are inserted at their position with DataFrame.insert, which
+    adds one block and leaves the other columns' buffers untouched.
+"""
+
+
+class ColumnLengthMismatch(Exception):
+    """
+    _The column does not have one value per row._
+    """
+    pass
+
+
+def column_values(df: pd.DataFrame, value: Any) -> Any:
+    """_Aligns a column value to the rows of df, see the module summary._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        value (Any): _scalar, Series, mapping, list, array or callable_
+
+    Raises:
+        ColumnLengthMismatch: _a list or array does not have one value per row_
+
+    Returns:
+        Any: _a scalar, or values with one entry per row_
+    """
+
+    if callable(value):
+        value = value(df)
+    if isinstance(value, pd.Series):
+        # [NOTE] Series keep their dtype, e.g. categoricals.
+        return value if value.index.equals(df.index) else value.reindex(df.index)
+    if isinstance(value, Mapping):
+        # [NOTE] One C-level pass of dict.get, faster than building a Series from
+        # the mapping to reindex it.
+        return pd.Series(list(map(value.get, df.index.tolist())), index=df.index)
+    if isinstance(value, pd.DataFrame):
+        raise ColumnLengthMismatch("A DataFrame is not a column, pass one of its columns.")
+    if pd.api.types.is_list_like(value):
+        if len(value) != len(df):
+            raise ColumnLengthMismatch(f"Expected {len(df)} values, got {len(value)}.")
+        return value
+    return value
+
+
+def position(df: pd.DataFrame, colIdx: int = None, after: bool = True) -> int:
+    """_Position a new column is inserted at, the end if colIdx is None._"""
+
+    if colIdx is None:
+        return df.shape[1]
+    return min(colIdx + 1 if after else colIdx, df.shape[1])
+
+
+def add_column(df: pd.DataFrame, header: Union[str, int], value: Any, colIdx: int = None,
+               after: bool = True, overwrite: bool = False, inplace: bool = False) -> pd.DataFrame:
+    """_Adds a column to df, or overwrites it if it exists and overwrite is True._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        header (Union[str, int]): _column header_
+        value (Any): _scalar, Series, mapping, list, array or callable_
+        colIdx (int, optional): _column number, the column is appended if None_. Defaults to None.
+        after (bool, optional): _insert after colIdx_. Defaults to True.
+        overwrite (bool, optional): _overwrite an existing column_. Defaults to False.
+        inplace (bool, optional): _add the column to df itself rather than to a
+                                   shallow copy sharing its buffers_. Defaults to False.
+
+    Raises:
+        ColumnLengthMismatch: _a list or array does not have one value per row_
+
+    Returns:
+        pd.DataFrame: _pandas.DataFrame, None if the column exists and overwrite is False_
+    """
+
+    if header in df.columns and not overwrite:
+        print("To overwrite an existing column, please change the overwrite parameter to True.")
+        return None
+
+    values = column_values(df, value)
+    if not inplace:
+        df = df.copy(deep=False)
+
+    if header in df.columns:
+        df[header] = values
+    else:
+        df.insert(position(df, colIdx, after), header, values)
+    return df
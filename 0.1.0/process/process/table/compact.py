@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+
+
+"""[Compact Summary]
+    Dtype compaction of DataFrames read from Excel, csv and SharePoint.
+
+    The pandas readers return int64 and float64 for numbers and object
+    (one python str per cell) for text, which is 5-10x the memory most
+    extracts need. compact() rewrites each column into the smallest dtype
+    that holds the same values:
+
+        : integers are downcast to the smallest signed width that holds
+          their range, if integers=True
+        : floats are downcast to float32 when every value round-trips
+        : text columns with few distinct values (departments, countries,
+          statuses) become categoricals
+        : other text columns become Arrow-backed strings, if arrow=True
+          and pyarrow is installed
+
+    Integers are left as int64 unless asked for: arithmetic on a narrow
+    column wraps without an error (ages in int8 times 10 overflow), and
+    the readers' callers do arithmetic on what they read.
+
+    Compaction is on by default at ingest (Excel.get_local_*_as_dataframe,
+    SharePoint.doc_*2dataframe); pass compact=False to keep the reader's
+    dtypes. The report of the last compaction is kept on the instance:
+
+    ```python
+    df = excel.get_local_csv_as_dataframe(path)
+    print(excel.compaction)
+    ```
+
+    [NOTE] Categorical columns only accept values that are already among
+    their categories when written into with iloc. Table.patch adds the new
+    values to the categories first, see process.table.patch.upcast.
+"""
+
+
+# [NOTE] At most 1 distinct value in 20: above that, the codes and the
+#  categories together save little and every write must check the categories.
+CATEGORY_RATIO = 0.05
+REPORT_COLUMNS = ["column", "before", "after", "bytes_before", "bytes_after", "saved"]
+
+
+def _downcast_integers(series: pd.Series) -> pd.Series:
+    if not len(series):
+        return series
+    low, high = series.min(), series.max()
+    # [NOTE] Signed only, as pd.to_numeric(downcast="integer"): end - start must not wrap to 254.
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return series.astype(dtype)
+    return series
+
+
+def _downcast_floats(series: pd.Series) -> pd.Series:
+    values = series.to_numpy()
+    compacted = values.astype(np.float32)
+    # [NOTE] Only lossless downcasts, currency and IDs stored as floats must not drift.
+    with np.errstate(over="ignore", invalid="ignore"):
+        if np.array_equal(compacted.astype(values.dtype), values, equal_nan=True):
+            return series.astype(np.float32)
+    return series
+
+
+def _is_text(series: pd.Series) -> bool:
+    return pd.api.types.infer_dtype(series, skipna=True) == "string"
+
+
+def _compact_text(series: pd.Series, categories: float, arrow: bool) -> pd.Series:
+    if not _is_text(series):
+        return series # mixed types are left as read
+    if series.nunique(dropna=True) <= categories * len(series):
+        return series.astype("category")
+    if arrow:
+        try:
+            return series.astype("string[pyarrow]")
+        except ImportError:
+            print("Arrow-backed strings require pyarrow, the column is left as object.")
+    return series
+
+
+def compact_column(series: pd.Series, categories: float = CATEGORY_RATIO,
+                   arrow: bool = False, integers: bool = False) -> pd.Series:
+    """_Returns the column in the smallest dtype that holds its values._
+
+    Args:
+        series (pd.Series): _column_
+        categories (float, optional): _largest share of distinct values for a categorical_. Defaults to CATEGORY_RATIO.
+        arrow (bool, optional): _use Arrow-backed strings for other text columns_. Defaults to False.
+        integers (bool, optional): _downcast integers, arithmetic on them may then overflow_. Defaults to False.
+
+    Returns:
+        pd.Series: _compacted column, series itself if nothing applies_
+    """
+
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return series
+    if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+        return _downcast_integers(series) if integers else series
+    if pd.api.types.is_float_dtype(dtype) and dtype == np.float64:
+        return _downcast_floats(series)
+    if isinstance(dtype, pd.CategoricalDtype):
+        return series
+    if dtype == object or pd.api.types.is_string_dtype(dtype):
+        return _compact_text(series, categories, arrow)
+    return series
+
+
+def compact(df: pd.DataFrame, categories: float = CATEGORY_RATIO,
+            arrow: bool = False, integers: bool = False) -> tuple:
+    """_Compacts every column of df, see the module summary. df itself is
+        not modified, unchanged columns are shared with the result._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        categories (float, optional): _largest share of distinct values for a categorical_. Defaults to CATEGORY_RATIO.
+        arrow (bool, optional): _use Arrow-backed strings for other text columns_. Defaults to False.
+        integers (bool, optional): _downcast integers, arithmetic on them may then overflow_. Defaults to False.
+
+    Returns:
+        tuple: _(compacted DataFrame, report DataFrame with one row per column:
+                column, before, after, bytes_before, bytes_after, saved)_
+    """
+
+    result = df.copy(deep=False)
+    report = list()
+    for colIdx, column in enumerate(df.columns):
+        series = df.iloc[:, colIdx]
+        compacted = compact_column(series, categories, arrow, integers)
+        if compacted is not series:
+            result.isetitem(colIdx, compacted)
+        before = int(series.memory_usage(index=False, deep=True))
+        after = int(compacted.memory_usage(index=False, deep=True))
+        report.append([column, str(series.dtype), str(compacted.dtype), before, after, before - after])
+    return result, pd.DataFrame(report, columns=REPORT_COLUMNS)
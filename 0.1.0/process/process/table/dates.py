@@ -0,0 +1,187 @@
+from datetime import date
+from typing import Hashable, Union
+
+import numpy as np
+import pandas as pd
+from dateutil.parser import parse as dtparse
+
+
+"""[Dates Summary]
+    Date and time columns normalized to datetime64 without parsing every
+    cell with dateutil, which costs tens of microseconds a cell.
+
+    The format of a column is inferred once from a sample of its text: the
+    first of FORMATS to parse the most sampled values wins. The whole column
+    is then parsed with a single pd.to_datetime(format=...) call, and only
+    the values it could not parse are passed to dateutil (once per distinct
+    value). Values already holding dates (datetime, Timestamp) are kept.
+
+    Inferred formats are cached in FORMATS by (source, column), so the next
+    workbook from the same source skips the inference. A cached format that
+    no longer parses most of the sample is inferred again.
+
+    ```python
+    df = Table.normalize_dates(df, ["Hire Date", "Term Date"], source="roster")
+    dates.FORMATS[("roster", "Hire Date")]     # "%m/%d/%Y"
+    ```
+"""
+
+
+SAMPLE = 1000
+
+# [NOTE] Month first formats come first, as Console.get_date; dayfirst puts the
+# day first formats before them.
+MONTH_FIRST = [
+    "%m/%d/%Y", "%m/%d/%y", "%m-%d-%Y", "%m/%d/%Y %H:%M", "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %I:%M %p", "%m/%d/%Y %I:%M:%S %p"]
+DAY_FIRST = [
+    "%d/%m/%Y", "%d/%m/%y", "%d-%m-%Y", "%d.%m.%Y", "%d/%m/%Y %H:%M", "%d/%m/%Y %H:%M:%S"]
+OTHERS = [
+    "%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S.%f", "%Y/%m/%d", "%Y%m%d",
+    "%d-%b-%Y", "%d %b %Y", "%d %B %Y", "%b %d, %Y", "%B %d, %Y", "%b %d %Y", "%B %d %Y"]
+
+FORMATS = dict()
+
+
+def candidates(dayfirst: bool = False) -> list:
+    """_Formats tried by infer_format, in order of preference._"""
+
+    return DAY_FIRST + MONTH_FIRST + OTHERS if dayfirst else MONTH_FIRST + DAY_FIRST + OTHERS
+
+
+def _sample(text: pd.Series, sample: int) -> pd.Series:
+    return text if len(text) <= sample else text.sample(sample, random_state=0)
+
+
+def _parse(text: pd.Series, format: str) -> pd.Series:
+    return pd.to_datetime(text, format=format, errors="coerce")
+
+
+def infer_format(text: pd.Series, sample: int = SAMPLE, dayfirst: bool = False) -> Union[str, None]:
+    """_Infers the format of date strings from a sample of them._
+
+    Args:
+        text (pd.Series): _date strings_
+        sample (int, optional): _values sampled_. Defaults to SAMPLE.
+        dayfirst (bool, optional): _prefer day first formats (dd/mm/yyyy) when both parse_. Defaults to False.
+
+    Returns:
+        Union[str, None]: _strftime format, None if no format parses any value_
+    """
+
+    text = _sample(text.dropna(), sample).astype(str).str.strip()
+    text = text[text != ""]
+    best, parsed = None, 0
+    for format in candidates(dayfirst):
+        count = int(_parse(text, format).notna().sum())
+        if count > parsed:
+            best, parsed = format, count
+        if parsed == len(text):
+            break
+    return best
+
+
+def _fallback(text: pd.Series, dayfirst: bool) -> pd.Series:
+    """_dateutil, once per distinct value, NaT where it fails too._"""
+
+    parsed = dict()
+    for value in text.unique().tolist():
+        try:
+            parsed[value] = dtparse(value, dayfirst=dayfirst)
+        except (ValueError, OverflowError):
+            parsed[value] = pd.NaT
+    return pd.to_datetime(text.map(parsed), errors="coerce")
+
+
+def parse_dates(values: pd.Series, key: Hashable = None, format: str = None,
+                dayfirst: bool = False, sample: int = SAMPLE) -> pd.Series:
+    """_Parses a column of dates, see the module summary._
+
+    Args:
+        values (pd.Series): _dates as text, datetimes or both_
+        key (Hashable, optional): _key of the format in FORMATS, e.g. (source, column)_. Defaults to None, not cached.
+        format (str, optional): _strftime format, skips the inference_. Defaults to None.
+        dayfirst (bool, optional): _prefer day first formats_. Defaults to False.
+        sample (int, optional): _values sampled to infer the format_. Defaults to SAMPLE.
+
+    Returns:
+        pd.Series: _datetime64 values, NaT where a value is not a date_
+    """
+
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+
+    if pd.api.types.infer_dtype(values, skipna=True) in ["string", "empty"]:
+        isText = values.notna().to_numpy()
+    else:
+        isText = np.fromiter((isinstance(v, str) for v in values.tolist()), dtype=bool, count=len(values))
+    text = values[isText]
+
+    if format is None and key is not None and key in FORMATS:
+        format = FORMATS[key]
+        check = _sample(text, sample).astype(str).str.strip()
+        check = check[check != ""]
+        if _parse(check, format).notna().sum() * 2 < len(check):
+            format = None
+    if format is None and len(text):
+        format = infer_format(text, sample, dayfirst)
+        if key is not None and format is not None:
+            FORMATS[key] = format
+
+    # [NOTE] Positional throughout, the index of values may hold duplicates.
+    result = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[ns]")
+    if len(text):
+        parsed = _parse(text, format).to_numpy(dtype="datetime64[ns]") if format else result[:len(text)].copy()
+        failed = np.flatnonzero(np.isnat(parsed))
+        if len(failed):
+            # [NOTE] Padded values are stripped and parsed again, only those left go
+            # to dateutil. Blank cells are missing dates, not failures to parse.
+            retry = text.iloc[failed].astype(str).str.strip()
+            failed, retry = failed[(retry != "").to_numpy()], retry[retry != ""]
+            if format:
+                parsed[failed] = _parse(retry, format).to_numpy(dtype="datetime64[ns]")
+            left = np.isnat(parsed[failed])
+            if left.any():
+                parsed[failed[left]] = _fallback(retry[left], dayfirst).to_numpy(dtype="datetime64[ns]")
+        result[isText] = parsed
+
+    others = np.flatnonzero(~isText & values.notna().to_numpy())
+    others = others[np.fromiter((isinstance(v, (date, np.datetime64)) for v in values.iloc[others].tolist()),
+                                dtype=bool, count=len(others))]
+    if len(others):
+        result[others] = pd.to_datetime(values.iloc[others], errors="coerce").to_numpy(dtype="datetime64[ns]")
+    return pd.Series(result, index=values.index, name=values.name)
+
+
+def normalize_dates(df: pd.DataFrame, columns: Union[str, list], source: Hashable = None,
+                    format: str = None, dayfirst: bool = False, text: str = None,
+                    inplace: bool = False) -> pd.DataFrame:
+    """_Parses date columns of df, see the module summary._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        columns (Union[str, list]): _date columns_
+        source (Hashable, optional): _source of the table (workbook, list), formats are cached by (source, column)_. Defaults to None, not cached.
+        format (str, optional): _strftime format of every column, skips the inference_. Defaults to None.
+        dayfirst (bool, optional): _prefer day first formats_. Defaults to False.
+        text (str, optional): _strftime format to write the dates back as text, e.g. "%m/%d/%Y"_. Defaults to None, datetime64.
+        inplace (bool, optional): _replace the columns of df itself rather than of a shallow copy_. Defaults to False.
+
+    Returns:
+        pd.DataFrame: _pandas.DataFrame_
+    """
+
+    columns = list(columns) if type(columns) in [list, tuple] else [columns]
+    if not inplace:
+        df = df.copy(deep=False)
+
+    for column in columns:
+        values = df[column]
+        # [NOTE] Untitled tables must not share the formats cached under (None, column).
+        parsed = parse_dates(values, None if source is None else (source, column), format, dayfirst)
+        unparsed = int((parsed.isna() & values.notna() & (values.astype(str).str.strip() != "")).sum())
+        if unparsed:
+            print(f"{unparsed} values of {column} could not be parsed as dates.")
+        df[column] = parsed.dt.strftime(text) if text else parsed
+    return df
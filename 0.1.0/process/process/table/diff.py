@@ -0,0 +1,147 @@
+from dataclasses import dataclass, field
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from .index import DuplicateKey
+
+
+"""[Diff Summary]
+    Row and cell level differences between two snapshots of a table,
+    e.g. yesterday's and today's copy of a SharePoint workbook.
+
+    Rows are matched by key with a hash lookup, and each row is hashed
+    with pandas' vectorized hashing (pd.util.hash_pandas_object), so only
+    the rows whose hashes differ are compared cell by cell:
+
+    ```python
+    changes = Table.diff(yesterday, today, key="Employee ID")
+    changes.inserted    # rows of today that were not in yesterday
+    changes.deleted     # rows of yesterday that are not in today
+    changes.changed     # one row per changed cell: key, row, colIdx, column, before, after
+    ```
+
+    changed.row and changed.colIdx are positions in the new table, so the
+    change set can drive a write-back of the changed cells only.
+    Columns are compared when they are in both tables, added and removed
+    columns are listed on the change set.
+"""
+
+
+CHANGE_COLUMNS = ["row", "colIdx", "column", "before", "after"]
+
+
+@dataclass
+class ChangeSet:
+
+    key: list
+    inserted: pd.DataFrame
+    deleted: pd.DataFrame
+    changed: pd.DataFrame
+    columns_added: list = field(default_factory=list)
+    columns_removed: list = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.inserted) + len(self.deleted) + len(self.changed)
+
+    @property
+    def empty(self) -> bool:
+        return not len(self) and not self.columns_added and not self.columns_removed
+
+    def summary(self) -> dict:
+        """_Counts of the changes._
+
+        Returns:
+            dict: _{"inserted", "deleted", "changed_rows", "changed_cells",
+                    "columns_added", "columns_removed"}_
+        """
+
+        return {
+            "inserted": len(self.inserted),
+            "deleted": len(self.deleted),
+            "changed_rows": int(self.changed.row.nunique()),
+            "changed_cells": len(self.changed),
+            "columns_added": len(self.columns_added),
+            "columns_removed": len(self.columns_removed)}
+
+
+def _keys(df: pd.DataFrame, key: list) -> pd.Index:
+    if len(key) == 1:
+        keys = pd.Index(df[key[0]])
+    else:
+        keys = pd.MultiIndex.from_frame(df[key])
+    if not keys.is_unique:
+        raise DuplicateKey(keys[keys.duplicated()][0])
+    return keys
+
+
+def _hashes(df: pd.DataFrame) -> np.ndarray:
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def _differs(before: np.ndarray, after: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid="ignore"):
+        equal = np.asarray(before == after, dtype=bool)
+    return ~(equal | (pd.isna(before) & pd.isna(after)))
+
+
+def diff(old: pd.DataFrame, new: pd.DataFrame, key: Union[str, int, list]) -> ChangeSet:
+    """_Compares two snapshots of a table, see the module summary._
+
+    Args:
+        old (pd.DataFrame): _previous snapshot_
+        new (pd.DataFrame): _current snapshot_
+        key (Union[str, int, list]): _key column header, or a list of headers_
+
+    Raises:
+        DuplicateKey: _the key columns do not identify a single row in either table_
+
+    Returns:
+        ChangeSet: _inserted and deleted rows, changed cells_
+    """
+
+    key = list(key) if type(key) in [list, tuple] else [key]
+    common = [c for c in new.columns if c in old.columns]
+
+    positions = _keys(old, key).get_indexer(_keys(new, key))
+    matched = positions >= 0
+    kept = np.zeros(len(old), dtype=bool)
+    kept[positions[matched]] = True
+
+    newRows = np.flatnonzero(matched)
+    oldRows = positions[matched]
+
+    # [NOTE] Only rows whose hashes differ are compared cell by cell.
+    differ = _hashes(new[common]).take(newRows) != _hashes(old[common]).take(oldRows)
+    newRows, oldRows = newRows[differ], oldRows[differ]
+
+    changes = list()
+    for column in common:
+        colIdx = new.columns.get_loc(column)
+        before = old[column].iloc[oldRows].to_numpy(dtype=object)
+        after = new[column].iloc[newRows].to_numpy(dtype=object)
+        cells = _differs(before, after)
+        if cells.any():
+            rows = newRows[cells]
+            frame = new[key].iloc[rows].reset_index(drop=True)
+            frame["row"] = rows
+            frame["colIdx"] = colIdx
+            frame["column"] = column
+            frame["before"] = before[cells]
+            frame["after"] = after[cells]
+            changes.append(frame)
+
+    if changes:
+        changed = pd.concat(changes, ignore_index=True).sort_values(["row", "colIdx"], kind="stable")
+        changed = changed.reset_index(drop=True)
+    else:
+        changed = pd.DataFrame(columns=key + CHANGE_COLUMNS)
+
+    return ChangeSet(
+        key=key,
+        inserted=new.iloc[np.flatnonzero(~matched)],
+        deleted=old.iloc[np.flatnonzero(~kept)],
+        changed=changed,
+        columns_added=[c for c in new.columns if not c in old.columns],
+        columns_removed=[c for c in old.columns if not c in new.columns])
@@ -0,0 +1,113 @@
+from typing import Any, Generator
+
+import numpy as np
+import pandas as pd
+
+
+"""[Export Summary]
+    Row export for Table.dataframe2matrix and the Excel worksheet loader.
+
+    Each column is read out of the DataFrame once as a numpy array. Numeric
+    and boolean columns are used as is, rows are sliced out of them as views.
+    All other columns (strings, datetimes, categoricals, extension types) are
+    boxed into an object array once so that cells come back as the same python
+    objects df.loc[idx].to_list() would return. Python objects are only created
+    for the rows of the chunk being handed out, which keeps the generator mode
+    at a constant memory cost regardless of the size of the DataFrame.
+"""
+
+
+CHUNKSIZE = 10000
+_NATIVE_KINDS = "iufb" # int, unsigned, float, bool
+_KEEP = object() # sentinel, missing values are returned as found
+
+
+def column_arrays(df: pd.DataFrame) -> list:
+    """_Reads every column of df into a numpy array, once._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+
+    Returns:
+        list: _one numpy.ndarray per column_
+    """
+
+    arrays = list()
+    for i in range(df.shape[1]):
+        column = df.iloc[:, i]
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind in _NATIVE_KINDS:
+            arrays.append(column.to_numpy())
+        else:
+            arrays.append(column.to_numpy(dtype=object))
+    return arrays
+
+
+def _rows(arrays: list, start: int, stop: int, na_value: Any) -> list:
+    columns = list()
+    for array in arrays:
+        cells = array[start:stop]
+        if na_value is not _KEEP and cells.dtype.kind in "fO":
+            missing = pd.isna(cells)
+            if missing.any():
+                cells = cells.astype(object)
+                cells[missing] = na_value
+        columns.append(cells.tolist())
+    return [list(row) for row in zip(*columns)]
+
+
+def iter_matrix(df: pd.DataFrame, chunksize: int = CHUNKSIZE,
+                na_value: Any = _KEEP) -> Generator[list, None, None]:
+    """_Yields the rows of df as nested lists, chunksize rows at a time._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        chunksize (int, optional): _rows per chunk_. Defaults to CHUNKSIZE.
+        na_value (Any, optional): _replacement for missing values, e.g. None for
+                                   COM. Missing values are kept when not passed_.
+
+    Yields:
+        list: _[[row], [row], ...]_
+    """
+
+    arrays = column_arrays(df)
+    length = len(df)
+    if not arrays:
+        # [NOTE] A frame without columns still has rows.
+        for start in range(0, length, chunksize):
+            yield [list() for _ in range(start, min(start + chunksize, length))]
+        return
+
+    for start in range(0, length, chunksize):
+        yield _rows(arrays, start, min(start + chunksize, length), na_value)
+
+
+def iter_rows(df: pd.DataFrame, chunksize: int = CHUNKSIZE,
+              na_value: Any = _KEEP) -> Generator[list, None, None]:
+    """_Yields the rows of df one at a time, materializing chunksize rows at a time._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        chunksize (int, optional): _rows per chunk_. Defaults to CHUNKSIZE.
+        na_value (Any, optional): _replacement for missing values_.
+
+    Yields:
+        list: _[row]_
+    """
+
+    for chunk in iter_matrix(df, chunksize, na_value):
+        yield from chunk
+
+
+def to_matrix(df: pd.DataFrame, na_value: Any = _KEEP) -> list:
+    """_Converts a dataframe into a nested matrix._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        na_value (Any, optional): _replacement for missing values_.
+
+    Returns:
+        list: _[[row], [row], ...]_
+    """
+
+    return _rows(column_arrays(df), 0, len(df), na_value) if df.shape[1] \
+        else [list() for _ in range(len(df))]
@@ -0,0 +1,354 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+
+"""[Fuzzy Summary]
+    Fuzzy matching of records between two tables whose names and spellings
+    differ, e.g. the person records of two SharePoint workbooks.
+
+    Comparing every pair is out of the question at 100k x 100k rows, so
+    candidate pairs are first pruned by blocking on one column:
+
+        : soundex   records whose words have the same phonetic codes
+                    ("Jon Smyth" and "John Smith")
+        : ngram     records sharing one of their rarest character trigrams.
+                    Only the first len - ceil(threshold * len) + 1 trigrams
+                    of each record are indexed (prefix filtering): any pair
+                    scoring at least threshold on the blocking column shares
+                    one of them, so no such pair is missed. Pairs whose
+                    lengths or shared grams cannot reach the threshold are
+                    dropped before scoring (PPJoin length and positional
+                    filters).
+
+    Blocks holding more than MAX_BLOCK pairs (very common codes) are
+    skipped. The left rows are matched CHUNKSIZE at a time: their candidates
+    are gathered from the blocks and scored with the trigram Jaccard
+    similarity of each column, weighted, computed with numpy over whole
+    arrays of pairs. Only the pairs over the threshold are kept, so memory
+    is bounded by a chunk's candidates. From THRESHOLD left rows, chunks
+    are matched on a process pool.
+
+    Text is compared lower case, without accents or punctuation, with its
+    words sorted so that "Smith, John" and "John Smith" are the same.
+
+    ```python
+    pairs = Table.fuzzy_match(slate, roster, on=["Name", "Dept"],
+                              right_on=["Employee", "Department"],
+                              threshold=0.8, weights=[0.8, 0.2])
+    pairs.head()    # left, right (index labels), score
+    ```
+"""
+
+
+Q = 3
+MAX_BLOCK = 1_000_000
+CHUNKSIZE = 1000
+THRESHOLD = 5000
+BLOCKING = ["soundex", "ngram"]
+
+_SOUNDEX = {c: digit for letters, digit in [
+    ("bfpv", "1"), ("cgjkqsxz", "2"), ("dt", "3"), ("l", "4"), ("mn", "5"), ("r", "6")]
+    for c in letters}
+
+# [NOTE] Set in each worker by _init, the grams and blocks are sent once per
+# worker rather than per chunk.
+_STATE = None
+
+
+class UnknownBlocking(Exception):
+    """
+    _The blocking method is not one of BLOCKING._
+    """
+    pass
+
+
+def soundex(word: str) -> str:
+    """_American Soundex code of a word, "" if it has no letters._
+
+    Args:
+        word (str): _word_
+
+    Returns:
+        str: _letter and three digits, e.g. Robert R163_
+    """
+
+    word = "".join(c for c in word.lower() if "a" <= c <= "z")
+    if not word:
+        return ""
+    code, last = word[0].upper(), _SOUNDEX.get(word[0], "")
+    for c in word[1:]:
+        digit = _SOUNDEX.get(c, "")
+        if digit and digit != last:
+            code += digit
+            if len(code) == 4:
+                break
+        # [NOTE] h and w do not separate letters with the same code, vowels do.
+        if not c in "hw":
+            last = digit
+    return code.ljust(4, "0")
+
+
+def normalize(values: pd.Series) -> pd.Series:
+    """_Lower case text without accents or punctuation, NaN as ""._"""
+
+    return (values.astype(object).where(values.notna(), "").astype(str)
+            .str.normalize("NFKD").str.encode("ascii", "ignore").str.decode("ascii")
+            .str.lower().str.replace(r"['`]", "", regex=True)
+            .str.replace(r"[^a-z0-9]+", " ", regex=True).str.strip())
+
+
+def _grams(texts: list, q: int) -> list:
+    grams = list()
+    for text in texts:
+        # [NOTE] Words are sorted, "Smith, Jon" and "Jon Smith" have the same grams.
+        text = f" {' '.join(sorted(text.split()))} " if text else ""
+        grams.append(list({text[i:i + q] for i in range(len(text) - q + 1)}))
+    return grams
+
+
+def _csr(left: pd.Series, right: pd.Series, q: int) -> tuple:
+    """_Trigrams of both sides as (offsets, ids) per side, rarest first._
+
+    Gram ids are frequency ranks across both sides, 0 the rarest, and each
+    record's grams are sorted by id.
+    """
+
+    sides = list()
+    for values in [left, right]:
+        codes, uniques = pd.factorize(normalize(values))
+        grams = _grams(uniques.tolist(), q)
+        lengths = np.array([len(g) for g in grams], dtype=np.int64)[codes]
+        sides.append((codes, grams, lengths))
+
+    flat = [list(chain.from_iterable(grams[c] for c in codes)) for codes, grams, _ in sides]
+    ids, vocabulary = pd.factorize(pd.Index(flat[0] + flat[1]))
+    rank = np.empty(len(vocabulary), dtype=np.int64)
+    rank[np.argsort(np.bincount(ids, minlength=len(vocabulary)), kind="stable")] = np.arange(len(vocabulary))
+    ids = rank[ids]
+
+    csr, start = list(), 0
+    for codes, _, lengths in sides:
+        offsets = np.zeros(len(codes) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        values = ids[start:start + offsets[-1]]
+        records = np.repeat(np.arange(len(codes)), lengths)
+        csr.append((offsets, values[np.lexsort((values, records))]))
+        start += offsets[-1]
+    return tuple(csr)
+
+
+def _jaccard(left: tuple, right: tuple, li: np.ndarray, ri: np.ndarray) -> np.ndarray:
+    """_Trigram Jaccard similarity of the pairs (li[k], ri[k]), without python loops._"""
+
+    def explode(side: tuple, rows: np.ndarray) -> tuple:
+        offsets, ids = side
+        lengths = (offsets[1:] - offsets[:-1])[rows]
+        pairs = np.repeat(np.arange(len(rows)), lengths)
+        within = np.arange(len(pairs)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return lengths, pairs, ids[offsets[rows].repeat(lengths) + within]
+
+    lengthsL, pairsL, idsL = explode(left, li)
+    lengthsR, pairsR, idsR = explode(right, ri)
+    width = max(int(idsL.max(initial=0)), int(idsR.max(initial=0))) + 1
+    found = np.isin(pairsL * width + idsL, pairsR * width + idsR, assume_unique=True)
+    shared = np.bincount(pairsL[found], minlength=len(li))
+    union = lengthsL + lengthsR - shared
+    return np.divide(shared, union, out=np.zeros(len(li)), where=union > 0)
+
+
+def _score(columns: list, weights: np.ndarray, li: np.ndarray, ri: np.ndarray) -> np.ndarray:
+    scores = np.zeros(len(li))
+    for (left, right), weight in zip(columns, weights):
+        scores += weight * _jaccard(left, right, li, ri)
+    return scores
+
+
+def _soundex_keys(values: pd.Series) -> tuple:
+    codes, uniques = pd.factorize(normalize(values))
+    # [NOTE] One key per record, the sorted codes of its words: a single shared
+    # word ("John") would put most of the table in one block.
+    keys = np.array([" ".join(sorted({soundex(word) for word in text.split()} - {""}))
+                     for text in uniques.tolist()], dtype=object)[codes]
+    rows = np.flatnonzero(keys != "")
+    return keys[rows].tolist(), rows, np.zeros(len(rows), dtype=np.int64)
+
+
+def _prefix_keys(side: tuple, threshold: float) -> tuple:
+    offsets, ids = side
+    lengths = offsets[1:] - offsets[:-1]
+    prefix = lengths - np.ceil(threshold * lengths).astype(np.int64) + 1
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    positions = np.arange(len(ids)) - offsets[rows]
+    kept = positions < prefix[rows]
+    return ids[kept], rows[kept], positions[kept]
+
+
+def _blocks(left: pd.DataFrame, right: pd.DataFrame, block: str, rightBlock: str,
+            blocking: list, threshold: float, grams: tuple, maxBlock: int) -> list:
+    """_[(method, left (keys, rows, positions), right (keys, rows, positions))] without the oversized blocks._"""
+
+    blocks, skipped = list(), 0
+    for method in blocking:
+        if method == "soundex":
+            keysL, rowsL, positionsL = _soundex_keys(left[block])
+            keysR, rowsR, positionsR = _soundex_keys(right[rightBlock])
+            keys, _ = pd.factorize(pd.Index(keysL + keysR))
+            keysL, keysR = keys[:len(keysL)], keys[len(keysL):]
+        elif method == "ngram":
+            keysL, rowsL, positionsL = _prefix_keys(grams[0], threshold)
+            keysR, rowsR, positionsR = _prefix_keys(grams[1], threshold)
+        else:
+            raise UnknownBlocking(method)
+
+        width = max(int(keysL.max(initial=-1)), int(keysR.max(initial=-1))) + 1
+        sizes = np.bincount(keysL, minlength=width) * np.bincount(keysR, minlength=width)
+        skipped += int((sizes > maxBlock).sum())
+        keptL, keptR = sizes[keysL] <= maxBlock, sizes[keysR] <= maxBlock
+        # [NOTE] Left entries are in row order (sliced per chunk), right entries
+        # are in key order (searched per chunk).
+        orderL = np.flatnonzero(keptL)[np.argsort(rowsL[keptL], kind="stable")]
+        orderR = np.flatnonzero(keptR)[np.argsort(keysR[keptR], kind="stable")]
+        blocks.append((method, (keysL[orderL], rowsL[orderL], positionsL[orderL]),
+                       (keysR[orderR], rowsR[orderR], positionsR[orderR])))
+
+    if skipped:
+        print(f"{skipped} blocks over {maxBlock} pairs were skipped, see fuzzy.MAX_BLOCK.")
+    return blocks
+
+
+def _filter(li: np.ndarray, ri: np.ndarray, positionsL: np.ndarray, positionsR: np.ndarray,
+            lengths: tuple, threshold: float, size: int) -> np.ndarray:
+    """_Pair codes sharing prefix grams that can still reach threshold (PPJoin filters)._"""
+
+    lengthsL, lengthsR = lengths[0][li], lengths[1][ri]
+    kept = (lengthsR >= threshold * lengthsL) & (lengthsL >= threshold * lengthsR)
+    codes = li[kept].astype(np.int64) * size + ri[kept]
+    order = np.argsort(codes, kind="stable")
+    codes, positionsL, positionsR = codes[order], positionsL[kept][order], positionsR[kept][order]
+    if not len(codes):
+        return codes
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    shared = np.diff(np.r_[starts, len(codes)])
+    codes = codes[starts]
+    x, y = lengths[0][codes // size], lengths[1][codes % size]
+    # [NOTE] Any other shared gram comes after the last one found in both records,
+    # which bounds the overlap. A Jaccard of t needs t / (1 + t) * (|x| + |y|).
+    bound = shared + np.minimum(x - np.maximum.reduceat(positionsL, starts) - 1,
+                                y - np.maximum.reduceat(positionsR, starts) - 1)
+    return codes[bound >= threshold / (1 + threshold) * (x + y) - 1e-9]
+
+
+def _candidates(state: tuple, start: int, stop: int) -> tuple:
+    """_Candidate pairs of the left rows [start, stop), as (left rows, right rows)._"""
+
+    _, _, blocks, lengths, threshold, size = state
+    codes = list()
+    for method, (keysL, rowsL, positionsL), (keysR, rowsR, positionsR) in blocks:
+        first, last = np.searchsorted(rowsL, [start, stop])
+        keys = keysL[first:last]
+        begin = np.searchsorted(keysR, keys, side="left")
+        counts = np.searchsorted(keysR, keys, side="right") - begin
+        found = np.repeat(begin - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        li = np.repeat(rowsL[first:last], counts)
+        if method == "ngram":
+            codes.append(_filter(li, rowsR[found], np.repeat(positionsL[first:last], counts),
+                                 positionsR[found], lengths, threshold, size))
+        else:
+            codes.append(li.astype(np.int64) * size + rowsR[found])
+    if not codes:
+        codes = np.array([], dtype=np.int64)
+    else:
+        codes = np.unique(np.concatenate(codes)) if len(codes) > 1 else codes[0]
+    return codes // max(size, 1), codes % max(size, 1)
+
+
+def _match(state: tuple, start: int, stop: int) -> tuple:
+    """_Scores the candidates of the left rows [start, stop), keeping those over the threshold._"""
+
+    columns, weights, _, _, threshold, _ = state
+    li, ri = _candidates(state, start, stop)
+    scores = _score(columns, weights, li, ri)
+    # [NOTE] A small tolerance, equal weights of 1/3 do not add up to exactly 1.
+    kept = scores >= threshold - 1e-9
+    return li[kept], ri[kept], scores[kept]
+
+
+def _init(state: tuple):
+    global _STATE
+    _STATE = state
+
+
+def _match_chunk(start: int, stop: int) -> tuple:
+    """_Worker: matches a chunk of left rows._"""
+
+    return _match(_STATE, start, stop)
+
+
+def fuzzy_match(left: pd.DataFrame, right: pd.DataFrame, on: Union[str, list],
+                right_on: Union[str, list] = None, threshold: float = 0.8,
+                weights: list = None, block: str = None,
+                blocking: Union[str, list] = BLOCKING, best: bool = False,
+                workers: int = None, chunksize: int = CHUNKSIZE,
+                maxBlock: int = MAX_BLOCK) -> pd.DataFrame:
+    """_Matches the records of left to the records of right, see the module summary._
+
+    Args:
+        left (pd.DataFrame): _pandas.DataFrame_
+        right (pd.DataFrame): _pandas.DataFrame_
+        on (Union[str, list]): _column(s) of left compared_
+        right_on (Union[str, list], optional): _column(s) of right compared, in the same order_. Defaults to on.
+        threshold (float, optional): _lowest score kept, 0 to 1_. Defaults to 0.8.
+        weights (list, optional): _weight of each column_. Defaults to equal weights.
+        block (str, optional): _column of left blocked on_. Defaults to the first column of on.
+        blocking (Union[str, list], optional): _soundex and/or ngram_. Defaults to BLOCKING.
+        best (bool, optional): _keep only the best match of each left record_. Defaults to False.
+        workers (int, optional): _worker processes_. Defaults to os.cpu_count().
+        chunksize (int, optional): _left rows matched at a time_. Defaults to CHUNKSIZE.
+        maxBlock (int, optional): _largest block, in pairs_. Defaults to MAX_BLOCK.
+
+    Raises:
+        UnknownBlocking: _as named_
+
+    Returns:
+        pd.DataFrame: _left and right index labels and score, best scores first for each left record_
+    """
+
+    on = list(on) if type(on) in [list, tuple] else [on]
+    right_on = on if right_on is None else list(right_on) if type(right_on) in [list, tuple] else [right_on]
+    blocking = [blocking] if isinstance(blocking, str) else list(blocking)
+    weights = np.ones(len(on)) if weights is None else np.asarray(weights, dtype=float)
+    weights = weights / weights.sum()
+    block = on[0] if block is None else block
+    rightBlock = right_on[on.index(block)] if block in on else block
+
+    columns = [_csr(left[l], right[r], Q) for l, r in zip(on, right_on)]
+    grams = columns[on.index(block)] if block in on else _csr(left[block], right[rightBlock], Q)
+    lengths = tuple(offsets[1:] - offsets[:-1] for offsets, _ in grams)
+    state = (columns, weights, _blocks(left, right, block, rightBlock, blocking, threshold, grams, maxBlock),
+             lengths, threshold, len(right))
+
+    bounds = [(start, min(start + chunksize, len(left))) for start in range(0, len(left), chunksize)]
+    workers = workers or os.cpu_count() or 1
+    if len(left) < THRESHOLD or workers == 1:
+        results = [_match(state, start, stop) for start, stop in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init, initargs=(state,)) as executor:
+            results = list(executor.map(_match_chunk, *zip(*bounds)))
+
+    li, ri, scores = [np.concatenate(r) for r in zip(*results)] if results else [np.array([], dtype=np.int64)] * 3
+    order = np.lexsort((-scores, li))
+    li, ri, scores = li[order], ri[order], scores[order]
+    if best:
+        first = np.r_[True, li[1:] != li[:-1]] if len(li) else np.array([], dtype=bool)
+        li, ri, scores = li[first], ri[first], scores[first]
+
+    return pd.DataFrame({
+        "left": left.index.take(li),
+        "right": right.index.take(ri),
+        "score": scores.astype(float).round(6)})
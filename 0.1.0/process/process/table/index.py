@@ -0,0 +1,156 @@
+from typing import Any, Union
+
+import numpy as np
+import pandas as pd
+
+
+"""[Index Summary]
+    Hash index over one or more key columns of a table.
+
+    Table.change_value and Table.replace_row take row numbers, while
+    processes update rows by employee ID, ticket number, etc. A KeyIndex maps
+    each key to its row number with a dict, so finding a row costs O(1)
+    instead of a scan of the key column. Keys spanning several columns are
+    stored as tuples.
+
+    Passing the index to Table.add_row, Table.replace_row and Table.filter_rows
+    keeps it in sync with the table they return:
+
+    ```python
+    index = Table.index(df, "Employee ID")
+    df = Table.add_row(df, row, index=index)
+    df = Table.upsert(df, index, row)
+    df = Table.update_by_key(df, index, ids, "Status", "Terminated")
+    ```
+"""
+
+
+class DuplicateKey(Exception):
+    """
+    _The key columns do not identify a single row._
+    """
+    pass
+
+
+class KeyNotFound(Exception):
+    """
+    _The key is not in the index._
+    """
+    pass
+
+
+class KeyIndex:
+    """
+    _Maps the keys of a table to their row numbers._
+    """
+
+    def __init__(self, df: pd.DataFrame, keys: Union[str, int, list]):
+        """
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+            keys (Union[str, int, list]): _key column header, or a list of headers_
+
+        Raises:
+            DuplicateKey: _the keys are not unique_
+        """
+
+        self.keys = list(keys) if type(keys) in [list, tuple] else [keys]
+        self.rebuild(df)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._positions
+
+    def _column_keys(self, df: pd.DataFrame) -> list:
+        if len(self.keys) == 1:
+            return df[self.keys[0]].tolist()
+        return list(zip(*[df[k].tolist() for k in self.keys]))
+
+    def rebuild(self, df: pd.DataFrame):
+        """_Rebuilds the index from the key columns of df._
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+
+        Raises:
+            DuplicateKey: _the keys are not unique_
+        """
+
+        self._keyIdxs = [df.columns.get_loc(k) for k in self.keys]
+        keys = self._column_keys(df)
+        self._positions = dict(zip(keys, range(len(keys))))
+        if len(self._positions) != len(keys):
+            duplicated = pd.Series(keys).duplicated()
+            raise DuplicateKey(keys[int(np.flatnonzero(duplicated.to_numpy())[0])])
+
+    def key(self, value: list) -> Any:
+        """_Returns the key of a row given as a list of values._
+
+        Args:
+            value (list): _one value per column_
+
+        Returns:
+            Any: _key, a tuple for multiple key columns_
+        """
+
+        if len(self._keyIdxs) == 1:
+            return value[self._keyIdxs[0]]
+        return tuple(value[i] for i in self._keyIdxs)
+
+    def lookup(self, key: Any) -> int:
+        """_Returns the row number of key._
+
+        Args:
+            key (Any): _key, a tuple for multiple key columns_
+
+        Raises:
+            KeyNotFound: _as named_
+
+        Returns:
+            int: _row number_
+        """
+
+        try:
+            return self._positions[key]
+        except KeyError:
+            raise KeyNotFound(key)
+
+    def positions(self, keys: list) -> np.ndarray:
+        """_Returns the row numbers of many keys, -1 for keys not in the index._
+
+        Args:
+            keys (list): _keys_
+
+        Returns:
+            np.ndarray: _row numbers_
+        """
+
+        get = self._positions.get
+        return np.fromiter((get(k, -1) for k in keys), dtype=np.int64, count=len(keys))
+
+    def add(self, key: Any, position: int):
+        """_Adds a key for a row appended to the end of the table._
+
+        Raises:
+            DuplicateKey: _the key is already in the index_
+        """
+
+        if key in self._positions:
+            raise DuplicateKey(key)
+        self._positions[key] = position
+
+    def replace(self, position: int, old: Any, new: Any):
+        """_Moves the row number from an old key to a new key._
+
+        Raises:
+            DuplicateKey: _the new key belongs to another row_
+        """
+
+        if old == new:
+            return
+        if new in self._positions:
+            raise DuplicateKey(new)
+        del self._positions[old]
+        self._positions[new] = position
@@ -0,0 +1,365 @@
+from dataclasses import dataclass
+from typing import Any, Union
+
+import numpy as np
+import pandas as pd
+
+from .masks import build_mask
+from .columns import column_values, position
+from .patch import assign
+
+
+"""[Journal Summary]
+    Undo/redo for Table operations without keeping copies of the DataFrame.
+
+    Each operation applied through an EditJournal is recorded as a delta
+    holding only what the operation changed: the old and new values of the
+    changed cells, the inserted or removed rows, or the added or dropped
+    columns. Deltas are applied to the journal's DataFrame in place where
+    pandas allows it, and reverted in reverse order on undo. Rows and columns
+    are removed with DataFrame.take, so the journal always owns its DataFrame. The recorded
+    deltas can also be replayed onto a fresh copy of the base DataFrame,
+    e.g. after reloading the same file from SharePoint.
+
+    ```python
+    journal = Table.journal(df)
+    journal.add_column("Status", "Open", colIdx=2)
+    journal.change_value("Status", 10, "Closed")
+    journal.filter_rows(Where("Status", "==", "Closed"))
+    journal.undo()
+    df = journal.df
+    ```
+"""
+
+
+class NothingToUndo(Exception):
+    """
+    _The journal has no applied edits left._
+    """
+    pass
+
+
+class NothingToRedo(Exception):
+    """
+    _The journal has no undone edits left._
+    """
+    pass
+
+
+@dataclass
+class CellsChanged:
+
+    rows: np.ndarray
+    columns: list
+    before: list
+    after: list
+    dtypes: list
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        for colIdx, values in zip(self.columns, self.after):
+            assign(df, colIdx, self.rows, values)
+        return df
+
+    def revert(self, df: pd.DataFrame) -> pd.DataFrame:
+        for colIdx, values, dtype in zip(self.columns, self.before, self.dtypes):
+            assign(df, colIdx, self.rows, values)
+            if df.dtypes.iloc[colIdx] != dtype:
+                df.isetitem(colIdx, df.iloc[:, colIdx].astype(dtype))
+        return df
+
+    @property
+    def nbytes(self) -> int:
+        return sum(np.asarray(v).nbytes for v in self.before + self.after) + self.rows.nbytes
+
+
+@dataclass
+class RowsInserted:
+
+    rowIdx: int
+    rows: pd.DataFrame
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        return pd.concat([df.iloc[:self.rowIdx], self.rows, df.iloc[self.rowIdx:]])
+
+    def revert(self, df: pd.DataFrame) -> pd.DataFrame:
+        keep = np.ones(len(df), dtype=bool)
+        keep[self.rowIdx:self.rowIdx + len(self.rows)] = False
+        return df.take(np.flatnonzero(keep))
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.rows.memory_usage(index=True).sum())
+
+
+@dataclass
+class RowsRemoved:
+
+    positions: np.ndarray
+    rows: pd.DataFrame
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        keep = np.ones(len(df), dtype=bool)
+        keep[self.positions] = False
+        return df.take(np.flatnonzero(keep))
+
+    def revert(self, df: pd.DataFrame) -> pd.DataFrame:
+        # [NOTE] The removed rows are put back where they were in a single take.
+        length = len(df) + len(self.rows)
+        order = np.empty(length, dtype=np.int64)
+        kept = np.ones(length, dtype=bool)
+        kept[self.positions] = False
+        order[kept] = np.arange(len(df))
+        order[self.positions] = len(df) + np.arange(len(self.rows))
+        return pd.concat([df, self.rows]).take(order)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.rows.memory_usage(index=True).sum()) + self.positions.nbytes
+
+
+@dataclass
+class ColumnAdded:
+
+    colIdx: int
+    header: Union[str, int]
+    values: np.ndarray
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        df.insert(self.colIdx, self.header, self.values, allow_duplicates=True)
+        return df
+
+    def revert(self, df: pd.DataFrame) -> pd.DataFrame:
+        keep = np.ones(df.shape[1], dtype=bool)
+        keep[self.colIdx] = False
+        return df.take(np.flatnonzero(keep), axis=1)
+
+    @property
+    def nbytes(self) -> int:
+        return np.asarray(self.values).nbytes
+
+
+@dataclass
+class ColumnsRemoved:
+
+    positions: np.ndarray
+    columns: pd.DataFrame
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        keep = np.ones(df.shape[1], dtype=bool)
+        keep[self.positions] = False
+        return df.take(np.flatnonzero(keep), axis=1)
+
+    def revert(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy(deep=False)
+        for i, colIdx in enumerate(self.positions):
+            df.insert(int(colIdx), self.columns.columns[i], self.columns.iloc[:, i], allow_duplicates=True)
+        return df
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.columns.memory_usage(index=False).sum())
+
+
+@dataclass
+class ColumnsReordered:
+
+    order: np.ndarray
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.take(self.order, axis=1)
+
+    def revert(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.take(np.argsort(self.order), axis=1)
+
+    @property
+    def nbytes(self) -> int:
+        return self.order.nbytes
+
+
+@dataclass
+class Deltas:
+
+    deltas: list
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        for delta in self.deltas:
+            df = delta.apply(df)
+        return df
+
+    def revert(self, df: pd.DataFrame) -> pd.DataFrame:
+        for delta in reversed(self.deltas):
+            df = delta.revert(df)
+        return df
+
+    @property
+    def nbytes(self) -> int:
+        return sum(d.nbytes for d in self.deltas)
+
+
+class EditJournal:
+    """
+    _Applies Table operations to a DataFrame and records each one as a delta._
+    """
+
+    def __init__(self, df: pd.DataFrame, copy: bool = True):
+        """
+        Args:
+            df (pd.DataFrame): _base DataFrame_
+            copy (bool, optional): _False hands ownership of df to the journal,
+                                    which then edits it in place_. Defaults to True.
+        """
+
+        self.df = df.copy() if copy else df
+        self._done = list()
+        self._undone = list()
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    @property
+    def deltas(self) -> list:
+        """
+        _Applied deltas, oldest first._
+        """
+
+        return list(self._done)
+
+    def record(self, delta) -> pd.DataFrame:
+        """_Applies a delta and records it. Recording clears the redo history._
+
+        Args:
+            delta (_delta_): _one of the delta classes of this module_
+
+        Returns:
+            pd.DataFrame: _the edited DataFrame_
+        """
+
+        self.df = delta.apply(self.df)
+        self._done.append(delta)
+        self._undone.clear()
+        return self.df
+
+    def undo(self) -> pd.DataFrame:
+        if not self._done:
+            raise NothingToUndo
+        delta = self._done.pop()
+        self.df = delta.revert(self.df)
+        self._undone.append(delta)
+        return self.df
+
+    def redo(self) -> pd.DataFrame:
+        if not self._undone:
+            raise NothingToRedo
+        delta = self._undone.pop()
+        self.df = delta.apply(self.df)
+        self._done.append(delta)
+        return self.df
+
+    def replay(self, df: pd.DataFrame) -> pd.DataFrame:
+        """_Applies the recorded deltas, oldest first, onto a copy of df._
+
+        Args:
+            df (pd.DataFrame): _a fresh copy of the base DataFrame_
+
+        Returns:
+            pd.DataFrame: _the edited DataFrame_
+        """
+
+        df = df.copy()
+        for delta in self._done:
+            df = delta.apply(df)
+        return df
+
+    def memory_usage(self) -> int:
+        """_Bytes held by the recorded deltas, applied and undone._
+
+        Returns:
+            int: _bytes_
+        """
+
+        return sum(d.nbytes for d in self._done + self._undone)
+
+    def _colIdx(self, column: Union[str, int]) -> int:
+        if type(column) == int and not column in self.df.columns:
+            return column
+        return self.df.columns.get_loc(column)
+
+    def _column_values(self, value: Any) -> np.ndarray:
+        values = column_values(self.df, value)
+        if pd.api.types.is_list_like(values):
+            return np.asarray(values)
+        return np.full(len(self.df), values, dtype=object if type(values) == str else None)
+
+    def change_value(self, column: Union[str, int], row: int, value: Any) -> pd.DataFrame:
+        colIdx = self._colIdx(column)
+        rows = np.array([row])
+        return self.record(CellsChanged(
+            rows, [colIdx],
+            before=[self.df.iloc[rows, colIdx].to_numpy()],
+            after=[np.array([value], dtype=object)],
+            dtypes=[self.df.dtypes.iloc[colIdx]]))
+
+    def replace_row(self, value: list, rowIdx: int) -> pd.DataFrame:
+        if len(value) != self.df.shape[1]:
+            print(f"The length of the value parameter must match the length of df.columns: {self.df.shape[1]}")
+            return self.df
+        columns = list(range(self.df.shape[1]))
+        rows = np.array([rowIdx])
+        return self.record(CellsChanged(
+            rows, columns,
+            before=[self.df.iloc[rows, c].to_numpy() for c in columns],
+            after=[np.array([v], dtype=object) for v in value],
+            dtypes=list(self.df.dtypes)))
+
+    def add_row(self, value: list, rowIdx: int = None, after: bool = True) -> pd.DataFrame:
+        return self.add_rows([value], rowIdx, after)
+
+    def add_rows(self, values: list, rowIdx: int = None, after: bool = True) -> pd.DataFrame:
+        if rowIdx is None:
+            rowIdx = len(self.df)
+        else:
+            rowIdx = min(rowIdx + 1 if after else rowIdx, len(self.df))
+        rows = pd.DataFrame(values, columns=self.df.columns)
+        return self.record(RowsInserted(rowIdx, rows))
+
+    def filter_rows(self, selections: Any, out: bool = True) -> pd.DataFrame:
+        mask = build_mask(self.df, selections)
+        removed = mask if out else ~mask
+        positions = np.flatnonzero(removed)
+        return self.record(RowsRemoved(positions, self.df.take(positions)))
+
+    def add_column(self, header: Union[str, int], value: Any, colIdx: int = None,
+                   after: bool = True, overwrite: bool = False) -> pd.DataFrame:
+        values = self._column_values(value)
+        if header in self.df.columns:
+            if not overwrite:
+                print("To overwrite an existing column, please change the overwrite parameter to True.")
+                return self.df
+            existing = self.df.columns.get_loc(header)
+            rows = np.arange(len(self.df))
+            return self.record(CellsChanged(
+                rows, [existing],
+                before=[self.df.iloc[:, existing].to_numpy()],
+                after=[values],
+                dtypes=[self.df.dtypes.iloc[existing]]))
+
+        return self.record(ColumnAdded(position(self.df, colIdx, after), header, values))
+
+    def filter_columns(self, selections: list, out: bool = True) -> pd.DataFrame:
+        selected = np.zeros(self.df.shape[1], dtype=bool)
+        selected[[self._colIdx(c) for c in selections]] = True
+        positions = np.flatnonzero(selected if out else ~selected)
+        return self.record(ColumnsRemoved(positions, self.df.take(positions, axis=1)))
+
+    def reorder_columns(self, columns: list) -> pd.DataFrame:
+        # [NOTE] Columns left out of the new order are dropped, both steps
+        # are recorded as one edit.
+        order = [self._colIdx(c) for c in columns]
+        dropped = np.setdiff1d(np.arange(self.df.shape[1]), order)
+        if not len(dropped):
+            return self.record(ColumnsReordered(np.array(order)))
+
+        removed = ColumnsRemoved(dropped, self.df.take(dropped, axis=1))
+        remaining = np.delete(np.arange(self.df.shape[1]), dropped)
+        order = np.searchsorted(remaining, order)
+        return self.record(Deltas([removed, ColumnsReordered(order)]))
@@ -0,0 +1,154 @@
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from .index import DuplicateKey
+
+
+"""[Lookup Summary]
+    VLOOKUP/XLOOKUP between two tables in memory, in place of the Excel
+    macros driven through Excel.exec_macro.
+
+    The key column(s) of the lookup table are hashed once into a pandas
+    Index and every lookup value is resolved with a single get_indexer
+    call. Any number of columns are returned at once. Modes:
+
+        : exact         the keys of the lookup table must be unique
+        : first         first matching row, as VLOOKUP(..., FALSE)
+        : last          last matching row, as XLOOKUP(..., -1)
+        : approximate   row with the largest key not greater than the
+                        value, as VLOOKUP(..., TRUE), one key column only
+
+    ```python
+    found = Table.lookup(df, rates, on="Grade", columns=["Rate", "Band"])
+    found.values        # one row per row of df, NaN where unmatched
+    found.unmatched     # lookup values that were not found
+    df = Table.join(df, rates, on="Grade", columns=["Rate", "Band"])
+    ```
+"""
+
+
+MODES = ["exact", "first", "last", "approximate"]
+
+
+class UnknownMode(Exception):
+    """
+    _The mode is not one of MODES._
+    """
+    pass
+
+
+@dataclass
+class LookupResult:
+
+    values: pd.DataFrame
+    positions: np.ndarray
+    keys: pd.Index
+
+    @property
+    def matched(self) -> np.ndarray:
+        """
+        _True for the rows whose value was found._
+        """
+
+        return self.positions >= 0
+
+    @property
+    def unmatched(self) -> pd.Index:
+        """
+        _Distinct lookup values that were not found._
+        """
+
+        return self.keys[~self.matched].unique()
+
+
+def _keys(df: pd.DataFrame, columns: list) -> pd.Index:
+    if len(columns) == 1:
+        return pd.Index(df[columns[0]])
+    return pd.MultiIndex.from_frame(df[columns])
+
+
+def _positions(values: pd.Index, keys: pd.Index, mode: str) -> np.ndarray:
+    if mode == "approximate":
+        if isinstance(keys, pd.MultiIndex):
+            raise UnknownMode("The approximate mode takes one key column.")
+        valid = np.flatnonzero(keys.notna())
+        order = valid[np.argsort(keys.to_numpy()[valid], kind="stable")]
+        # [NOTE] Rightmost key <= value, the last of equal keys as Excel does.
+        found = np.searchsorted(keys.to_numpy()[order], values.to_numpy(), side="right") - 1
+        found[np.asarray(values.isna())] = -1
+        return np.where(found >= 0, order[found.clip(0)], -1)
+
+    if mode == "exact":
+        if not keys.is_unique:
+            raise DuplicateKey(keys[keys.duplicated()][0])
+        return keys.get_indexer(values)
+
+    keep = np.flatnonzero(~keys.duplicated(keep=mode))
+    found = keys[keep].get_indexer(values)
+    return np.where(found >= 0, keep[found.clip(0)], -1)
+
+
+def lookup(df: pd.DataFrame, table: pd.DataFrame, on: Union[str, list],
+           columns: list = None, key: Union[str, list] = None,
+           mode: str = "exact") -> LookupResult:
+    """_Looks up the values of df's on column(s) in the key column(s) of table._
+
+    Args:
+        df (pd.DataFrame): _table holding the lookup values_
+        table (pd.DataFrame): _lookup table_
+        on (Union[str, list]): _column(s) of df holding the lookup values_
+        columns (list, optional): _columns of table to return_. Defaults to every non-key column.
+        key (Union[str, list], optional): _key column(s) of table_. Defaults to on.
+        mode (str, optional): _exact, first, last or approximate_. Defaults to "exact".
+
+    Raises:
+        UnknownMode: _as named_
+        DuplicateKey: _the keys of table are not unique in exact mode_
+
+    Returns:
+        LookupResult: _values (aligned to df), positions in table (-1 if unmatched), unmatched_
+    """
+
+    if not mode in MODES:
+        raise UnknownMode(mode)
+    on = list(on) if type(on) in [list, tuple] else [on]
+    key = on if key is None else list(key) if type(key) in [list, tuple] else [key]
+    if columns is None:
+        columns = [c for c in table.columns if not c in key]
+
+    values = _keys(df, on)
+    positions = _positions(values, _keys(table, key), mode)
+    found = pd.DataFrame({
+        c: pd.api.extensions.take(table[c].to_numpy(), positions, allow_fill=True)
+        for c in columns}, index=df.index)
+    return LookupResult(found, positions, values)
+
+
+def join(df: pd.DataFrame, table: pd.DataFrame, on: Union[str, list],
+         columns: list = None, key: Union[str, list] = None, mode: str = "exact",
+         how: str = "left", suffix: str = "_lookup") -> pd.DataFrame:
+    """_Appends the looked up columns to df, see lookup._
+
+    Args:
+        how (str, optional): _left keeps every row of df, inner only the matched rows_. Defaults to "left".
+        suffix (str, optional): _added to returned columns already in df_. Defaults to "_lookup".
+
+    Returns:
+        pd.DataFrame: _pandas.DataFrame_
+    """
+
+    found = lookup(df, table, on, columns, key, mode)
+    unmatched = int((~found.matched).sum())
+    if unmatched:
+        print(f"{unmatched} rows were not matched, see Table.lookup(...).unmatched.")
+
+    df = df.copy(deep=False)
+    for column in found.values.columns:
+        header = f"{column}{suffix}" if column in df.columns else column
+        df[header] = found.values[column]
+    if how == "inner":
+        df = df.iloc[np.flatnonzero(found.matched)]
+    return df
@@ -0,0 +1,239 @@
+import operator
+from typing import Any, Callable, Union
+
+import numpy as np
+import pandas as pd
+
+
+"""[Masks Summary]
+    Vectorized row selection for Table.filter_rows.
+
+    Every selection accepted by filter_rows is compiled into a single
+    boolean numpy array the length of the DataFrame. Rows are then taken
+    once from the DataFrame, the table is never converted into a list
+    of lists.
+
+    Accepted selections:
+        : int : a single row number
+        : list, tuple, numpy.ndarray : row numbers, or a boolean mask
+        : range, slice : a run of row numbers
+        : Where : a column predicate, combined with &, | and ~
+        : dict : {column: value, list of values, or vectorized callable}
+        : callable : func(df) returning any of the above
+        : pandas.Series : a boolean mask aligned on the DataFrame index
+"""
+
+
+class UnknownSelection(Exception):
+    """
+    _The selection could not be compiled into a row mask._
+    """
+    pass
+
+
+class UnknownOperator(Exception):
+    """
+    _The operator passed to Where is not among Where.OPERATORS._
+    """
+    pass
+
+
+class Where:
+    """
+    _A column predicate evaluated over the whole column at once.
+     Predicates can be combined into compound expressions:
+
+     ```python
+     selection = (Where("Country", "==", "US") & Where("Salary", ">", 90000)) \
+                 | ~Where("Manager", "isnull")
+     df = Table.filter_rows(df, selection, out=False)
+     ```_
+    """
+
+    OPERATORS = {
+        "==": operator.eq,
+        "!=": operator.ne,
+        ">": operator.gt,
+        ">=": operator.ge,
+        "<": operator.lt,
+        "<=": operator.le,
+        "in": lambda s, v: s.isin(v),
+        "not in": lambda s, v: ~s.isin(v),
+        "between": lambda s, v: s.between(v[0], v[1]),
+        "contains": lambda s, v: s.astype(str).str.contains(v, regex=False),
+        "startswith": lambda s, v: s.astype(str).str.startswith(v),
+        "endswith": lambda s, v: s.astype(str).str.endswith(v),
+        "matches": lambda s, v: s.astype(str).str.match(v),
+        "isnull": lambda s, v: s.isna(),
+        "notnull": lambda s, v: s.notna()}
+
+    def __init__(self, column: Union[str, int] = None, op: str = "==", value: Any = None):
+        """
+        Args:
+            column (Union[str, int]): _column header_
+            op (str, optional): _one of Where.OPERATORS_. Defaults to "==".
+            value (Any, optional): _value compared against the column_. Defaults to None.
+
+        Raises:
+            UnknownOperator: _op is not among Where.OPERATORS_
+        """
+
+        if column is None: # [NOTE] Placeholder for compound expressions.
+            self.columns = set()
+            self._evaluate = None
+            return
+
+        if not op in self.OPERATORS:
+            raise UnknownOperator(op)
+
+        compare = self.OPERATORS[op]
+        self.columns = {column}
+        self._evaluate = lambda df: compare(df[column], value)
+
+    @classmethod
+    def _compound(cls, evaluate: Callable, columns: set) -> "Where":
+        where = cls()
+        where.columns = columns
+        where._evaluate = evaluate
+        return where
+
+    def __and__(self, other: "Where") -> "Where":
+        return Where._compound(
+            lambda df: self.mask(df) & other.mask(df),
+            self.columns | other.columns)
+
+    def __or__(self, other: "Where") -> "Where":
+        return Where._compound(
+            lambda df: self.mask(df) | other.mask(df),
+            self.columns | other.columns)
+
+    def __invert__(self) -> "Where":
+        return Where._compound(lambda df: ~self.mask(df), set(self.columns))
+
+    def mask(self, df: pd.DataFrame) -> np.ndarray:
+        """_Evaluates the predicate over df._
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+
+        Returns:
+            np.ndarray: _boolean mask, one entry per row_
+        """
+
+        result = self._evaluate(df)
+        if isinstance(result, pd.Series):
+            # [NOTE] Missing values never satisfy a predicate.
+            return result.fillna(False).to_numpy(dtype=bool)
+        return np.asarray(result, dtype=bool)
+
+
+def _positions2mask(positions: np.ndarray, length: int) -> np.ndarray:
+    mask = np.zeros(length, dtype=bool)
+    positions = positions[(positions >= -length) & (positions < length)]
+    mask[positions] = True
+    return mask
+
+
+def build_mask(df: pd.DataFrame, selections: Any) -> np.ndarray:
+    """_Compiles a selection into a boolean mask over the rows of df._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        selections (Any): _see the module summary for accepted selections_
+
+    Raises:
+        UnknownSelection: _the selection could not be compiled_
+
+    Returns:
+        np.ndarray: _boolean mask, one entry per row_
+    """
+
+    length = len(df)
+
+    if isinstance(selections, Where):
+        return selections.mask(df)
+
+    if isinstance(selections, (bool, np.bool_)):
+        return np.full(length, bool(selections))
+
+    if isinstance(selections, (int, np.integer)):
+        return _positions2mask(np.array([selections]), length)
+
+    if isinstance(selections, slice):
+        mask = np.zeros(length, dtype=bool)
+        mask[selections] = True
+        return mask
+
+    if isinstance(selections, range):
+        return _positions2mask(np.arange(
+            selections.start, selections.stop, selections.step), length)
+
+    if isinstance(selections, pd.Series):
+        if selections.dtype == bool:
+            return selections.reindex(df.index, fill_value=False).to_numpy(dtype=bool)
+        return build_mask(df, selections.to_numpy())
+
+    if isinstance(selections, dict):
+        mask = np.ones(length, dtype=bool)
+        for column, value in selections.items():
+            if callable(value):
+                mask &= Where._compound(lambda df, c=column, f=value: f(df[c]), {column}).mask(df)
+            elif pd.api.types.is_list_like(value):
+                mask &= Where(column, "in", list(value)).mask(df)
+            else:
+                mask &= Where(column, "==", value).mask(df)
+        return mask
+
+    if callable(selections):
+        return build_mask(df, selections(df))
+
+    if isinstance(selections, (list, tuple, np.ndarray, pd.Index)):
+        array = np.asarray(selections)
+        if array.size == 0:
+            return np.zeros(length, dtype=bool)
+        if array.dtype == bool:
+            if len(array) != length:
+                raise UnknownSelection("A boolean mask must have one entry per row.")
+            return array
+        if np.issubdtype(array.dtype, np.integer):
+            return _positions2mask(array, length)
+
+    raise UnknownSelection(type(selections))
+
+
+def take(df: pd.DataFrame, mask: np.ndarray) -> pd.DataFrame:
+    """_Returns the rows of df selected by mask. A contiguous run of rows
+        is returned as a slice of df rather than a copy._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        mask (np.ndarray): _boolean mask, one entry per row_
+
+    Returns:
+        pd.DataFrame: _the selected rows_
+    """
+
+    positions = np.flatnonzero(mask)
+    if not len(positions):
+        return df.iloc[0:0]
+
+    start, stop = positions[0], positions[-1] + 1
+    if stop - start == len(positions):
+        return df.iloc[start:stop]
+    return df.take(positions)
+
+
+def filter_rows(df: pd.DataFrame, selections: Any, out: bool = True) -> pd.DataFrame:
+    """_Filters the rows of a dataframe with a single vectorized mask._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        selections (Any): _see the module summary for accepted selections_
+        out (bool, optional): _whether to filter the selected rows out_. Defaults to True.
+
+    Returns:
+        pd.DataFrame: _the retained rows_
+    """
+
+    mask = build_mask(df, selections)
+    return take(df, ~mask if out else mask)
@@ -0,0 +1,140 @@
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+
+"""[Pager Summary]
+    Page by page display of a table on the console, used by
+    Console.page_navigate.
+
+    Only the rows of the visible page are converted to text. Column widths
+    are computed once when the Pager is created, from the whole table up to
+    SAMPLE rows and from a sample of the rows past that, so paging through
+    a 5M-row table costs the same as paging through a small one. Pages
+    start at fixed offsets, so any page is found in O(1):
+
+    ```python
+    pager = Pager(df, linesPerScreen=50)
+    print(pager.render(10_000))
+    ```
+"""
+
+
+SAMPLE = 10000
+MAX_WIDTH = 40
+
+
+class Pager:
+    """
+    _Renders a table one page at a time, see the module summary._
+    """
+
+    COMMANDS = {
+        "#": "Go to Page",
+        ">": "Next Page",
+        "<": "Previous Page",
+        "" : "Press Enter to exit"}
+
+    def __init__(self, df: pd.DataFrame, linesPerScreen: int = 50,
+                 sample: int = SAMPLE, maxWidth: int = MAX_WIDTH):
+        """
+        Args:
+            df (pd.DataFrame): _table_
+            linesPerScreen (int, optional): _rows per page_. Defaults to 50.
+            sample (int, optional): _rows the column widths are estimated from_. Defaults to SAMPLE.
+            maxWidth (int, optional): _widest column, longer values are cut_. Defaults to MAX_WIDTH.
+        """
+
+        self.df = df
+        self.linesPerScreen = max(1, linesPerScreen)
+        self.maxWidth = maxWidth
+        # [NOTE] Page n starts at offsets[n], a range costs nothing whatever the number of pages.
+        self.offsets = range(0, max(len(df), 1), self.linesPerScreen)
+        self.indexWidth = len(str(len(df)))
+        self.widths = self._widths(sample)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def _widths(self, sample: int) -> list:
+        df = self.df
+        if len(df) > sample:
+            # [NOTE] The first rows are always included, they are the first page shown.
+            rng = np.random.default_rng(0)
+            positions = np.union1d(np.arange(sample // 2),
+                                   rng.choice(len(df), sample - sample // 2, replace=False))
+            df = df.take(positions)
+
+        widths = list()
+        for colIdx, header in enumerate(df.columns):
+            values = df.iloc[:, colIdx]
+            longest = values.astype(str).str.len().max() if len(values) else 0
+            widths.append(min(max(len(str(header)), int(longest or 0)), self.maxWidth))
+        return widths
+
+    def _cell(self, value, width: int) -> str:
+        text = "" if pd.api.types.is_scalar(value) and pd.isna(value) else str(value)
+        if len(text) > width:
+            text = text[:max(width - 3, 0)] + "..."
+        return text.ljust(width)
+
+    def page(self, page: int) -> int:
+        """_Clamps a page number to the pages of the table._
+
+        Args:
+            page (int): _page number, negative numbers count from the end_
+
+        Returns:
+            int: _page number_
+        """
+
+        if page < 0:
+            page += len(self.offsets)
+        return min(max(page, 0), len(self.offsets) - 1)
+
+    def render(self, page: int) -> str:
+        """_Returns the text of a page: the headers, then one line per row._
+
+        Args:
+            page (int): _page number_
+
+        Returns:
+            str: _page text_
+        """
+
+        page = self.page(page)
+        start = self.offsets[page]
+        rows = self.df.iloc[start:start + self.linesPerScreen]
+
+        lines = [" " * self.indexWidth + "  " + "  ".join(
+            self._cell(header, width) for header, width in zip(rows.columns, self.widths))]
+        columns = [rows.iloc[:, i].tolist() for i in range(rows.shape[1])]
+        for i, values in enumerate(zip(*columns)):
+            lines.append(str(start + i).rjust(self.indexWidth) + "  " + "  ".join(
+                self._cell(value, width) for value, width in zip(values, self.widths)))
+        lines.append(f"Page {page + 1} of {len(self.offsets)} ({len(self.df)} rows)")
+        return "\n".join(lines)
+
+    def navigate(self, page: int, command: str) -> Union[int, None]:
+        """_Returns the page a command leads to, None to exit._
+
+        Args:
+            page (int): _current page_
+            command (str): _">", "<", a page number (counted from 1), or "" to exit_
+
+        Returns:
+            Union[int, None]: _page number_
+        """
+
+        command = command.strip()
+        if not command:
+            return None
+        if command == ">":
+            return self.page(page + 1)
+        if command == "<":
+            return self.page(max(page - 1, 0))
+        if command.lstrip("#").strip().isnumeric():
+            return self.page(int(command.lstrip("#").strip()) - 1)
+        print("A number is required for page selection.")
+        return page
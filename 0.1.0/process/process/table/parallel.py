@@ -0,0 +1,136 @@
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+
+"""[Parallel Summary]
+    Row-wise python functions (name normalization, regex extraction, ...)
+    run on every core with a process pool.
+
+    The rows are split into chunks and each chunk is run by a worker. func
+    is called once per row with one value per column, in the order of the
+    columns passed:
+
+    ```python
+    def normalize(first, last):
+        return f"{last.strip().title()}, {first.strip().title()}"
+
+    df["Name"] = Table.parallel_apply(df, normalize, ["First", "Last"])
+    ```
+
+    Numeric and boolean columns are copied once into shared memory, and
+    workers read their chunk straight from it. Other columns (text, dates,
+    mixed) cannot be shared as buffers, their chunk is pickled to the worker.
+    Results are reassembled in row order into a Series aligned to df.
+
+    Inputs under THRESHOLD rows, a single worker, or functions that cannot
+    be pickled (lambdas, nested functions) run serially in this process.
+    On Windows, workers re-import the calling script, which must guard its
+    entry point with if __name__ == "__main__".
+"""
+
+
+THRESHOLD = 20000
+_SHARED_KINDS = "iufb"
+
+
+def _call(func: Callable, columns: list) -> list:
+    if len(columns) == 1:
+        return list(map(func, columns[0]))
+    return list(map(func, *columns))
+
+
+def _run_chunk(func: Callable, specs: list, start: int, stop: int, objects: dict) -> list:
+    """_Worker: reads rows [start, stop) of the shared columns and runs func._"""
+
+    columns, attached = list(), list()
+    try:
+        for i, spec in enumerate(specs):
+            if spec is None:
+                columns.append(objects[i])
+                continue
+            name, dtype, length = spec
+            shm = SharedMemory(name=name)
+            attached.append(shm)
+            # [NOTE] No view of the buffer may outlive the call, close() would fail.
+            columns.append(np.ndarray((length,), dtype=dtype, buffer=shm.buf)[start:stop].tolist())
+        return _call(func, columns)
+    finally:
+        for shm in attached:
+            shm.close()
+
+
+def _picklable(func: Callable) -> bool:
+    try:
+        pickle.dumps(func)
+        return True
+    except Exception:
+        return False
+
+
+def parallel_apply(df: pd.DataFrame, func: Callable, columns: list = None,
+                   workers: int = None, chunksize: int = None,
+                   threshold: int = THRESHOLD) -> pd.Series:
+    """_Runs func on every row of df on a process pool, see the module summary._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        func (Callable): _module-level function taking one value per column_
+        columns (list, optional): _columns passed to func, in order_. Defaults to every column.
+        workers (int, optional): _worker processes_. Defaults to os.cpu_count().
+        chunksize (int, optional): _rows per chunk_. Defaults to 4 chunks per worker.
+        threshold (int, optional): _fewest rows run in parallel_. Defaults to THRESHOLD.
+
+    Returns:
+        pd.Series: _one result per row, aligned to df_
+    """
+
+    columns = list(df.columns) if columns is None else list(columns)
+    series = [df[c] for c in columns]
+    workers = workers or os.cpu_count() or 1
+
+    serial = len(df) < threshold or workers == 1
+    if not serial and not _picklable(func):
+        print("The function cannot be pickled (lambda or nested function), running serially.")
+        serial = True
+    if serial:
+        return pd.Series(_call(func, [s.tolist() for s in series]), index=df.index)
+
+    chunksize = chunksize or -(-len(df) // (workers * 4))
+    bounds = [(start, min(start + chunksize, len(df))) for start in range(0, len(df), chunksize)]
+
+    specs, blocks = list(), list()
+    try:
+        for s in series:
+            if isinstance(s.dtype, np.dtype) and s.dtype.kind in _SHARED_KINDS:
+                values = s.to_numpy()
+                shm = SharedMemory(create=True, size=max(values.nbytes, 1))
+                blocks.append(shm)
+                np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+                specs.append((shm.name, values.dtype.str, len(values)))
+            else:
+                specs.append(None)
+
+        results, futures = list(), deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for start, stop in bounds:
+                objects = {i: series[i].iloc[start:stop].tolist()
+                           for i, spec in enumerate(specs) if spec is None}
+                futures.append(executor.submit(_run_chunk, func, specs, start, stop, objects))
+                # [NOTE] Bounds the pickled chunks in flight, results are collected in row order.
+                if len(futures) > workers * 2:
+                    results.extend(futures.popleft().result())
+            while futures:
+                results.extend(futures.popleft().result())
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+    return pd.Series(results, index=df.index)
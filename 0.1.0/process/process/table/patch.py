@@ -0,0 +1,171 @@
+from typing import Any, Union
+
+import numpy as np
+import pandas as pd
+
+
+"""[Patch Summary]
+    Bulk cell updates for Table.patch and Table.change_value.
+
+    Cells are given as parallel arrays of row numbers, columns and values,
+    one entry per cell, any of which may be a single value broadcast to
+    every cell:
+
+    ```python
+    df = Table.patch(df, rows=[3, 10, 42], cols="Status", values="Closed")
+    df, previous = Table.patch(df, rows, cols, values, return_previous=True)
+    ```
+
+    The cells are grouped by column and each column is set with a single
+    iloc assignment, whatever the number of cells. When a row and column
+    repeat, the last value wins.
+
+    Unless inplace is True, only the columns patched are copied: the table
+    passed is left unchanged and the other columns share its buffers.
+"""
+
+
+class PatchShapeMismatch(Exception):
+    """
+    _rows, cols and values do not have one entry per cell._
+    """
+    pass
+
+
+def upcast(column: pd.Series, values: Any) -> Any:
+    """_The narrowest dtype holding both the column and the values: 100000
+        into uint8 is int64, 20.5 into int64 is float64, a new label into a
+        category adds it to the categories. Only mixed types (text into
+        numbers) give object._
+
+    Args:
+        column (pd.Series): _column written into_
+        values (Any): _one value, or one value per row_
+
+    Returns:
+        Any: _numpy dtype or pd.CategoricalDtype_
+    """
+
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        labels = pd.Index(np.atleast_1d(values)).dropna()
+        return pd.CategoricalDtype(column.cat.categories.append(labels.difference(column.cat.categories)))
+    dtype = np.asarray(values).dtype
+    if not isinstance(column.dtype, np.dtype) or column.dtype.kind in "OSU" or dtype.kind in "OSU":
+        # [NOTE] numpy would promote numbers and text to text, mixed types are objects.
+        return object
+    try:
+        return np.result_type(column.dtype, dtype)
+    except TypeError:
+        return object
+
+
+def assign(df: pd.DataFrame, colIdx: int, rows: np.ndarray, values: Any):
+    """_Sets rows of a column, in place, in one assignment. A column that
+        cannot hold the values is upcast first, see upcast._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        colIdx (int): _column number_
+        rows (np.ndarray): _row numbers_
+        values (Any): _one value, or one value per row_
+    """
+
+    try:
+        df.iloc[rows, colIdx] = values
+    except (TypeError, ValueError):
+        column = df.iloc[:, colIdx]
+        dtype = upcast(column, values)
+        try:
+            df.isetitem(colIdx, column.astype(dtype))
+            df.iloc[rows, colIdx] = values
+        except (TypeError, ValueError):
+            # [NOTE] e.g. int64 cannot hold the NaN of a float64 result.
+            df.isetitem(colIdx, column.astype(object))
+            df.iloc[rows, colIdx] = values
+
+
+def _column_numbers(df: pd.DataFrame, cols: list) -> np.ndarray:
+    """_Column numbers of headers, or of column numbers not among the headers._"""
+
+    codes, uniques = pd.factorize(pd.Index(cols, dtype=object))
+    numbers = np.array([
+        column if isinstance(column, (int, np.integer)) and not column in df.columns else df.columns.get_loc(column)
+        for column in uniques.tolist()], dtype=np.int64)
+    return numbers[codes]
+
+
+def _cells(df: pd.DataFrame, rows: Any, cols: Any, values: Any) -> tuple:
+    rows = np.atleast_1d(np.asarray(rows, dtype=np.int64))
+    cols = list(cols) if pd.api.types.is_list_like(cols) else [cols]
+    listed = pd.api.types.is_list_like(values) and not isinstance(values, tuple)
+    count = max(len(rows), len(cols), len(values) if listed else 1)
+
+    if len(rows) == 1:
+        rows = np.repeat(rows, count)
+    colIdxs = _column_numbers(df, cols)
+    if len(colIdxs) == 1:
+        colIdxs = np.repeat(colIdxs, count)
+    if len(rows) != count or len(colIdxs) != count or (listed and len(values) != count):
+        raise PatchShapeMismatch(
+            f"{len(rows)} rows, {len(colIdxs)} columns and {len(values) if listed else 1} values.")
+    if ((rows < -len(df)) | (rows >= len(df))).any():
+        raise IndexError(f"Row numbers must be under {len(df)}.")
+
+    if listed and not isinstance(values, np.ndarray):
+        values = values.to_numpy() if isinstance(values, (pd.Series, pd.Index)) else _objects(values)
+    return np.where(rows < 0, rows + len(df), rows), colIdxs, values, listed
+
+
+def _objects(values: Any) -> np.ndarray:
+    # [NOTE] Filled one by one, np.asarray would turn [1, "a"] into strings.
+    array = np.empty(len(values), dtype=object)
+    array[:] = list(values)
+    return array
+
+
+def patch(df: pd.DataFrame, rows: Any, cols: Any, values: Any,
+          return_previous: bool = False, inplace: bool = False) -> Union[pd.DataFrame, tuple]:
+    """_Sets cells of df, one assignment per column, see the module summary._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        rows (Any): _row number, or one row number per cell_
+        cols (Any): _column header or number, or one per cell_
+        values (Any): _value, or one value per cell_
+        return_previous (bool, optional): _also return the values replaced, one per cell_. Defaults to False.
+        inplace (bool, optional): _set the cells of df itself, when the caller owns it_. Defaults to False.
+
+    Raises:
+        PatchShapeMismatch: _rows, cols and values do not have one entry per cell_
+        IndexError: _a row number is out of range_
+        KeyError: _a column is not in df_
+
+    Returns:
+        Union[pd.DataFrame, tuple]: _pandas.DataFrame, and the previous values if return_previous_
+    """
+
+    rows, colIdxs, values, listed = _cells(df, rows, cols, values)
+    previous = np.empty(len(rows), dtype=object) if return_previous else None
+    if not inplace:
+        df = df.copy(deep=False)
+
+    order = np.argsort(colIdxs, kind="stable")
+    bounds = np.flatnonzero(np.r_[True, colIdxs[order][1:] != colIdxs[order][:-1], True]) if len(rows) else []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        cells = order[start:stop]
+        colIdx = int(colIdxs[cells[0]])
+        if return_previous:
+            previous[cells] = df.iloc[rows[cells], colIdx].to_numpy(dtype=object)
+        cellRows, cellValues = rows[cells], values[cells] if listed else values
+        if listed and len(np.unique(cellRows)) < len(cellRows):
+            # [NOTE] The last value of a repeated row wins.
+            last = len(cellRows) - 1 - np.unique(cellRows[::-1], return_index=True)[1]
+            cellRows, cellValues = cellRows[last], cellValues[last]
+        if listed and cellValues.dtype == object:
+            cellValues = pd.Series(cellValues.tolist()).to_numpy()
+        if not inplace:
+            # [NOTE] Only the patched column is copied, the others stay shared with the caller's table.
+            df.isetitem(colIdx, df.iloc[:, colIdx].copy())
+        assign(df, colIdx, cellRows, cellValues)
+
+    return (df, previous) if return_previous else df
@@ -0,0 +1,189 @@
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+
+"""[Pivot Summary]
+    Pivot tables and group-by summaries computed in memory, in place of
+    pushing the DataFrame into a worksheet to build an Excel pivot by macro.
+
+    The semantics follow Excel's pivot tables in tabular form:
+
+        : row fields become the leading columns, one row per combination
+        : column fields spread their values across the columns
+        : values are summarized with sum, count, avg or distinct count,
+          named as Excel does ("Sum of Salary")
+        : subtotals follow their group ("HR Total"), the grand total row
+          and column come last ("Grand Total")
+
+    Every level, subtotals and totals included, is aggregated from the
+    rows of the table with a vectorized group-by, so averages and distinct
+    counts are exact rather than sums of the level below. The result is a
+    flat DataFrame with one header row, ready for a single Range write
+    (Excel.load_dataframe_into_worksheet):
+
+    ```python
+    summary = Table.pivot(df, rows=["Country", "Dept"], columns="Year",
+                          values="Salary", agg="avg", subtotals=True)
+    ```
+"""
+
+
+AGGREGATIONS = {
+    "sum": ("Sum", "sum"),
+    "count": ("Count", "count"),
+    "avg": ("Average", "mean"),
+    "average": ("Average", "mean"),
+    "distinct count": ("Distinct Count", "nunique"),
+    "distinct": ("Distinct Count", "nunique"),
+    "min": ("Min", "min"),
+    "max": ("Max", "max")}
+
+TOTAL = "Grand Total"
+LABELS = "Row Labels"
+
+
+class UnknownAggregation(Exception):
+    """
+    _The aggregation is not one of AGGREGATIONS._
+    """
+    pass
+
+
+def _fields(fields: Union[str, list, None]) -> list:
+    if fields is None:
+        return list()
+    return list(fields) if type(fields) in [list, tuple] else [fields]
+
+
+def _summaries(values: list, agg: Union[str, dict]) -> list:
+    """_[(value column, header, pandas function)] for each value field._"""
+
+    summaries = list()
+    for value in values:
+        name = agg.get(value, "sum") if isinstance(agg, dict) else agg
+        if not str(name).lower() in AGGREGATIONS:
+            raise UnknownAggregation(name)
+        label, func = AGGREGATIONS[str(name).lower()]
+        summaries.append((value, f"{label} of {value}", func))
+    return summaries
+
+
+def _aggregate(df: pd.DataFrame, keys: list, summaries: list) -> pd.DataFrame:
+    columns = {header: pd.NamedAgg(column=value, aggfunc=func) for value, header, func in summaries}
+    if keys:
+        return df.groupby(keys, sort=True, observed=True, dropna=False).agg(**columns)
+    # [NOTE] The grand total has no keys, the whole table is one group.
+    return pd.DataFrame({header: [df[value].agg(func)] for value, header, func in summaries})
+
+
+def _header(column: tuple, summaries: list) -> str:
+    labels = [str(c) for c in column[1:] if str(c) != ""]
+    if len(summaries) == 1:
+        return " | ".join(labels)
+    return " | ".join([column[0]] + labels)
+
+
+def _spread(df: pd.DataFrame, rows: list, columns: list, summaries: list,
+            grand_total: bool) -> pd.DataFrame:
+    """_Aggregates one level of row fields, spreading the column fields._"""
+
+    table = _aggregate(df, rows + columns, summaries)
+    if columns:
+        if rows:
+            table = table.unstack(list(range(len(rows), len(rows) + len(columns))))
+        else:
+            table = table.unstack(list(range(len(columns)))).to_frame().T
+        if grand_total:
+            totals = _aggregate(df, rows, summaries)
+            totals.columns = pd.MultiIndex.from_tuples(
+                [(header, TOTAL) + ("",) * (len(columns) - 1) for header in totals.columns])
+            table = pd.concat([table, totals], axis=1)
+        table.columns = [_header(c, summaries) for c in table.columns]
+    return table.reset_index() if rows else table
+
+
+def _codes(values: pd.Series, detail: pd.Series) -> tuple:
+    uniques = pd.Index(detail.unique())
+    try:
+        uniques = uniques.sort_values()
+    except TypeError:
+        pass # mixed types keep the order they appear in
+    return uniques.get_indexer(values), len(uniques)
+
+
+def pivot(df: pd.DataFrame, rows: Union[str, list], values: Union[str, list],
+          columns: Union[str, list] = None, agg: Union[str, dict] = "sum",
+          subtotals: bool = False, grand_total: bool = True) -> pd.DataFrame:
+    """_Summarizes df as an Excel pivot table, see the module summary._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        rows (Union[str, list]): _row fields_
+        values (Union[str, list]): _value fields_
+        columns (Union[str, list], optional): _column fields_. Defaults to None.
+        agg (Union[str, dict], optional): _sum, count, avg, distinct count, min or max,
+                                           or {value field: aggregation}_. Defaults to "sum".
+        subtotals (bool, optional): _subtotal rows after each group of the outer row fields_. Defaults to False.
+        grand_total (bool, optional): _grand total row, and column if there are column fields_. Defaults to True.
+
+    Raises:
+        UnknownAggregation: _as named_
+
+    Returns:
+        pd.DataFrame: _flat table with one header row_
+    """
+
+    rows, columns, values = _fields(rows), _fields(columns), _fields(values)
+    summaries = _summaries(values, agg)
+    if not rows:
+        # [NOTE] Excel labels the only row of a pivot without row fields Grand Total.
+        df, rows = df.assign(**{LABELS: TOTAL}), [LABELS]
+
+    levels = [len(rows)]
+    if subtotals:
+        levels += list(range(len(rows) - 1, 0, -1))
+    if grand_total and rows[0] != LABELS:
+        levels.append(0)
+
+    frames = list()
+    for level in levels:
+        frame = _spread(df, rows[:level], columns, summaries, grand_total)
+        frame["_level"] = level
+        frames.append(frame)
+    detail = frames[0]
+    table = pd.concat(frames, ignore_index=True)
+    if columns:
+        table = table.reindex(columns=list(detail.columns))
+
+    # Orders each subtotal after its group and the grand total last.
+    keys = list()
+    for i, field in enumerate(rows):
+        codes, last = _codes(table[field], detail[field])
+        keys.append(np.where(table["_level"].to_numpy() <= i, last, codes))
+    if keys:
+        table = table.iloc[np.lexsort(keys[::-1])].reset_index(drop=True)
+
+    levelOf = table.pop("_level").to_numpy()
+    for i, field in enumerate(rows):
+        labels = table[field].to_numpy(dtype=object).copy()
+        subtotal = (levelOf == i + 1) & (levelOf < len(rows))
+        labels[subtotal] = [f"{label} Total" for label in labels[subtotal]]
+        labels[levelOf <= i] = ""
+        if not i:
+            labels[levelOf == 0] = TOTAL
+        table[field] = labels
+    return table
+
+
+def group_by(df: pd.DataFrame, rows: Union[str, list], values: Union[str, list],
+             agg: Union[str, dict] = "sum", subtotals: bool = False,
+             grand_total: bool = False) -> pd.DataFrame:
+    """_Summarizes df by its row fields, a pivot without column fields._
+
+    Returns:
+        pd.DataFrame: _flat table with one header row_
+    """
+
+    return pivot(df, rows, values, None, agg, subtotals, grand_total)
@@ -0,0 +1,374 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Callable, Union
+
+import pandas as pd
+
+from .masks import Where, build_mask, take
+from .columns import add_column
+
+
+"""[Plan Summary]
+    Lazy pipelines of Table operations.
+
+    Chaining Table operations copies the DataFrame at every step. A Pipeline
+    records the operations instead, optimizes the recorded plan, and runs it
+    once when collect() is called:
+
+    ```python
+    df = (Table.lazy(excel.get_local_csv_as_dataframe, path)
+            .add_column("Bonus", lambda df: df.Salary * 0.1, uses=["Salary"], rowwise=True)
+            .filter_rows(Where("Country", "==", "US"), out=False)
+            .filter_columns(["Notes"])
+            .reorder_columns(["Name", "Bonus"])
+            .collect())
+    ```
+
+    The optimizer:
+        : moves row filters ahead of column additions and projections,
+          so columns are only computed for the rows that are kept. Callables
+          are only moved past when declared rowwise, a callable that reads
+          other rows (cumsum, rank, shift) would see different values
+        : fuses consecutive projections (filter_columns, reorder_columns)
+        : drops column additions whose column is never used or kept
+        : pushes the columns that are actually needed, and a leading run of
+          rows, down into the reader as usecols, skiprows and nrows. The rows
+          read keep their row numbers as labels, as with filter_rows
+
+    Readers are any callable that accept the pandas reader keywords usecols,
+    skiprows and nrows, e.g. pd.read_csv, Excel.get_local_csv_as_dataframe
+    or SharePoint.doc_xlsx2dataframe.
+"""
+
+
+class UnknownColumn(Exception):
+    """
+    _A column referenced by the pipeline is not in the table at that step._
+    """
+    pass
+
+
+def _uses(selections: Any) -> Union[set, None]:
+    """_Columns a row selection reads, None if unknown (a callable)._"""
+
+    if isinstance(selections, Where):
+        return set(selections.columns)
+    if isinstance(selections, dict):
+        return set(selections.keys())
+    if callable(selections) and not isinstance(selections, (range, slice)):
+        return None
+    return set() # row numbers
+
+
+def _positional(value: Any) -> bool:
+    """_Values that are aligned to the rows by position rather than by label._"""
+
+    if isinstance(value, (pd.Series, Mapping)) or callable(value):
+        return False
+    return pd.api.types.is_list_like(value)
+
+
+@dataclass
+class Scan:
+
+    reader: Callable
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    usecols: list = None
+    rows: tuple = None
+
+    def columns(self) -> list:
+        return list(self.reader(*self.args, **self.kwargs, nrows=0).columns)
+
+    def read(self) -> pd.DataFrame:
+        return self.relabel(self.reader(*self.args, **self.options()))
+
+    def relabel(self, df: pd.DataFrame) -> pd.DataFrame:
+        """_Labels the rows read after skiprows by their row numbers in the
+            source, the labels filter_rows would have kept._"""
+
+        if self.rows is not None and self.rows[0] and isinstance(df.index, pd.RangeIndex):
+            df.index = df.index + self.rows[0]
+        return df
+
+    def options(self) -> dict:
+        kwargs = dict(self.kwargs)
+        if self.usecols is not None:
+            kwargs["usecols"] = self.usecols
+        if self.rows is not None:
+            start, stop = self.rows
+            if start:
+                # [NOTE] Row 0 of the file holds the headers.
+                kwargs["skiprows"] = range(1, start + 1)
+            if stop is not None:
+                kwargs["nrows"] = stop - start
+        return kwargs
+
+
+@dataclass
+class AddColumn:
+
+    header: Union[str, int]
+    value: Any
+    colIdx: int = None
+    after: bool = True
+    overwrite: bool = False
+    uses: set = None
+    rowwise: bool = False
+
+    def run(self, df: pd.DataFrame) -> pd.DataFrame:
+        return add_column(df, self.header, self.value, self.colIdx, self.after,
+                          overwrite=True, inplace=True)
+
+
+@dataclass
+class FilterRows:
+
+    selections: Any
+    out: bool = True
+
+    @property
+    def uses(self) -> Union[set, None]:
+        return _uses(self.selections)
+
+    def run(self, df: pd.DataFrame) -> pd.DataFrame:
+        mask = build_mask(df, self.selections)
+        return take(df, ~mask if self.out else mask)
+
+    def leading_rows(self) -> Union[tuple, None]:
+        """_(start, stop) if the filter keeps a single run of row numbers._"""
+
+        if self.out:
+            return None
+        selections = self.selections
+        if isinstance(selections, range) and selections.step == 1 and selections.start >= 0:
+            return (selections.start, selections.stop)
+        if isinstance(selections, slice) and selections.step in (None, 1):
+            start, stop = selections.start or 0, selections.stop
+            if start >= 0 and (stop is None or stop >= 0):
+                return (start, stop)
+        return None
+
+
+@dataclass
+class Project:
+
+    columns: list
+
+    @property
+    def uses(self) -> set:
+        return set(self.columns)
+
+    def run(self, df: pd.DataFrame) -> pd.DataFrame:
+        if list(df.columns) == self.columns:
+            return df
+        return df[self.columns]
+
+
+class Pipeline:
+    """
+    _A lazily evaluated chain of Table operations, see the module summary._
+    """
+
+    # [NOTE] Whether every callable added is row-wise, whatever it declares.
+    ROWWISE = False
+
+    def __init__(self, source: Union[pd.DataFrame, Scan]):
+        """
+        Args:
+            source (Union[pd.DataFrame, Scan]): _a DataFrame, or a Scan of a reader_
+        """
+
+        self.source = source
+        self.steps = list()
+        self.columns = list(source.columns) if isinstance(source, pd.DataFrame) else source.columns()
+
+    @classmethod
+    def scan(cls, reader: Callable, *args, **kwargs) -> "Pipeline":
+        """_Starts a pipeline from a reader. The reader is called once for the
+            headers (nrows=0) and once when the pipeline is collected._
+
+        Args:
+            reader (Callable): _reader accepting usecols, skiprows and nrows_
+
+        Returns:
+            Pipeline: _pipeline_
+        """
+
+        return cls(Scan(reader, args, kwargs))
+
+    def _resolve(self, column: Union[str, int]) -> Union[str, int]:
+        if column in self.columns:
+            return column
+        if type(column) == int and -len(self.columns) <= column < len(self.columns):
+            return self.columns[column]
+        raise UnknownColumn(column)
+
+    def add_column(self, header: Union[str, int], value: Any, colIdx: int = None,
+                   after: bool = True, overwrite: bool = False, uses: list = None,
+                   rowwise: bool = False) -> "Pipeline":
+        """_Records Table.add_column. Callables are passed the DataFrame and
+            must return the column, uses lists the columns a callable reads
+            so the optimizer can prune around it. rowwise declares that each
+            value of the column only depends on its own row, so row filters
+            can run before the callable._
+
+        Returns:
+            Pipeline: _self, for chaining_
+        """
+
+        if header in self.columns and not overwrite:
+            print("To overwrite an existing column, please change the overwrite parameter to True.")
+            return self
+
+        if callable(value):
+            uses = set(uses) if uses is not None else None
+        else:
+            uses = set()
+        self.steps.append(AddColumn(header, value, colIdx, after, overwrite, uses, rowwise))
+        if not header in self.columns:
+            position = len(self.columns) if colIdx is None else \
+                       min(colIdx + 1 if after else colIdx, len(self.columns))
+            self.columns.insert(position, header)
+        return self
+
+    def filter_rows(self, selections: Any, out: bool = True) -> "Pipeline":
+        """_Records Table.filter_rows._
+
+        Returns:
+            Pipeline: _self, for chaining_
+        """
+
+        uses = _uses(selections)
+        for column in uses or set():
+            self._resolve(column)
+        self.steps.append(FilterRows(selections, out))
+        return self
+
+    def filter_columns(self, selections: list, out: bool = True) -> "Pipeline":
+        """_Records Table.filter_columns. Selections are column names or numbers._
+
+        Returns:
+            Pipeline: _self, for chaining_
+        """
+
+        selected = [self._resolve(c) for c in selections]
+        if out:
+            columns = [c for c in self.columns if not c in selected]
+        else:
+            columns = selected
+        self.steps.append(Project(columns))
+        self.columns = list(columns)
+        return self
+
+    def reorder_columns(self, columns: list) -> "Pipeline":
+        """_Records Table.reorder_columns._
+
+        Returns:
+            Pipeline: _self, for chaining_
+        """
+
+        return self.filter_columns(columns, out=False)
+
+    def optimize(self) -> list:
+        """_Returns the optimized plan. The recorded steps are left as recorded._
+
+        Returns:
+            list: _[Scan (if any), steps...]_
+        """
+
+        steps = self._push_filters(list(self.steps))
+        steps = self._fuse_projections(steps)
+        steps, needed = self._prune(steps)
+
+        if not isinstance(self.source, Scan):
+            return steps
+
+        scan = Scan(self.source.reader, self.source.args, self.source.kwargs)
+        if steps and isinstance(steps[0], FilterRows) and steps[0].leading_rows():
+            scan.rows = steps.pop(0).leading_rows()
+        if needed is not None:
+            source = self.source.columns() if self.source.usecols is None else self.source.usecols
+            scan.usecols = [c for c in source if c in needed]
+        return [scan] + steps
+
+    def _push_filters(self, steps: list) -> list:
+        # [NOTE] Filters never move ahead of other filters, row numbers
+        # depend on the filters that ran before.
+        for i in range(1, len(steps)):
+            j = i
+            while j > 0 and isinstance(steps[j], FilterRows) and self._commutes(steps[j-1], steps[j]):
+                steps[j-1], steps[j] = steps[j], steps[j-1]
+                j -= 1
+        return steps
+
+    def _commutes(self, step, rows: FilterRows) -> bool:
+        uses = rows.uses
+        if uses is None:
+            return False
+        if isinstance(step, Project):
+            # [NOTE] Projections only drop columns, the filter's columns exist before it.
+            return True
+        if isinstance(step, AddColumn):
+            if step.header in uses or _positional(step.value):
+                return False
+            # [NOTE] Values and Series (aligned by label) are row-wise, callables only when declared.
+            return not callable(step.value) or step.rowwise or self.ROWWISE
+        return False
+
+    def _fuse_projections(self, steps: list) -> list:
+        fused = list()
+        for step in steps:
+            if isinstance(step, Project) and fused and isinstance(fused[-1], Project):
+                fused[-1] = Project(list(step.columns))
+            else:
+                fused.append(step)
+        return fused
+
+    def _prune(self, steps: list) -> tuple:
+        # Walks the plan backwards, tracking the columns still needed downstream.
+        needed, pruned = None, list() # None: every column is needed
+        for step in reversed(steps):
+            if isinstance(step, Project):
+                needed = set(step.columns)
+            elif isinstance(step, AddColumn):
+                if needed is not None and not step.header in needed:
+                    continue # never used, never kept
+                if needed is not None:
+                    needed = None if step.uses is None else (needed - {step.header}) | step.uses
+            elif isinstance(step, FilterRows):
+                if needed is not None:
+                    needed = None if step.uses is None else needed | step.uses
+            pruned.append(step)
+        return pruned[::-1], needed
+
+    def explain(self) -> str:
+        """_Returns the optimized plan as text, one step per line._
+
+        Returns:
+            str: _the plan_
+        """
+
+        return "\n".join(f"{i}: {step}" for i, step in enumerate(self.optimize()))
+
+    def collect(self) -> pd.DataFrame:
+        """_Runs the optimized plan once._
+
+        Returns:
+            pd.DataFrame: _the result_
+        """
+
+        steps = self.optimize()
+        if steps and isinstance(steps[0], Scan):
+            df, owned = steps.pop(0).read(), True
+        else:
+            df, owned = self.source, False
+
+        for step in steps:
+            if isinstance(step, AddColumn) and not owned:
+                # [NOTE] Shares the column buffers, the source (or the slice
+                # returned by a filter) is never modified.
+                df = df.copy(deep=False)
+            df = step.run(df)
+            owned = isinstance(step, AddColumn)
+        return df
@@ -0,0 +1,329 @@
+import re
+import numbers
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Union
+
+import numpy as np
+import pandas as pd
+
+
+r"""[Rules Summary]
+    Declarative validation of a table before it is uploaded or emailed
+    (dataOut), in place of checking rows by hand in python loops.
+
+    A Schema maps columns to rules, and is compiled once into Rule objects:
+
+    ```python
+    schema = Schema({
+        "Employee ID": {"required": True, "unique": True, "regex": r"\d{6}"},
+        "Salary": {"range": (30000, 250000)},
+        "Country": {"required": True, "allowed": ["US", "UK", "IN"]},
+        ("Employee ID", "Date"): {"unique": True}})
+    violations = Table.validate(df, schema)
+    violations.report      # row, column, rule, value
+    ```
+
+    Every rule is evaluated over the whole column at once into a boolean
+    mask of the rows violating it. Regex and allowed rules are evaluated
+    once per distinct value of the column, shared by every rule on that
+    column. Missing values only violate required; the other rules skip them.
+
+    In fail-fast mode the rules stop at the first one violated, and the
+    report holds that rule's violations.
+"""
+
+
+class UnknownRule(Exception):
+    """
+    _The rule is not one of Schema.RULES._
+    """
+    pass
+
+
+class _Columns:
+    """
+    _Per validation cache of the distinct values of each column._
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._factorized = dict()
+
+    def factorize(self, column: Any) -> tuple:
+        if not column in self._factorized:
+            self._factorized[column] = pd.factorize(self.df[column])
+        return self._factorized[column]
+
+    def per_value(self, column: Any, evaluate: Callable) -> np.ndarray:
+        """_Evaluates a predicate on the distinct values, broadcast to the rows._"""
+
+        codes, uniques = self.factorize(column)
+        valid = np.asarray(evaluate(pd.Series(uniques)), dtype=bool)
+        # [NOTE] Missing values have code -1, they are not violations.
+        return np.append(valid, True)[codes]
+
+
+class Rule(ABC):
+    """
+    _A rule over one column, see the module summary._
+    """
+
+    name = "rule"
+
+    def __init__(self, column: Any, name: str = None):
+        self.column = column
+        if name:
+            self.name = name
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.column!r})"
+
+    @abstractmethod
+    def valid(self, columns: _Columns) -> np.ndarray:
+        """_Boolean mask of the rows satisfying the rule._"""
+        pass
+
+    def violations(self, columns: _Columns) -> np.ndarray:
+        """_Boolean mask of the rows violating the rule._"""
+
+        return ~self.valid(columns)
+
+
+class Required(Rule):
+    """
+    _The column exists and is neither missing nor blank._
+    """
+
+    name = "required"
+
+    def valid(self, columns: _Columns) -> np.ndarray:
+        values = columns.df[self.column]
+        valid = values.notna().to_numpy()
+        if values.dtype == object or pd.api.types.is_string_dtype(values):
+            valid = valid & columns.per_value(self.column, lambda u: u.astype(str).str.strip() != "")
+        return valid
+
+
+class Range(Rule):
+    """
+    _Values between minimum and maximum, inclusive. Either bound may be None.
+     With numeric bounds, a text column is read as numbers and text that is
+     not a number is a violation._
+    """
+
+    name = "range"
+
+    def __init__(self, column: Any, minimum: Any = None, maximum: Any = None, name: str = None):
+        super().__init__(column, name)
+        self.minimum, self.maximum = minimum, maximum
+
+    def valid(self, columns: _Columns) -> np.ndarray:
+        values = columns.df[self.column]
+        missing = values.isna().to_numpy()
+        bounds = [b for b in (self.minimum, self.maximum) if b is not None]
+        if bounds and all(isinstance(b, numbers.Number) for b in bounds) \
+                and not pd.api.types.is_numeric_dtype(values):
+            if values.dtype == object or pd.api.types.is_string_dtype(values):
+                # [NOTE] Blank text is missing, as for required.
+                missing = missing | columns.per_value(self.column, lambda u: u.astype(str).str.strip() == "")
+            values = pd.to_numeric(values, errors="coerce")
+        valid = np.ones(len(values), dtype=bool)
+        if self.minimum is not None:
+            valid &= (values >= self.minimum).to_numpy(dtype=bool, na_value=False)
+        if self.maximum is not None:
+            valid &= (values <= self.maximum).to_numpy(dtype=bool, na_value=False)
+        return valid | missing
+
+
+class Regex(Rule):
+    """
+    _Text matching the whole pattern._
+    """
+
+    name = "regex"
+
+    def __init__(self, column: Any, pattern: str, name: str = None):
+        super().__init__(column, name)
+        self.pattern = re.compile(pattern)
+
+    def valid(self, columns: _Columns) -> np.ndarray:
+        return columns.per_value(self.column, lambda u: u.astype(str).str.fullmatch(self.pattern))
+
+
+class Allowed(Rule):
+    """
+    _Values among the allowed values._
+    """
+
+    name = "allowed"
+
+    def __init__(self, column: Any, values: list, name: str = None):
+        super().__init__(column, name)
+        self.values = list(values)
+
+    def valid(self, columns: _Columns) -> np.ndarray:
+        values = columns.df[self.column]
+        if isinstance(values.dtype, np.dtype) and values.dtype.kind in "iub":
+            # [NOTE] Hashing numbers is cheaper than factorizing them first.
+            return values.isin(self.values).to_numpy()
+        return columns.per_value(self.column, lambda u: u.isin(self.values))
+
+
+class Unique(Rule):
+    """
+    _Values, or combinations of the values of several columns, found once._
+    """
+
+    name = "unique"
+
+    def valid(self, columns: _Columns) -> np.ndarray:
+        keys = list(self.column) if isinstance(self.column, tuple) else [self.column]
+        values = columns.df[keys]
+        duplicated = values.duplicated(keep=False).to_numpy()
+        # [NOTE] Rows missing a key are not duplicates of each other.
+        return ~duplicated | values.isna().any(axis=1).to_numpy()
+
+
+class Check(Rule):
+    """
+    _A vectorized callable taking the column and returning True for valid values._
+    """
+
+    name = "check"
+
+    def __init__(self, column: Any, func: Callable, name: str = None):
+        super().__init__(column, name)
+        self.func = func
+
+    def valid(self, columns: _Columns) -> np.ndarray:
+        values = columns.df[self.column]
+        valid = self.func(values)
+        valid = valid.fillna(False).to_numpy(dtype=bool) if isinstance(valid, pd.Series) else np.asarray(valid, dtype=bool)
+        return valid | values.isna().to_numpy()
+
+
+@dataclass
+class Violations:
+
+    report: pd.DataFrame
+    rules: int
+    failfast: bool = False
+
+    @property
+    def valid(self) -> bool:
+        """
+        _True when no rule is violated._
+        """
+
+        return self.report.empty
+
+    def summary(self) -> pd.DataFrame:
+        """
+        _Number of violations by column and rule._
+        """
+
+        return self.report.groupby(["column", "rule"], sort=False).size().rename("violations").reset_index()
+
+
+class Schema:
+    """
+    _Declarative rules {column: {rule: argument}}, compiled once into Rule objects._
+    """
+
+    RULES = {
+        "required": lambda column, arg: Required(column) if arg else None,
+        "range": lambda column, arg: Range(column, *arg),
+        "min": lambda column, arg: Range(column, arg, None, "min"),
+        "max": lambda column, arg: Range(column, None, arg, "max"),
+        "regex": lambda column, arg: Regex(column, arg),
+        "allowed": lambda column, arg: Allowed(column, arg),
+        "unique": lambda column, arg: Unique(column) if arg else None,
+        "check": lambda column, arg: Check(column, arg)}
+
+    def __init__(self, rules: Union[dict, list]):
+        """
+        Args:
+            rules (Union[dict, list]): _{column: {rule: argument}}, or a list of Rule objects_
+
+        Raises:
+            UnknownRule: _a rule is not among Schema.RULES_
+        """
+
+        if isinstance(rules, Schema):
+            rules = rules.rules
+        if isinstance(rules, dict):
+            compiled = list()
+            for column, spec in rules.items():
+                for rule, arg in spec.items():
+                    if not rule in self.RULES:
+                        raise UnknownRule(rule)
+                    compiled.append(self.RULES[rule](column, arg))
+            rules = [rule for rule in compiled if rule is not None]
+        # [NOTE] Required first, the other rules skip missing values.
+        self.rules = sorted(rules, key=lambda rule: not isinstance(rule, Required))
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def validate(self, df: pd.DataFrame, failfast: bool = False) -> Violations:
+        """_Validates df against every rule._
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+            failfast (bool, optional): _stop at the first rule violated_. Defaults to False.
+
+        Returns:
+            Violations: _report of (row, column, rule, value), one row per violation_
+        """
+
+        columns = _Columns(df)
+        rows, names, rules, values = list(), list(), list(), list()
+        for rule in self.rules:
+            keys = list(rule.column) if isinstance(rule.column, tuple) else [rule.column]
+            missing = [key for key in keys if not key in df.columns]
+            if missing:
+                # [NOTE] A missing column is one violation, not one per row.
+                rows.append(pd.Index([None])), names.append(rule.column), rules.append(rule.name)
+                values.append(np.array([f"missing column {', '.join(map(str, missing))}"], dtype=object))
+            else:
+                positions = np.flatnonzero(rule.violations(columns))
+                if not len(positions):
+                    continue
+                rows.append(df.index.take(positions)), names.append(rule.column), rules.append(rule.name)
+                if len(keys) == 1:
+                    values.append(df[keys[0]].take(positions).to_numpy(dtype=object))
+                else:
+                    chunk = np.empty(len(positions), dtype=object)
+                    chunk[:] = list(df[keys].take(positions).itertuples(index=False, name=None))
+                    values.append(chunk)
+            if failfast:
+                break
+
+        lengths = [len(r) for r in rows]
+        # [NOTE] Filled one by one, numpy would unpack tuple keys into a second dimension.
+        headers = np.empty(len(names), dtype=object)
+        for i, name in enumerate(names):
+            headers[i] = name
+        report = pd.DataFrame({
+            "row": np.concatenate([r.to_numpy(dtype=object) for r in rows]) if rows else np.array([], dtype=object),
+            "column": np.repeat(headers, lengths),
+            "rule": np.repeat(np.array(rules, dtype=object), lengths),
+            "value": np.concatenate(values) if values else np.array([], dtype=object)})
+        return Violations(report, len(self.rules), failfast)
+
+
+def validate(df: pd.DataFrame, rules: Union[Schema, dict, list], failfast: bool = False) -> Violations:
+    """_Validates df against a schema, see the module summary._
+
+    Args:
+        df (pd.DataFrame): _pandas.DataFrame_
+        rules (Union[Schema, dict, list]): _Schema, {column: {rule: argument}} or Rule objects_
+        failfast (bool, optional): _stop at the first rule violated_. Defaults to False.
+
+    Returns:
+        Violations: _report of (row, column, rule, value), one row per violation_
+    """
+
+    schema = rules if isinstance(rules, Schema) else Schema(rules)
+    return schema.validate(df, failfast)
@@ -0,0 +1,160 @@
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+
+"""[Store Summary]
+    Copy-on-write storage behind Console.df and Excel.df.
+
+    The df properties used to return a deep copy on every read so that
+    table operations could never modify the stored DataFrame by accident.
+    FrameStore instead hands out shallow views: a new DataFrame object that
+    shares the stored column buffers. Adding, dropping or reassigning columns
+    on a view does not reach the store, so reads cost nothing no matter the
+    size of the table. The shared buffers are marked read-only in the view, so
+    an in place write (view.iloc[0, 0] = x, view[col].values[0] = x) raises
+    ValueError, or with copy-on-write pandas copies the column first, instead
+    of writing into the store. The Table operations that set cells
+    (change_value, patch, upsert, update_by_key) copy the columns they set
+    before writing, and return a new DataFrame, leaving the view and the
+    store unchanged.
+
+    Writes into existing cells must go through FrameStore.edit(), which
+    clones the DataFrame on the first write only, and commits the clone as
+    the next version when the block exits without an exception:
+
+    ```python
+    with console.store.edit() as edit:
+        if needs_fix:
+            edit.writable().iloc[0, 0] = "fixed"
+    ```
+"""
+
+
+def _read_only(values):
+    """_The same values, behind buffers that cannot be written into._"""
+
+    if isinstance(values, np.ndarray):
+        view = values.view()
+        view.flags.writeable = False
+        return view
+    if hasattr(values, "_ndarray"):
+        # [NOTE] Categorical, DatetimeArray, StringArray: one backing ndarray.
+        return values._from_backing_data(_read_only(values._ndarray))
+    if hasattr(values, "_data") and hasattr(values, "_mask"):
+        # [NOTE] Nullable Int64, Float64, boolean: values and mask.
+        return type(values)(_read_only(values._data), _read_only(values._mask))
+    return values.copy()
+
+
+class FrameEdit:
+    """
+    _An open edit of a FrameStore, see FrameStore.edit._
+    """
+
+    def __init__(self, store: "FrameStore"):
+        self._store = store
+        self._df = None
+        self.written = False
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """
+        _The edited DataFrame, a shared view until the first write._
+        """
+
+        if self._df is None:
+            return self._store.read()
+        return self._df
+
+    @df.setter
+    def df(self, value: pd.DataFrame):
+        # [NOTE] A replacement DataFrame is already a new object, no clone needed.
+        self._df = value
+        self.written = True
+
+    def writable(self) -> pd.DataFrame:
+        """_Returns a DataFrame that can be written into in place. The stored
+            DataFrame is cloned on the first call only._
+
+        Returns:
+            pd.DataFrame: _private clone of the stored DataFrame_
+        """
+
+        if not self.written:
+            self._df = self._store._df.copy()
+            self._store._clones += 1
+            self.written = True
+        return self._df
+
+
+class FrameStore:
+    """
+    _Versioned, copy-on-write storage for a single DataFrame._
+    """
+
+    def __init__(self, df: pd.DataFrame = None):
+        """
+        Args:
+            df (pd.DataFrame, optional): _initial DataFrame_. Defaults to an empty DataFrame.
+        """
+
+        self._df = pd.DataFrame() if df is None else df
+        self._clones = 0
+        self.version = 0
+
+    def read(self) -> pd.DataFrame:
+        """_Returns a view of the stored DataFrame. The view shares the stored
+            buffers read-only, writes into it in place raise ValueError or
+            leave the store unchanged, use edit() for those._
+
+        Returns:
+            pd.DataFrame: _shallow view_
+        """
+
+        view = self._df.copy(deep=False)
+        for block in view._mgr.blocks:
+            block.values = _read_only(block.values)
+        return view
+
+    def commit(self, df: pd.DataFrame):
+        """_Stores df as the next version._
+
+        Args:
+            df (pd.DataFrame): _pandas.DataFrame_
+        """
+
+        self._df = df
+        self.version += 1
+
+    @contextmanager
+    def edit(self):
+        """_Opens an edit of the stored DataFrame. The edit is committed as the
+            next version if anything was written and no exception was raised._
+
+        Yields:
+            FrameEdit: _the open edit_
+        """
+
+        edit = FrameEdit(self)
+        yield edit
+        if edit.written:
+            self.commit(edit._df)
+
+    def memory_usage(self, deep: bool = False) -> dict:
+        """_Reports the memory held by the stored DataFrame._
+
+        Args:
+            deep (bool, optional): _include python objects held by object columns_. Defaults to False.
+
+        Returns:
+            dict: _{"version", "bytes", "rows", "columns", "clones"}_
+        """
+
+        return {
+            "version": self.version,
+            "bytes": int(self._df.memory_usage(index=True, deep=deep).sum()),
+            "rows": len(self._df),
+            "columns": len(self._df.columns),
+            "clones": self._clones}
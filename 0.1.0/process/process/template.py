@@ -173,7 +173,9 @@ class Process(Process):
 
 
 MAIN_PY = """
+import sys
 import traceback
+from process import daemon
 from process.__main__ import Console
 
 # This file should not be changed.
@@ -191,6 +193,21 @@ if __name__ == "__main__":
     # Imports Process from the inheriting package as a parameter for Console
     from .__init__ import Process 
 
+    # Unattended runs, python -m name_of_your_package main (or dataIn, dataOut),
+    # are answered from PROCESS_BATCH (see process.batch) and run on the process
+    # daemon when one is running, where pandas, pywin32 and office365 are already
+    # imported and SharePoint signed in (see process.daemon). Without it, the
+    # process runs here.
+    if sys.argv[1:] and sys.argv[1] in daemon.CALLS:
+        try:
+            daemon.submit(f"{__package__}:Process", sys.argv[1])
+        except daemon.DaemonUnavailable:
+            getattr(Process(), sys.argv[1])()
+        except daemon.JobFailed as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
+
     try:
         app = Console(Process)
         app.main()
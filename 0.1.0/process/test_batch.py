@@ -0,0 +1,102 @@
+import os
+import inspect
+import tempfile
+from time import perf_counter
+
+from process import Console, Table
+from process.batch import Batch, InvalidBatchAnswer, MissingBatchAnswer, prompt_key
+
+
+class Test_Batch:
+
+    def test_prompt_key(self):
+        print(inspect.stack()[0][3])
+        result = "OK" if prompt_key("Please enter the date [mm/dd/yyyy]: ") == "please_enter_the_date" \
+            and prompt_key("Selection? [#, #-#, #,#,#, #-#/#, !#, *]: ") == "selection" \
+            and prompt_key("PROCESS_MENU") == "process_menu" else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_answers(self):
+        print(inspect.stack()[0][3])
+        batch = Batch(["first", True], {"Start date": ["01/02/2023", "02/03/2023"]})
+        answers = [batch.answer("Name?: "), batch.answer("Start date [mm/dd/yyyy]: "),
+                   batch.answer("Start date [mm/dd/yyyy]: "), batch.answer("Start date [mm/dd/yyyy]: ")]
+        try:
+            batch.answer("Name?: ")
+            missing = False
+        except MissingBatchAnswer:
+            missing = True
+        result = "OK" if answers == ["first", "01/02/2023", "02/03/2023", "y"] and missing \
+            and [entry["key"] for entry in batch.transcript] == ["name", "start_date", "start_date", "start_date"] else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_console(self):
+        print(inspect.stack()[0][3])
+        with Batch(keyed={"Start date": "1/2/2023", "selection": "2-3"}):
+            date = Console.get_date("Start date")
+            positions = list(range(5)[Console.get_row_selection(length=5)])
+        with Batch(["n"]):
+            yesno = Console.get_yesno("Continue?")
+        result = "OK" if date == "01/02/2023" and positions == [2, 3] and yesno == "no" \
+            and Batch.current is None else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_reject(self):
+        print(inspect.stack()[0][3])
+        start = perf_counter()
+        rejected = list()
+        for answers, call in [(["not a date"], lambda: Console.get_date("Start date")),
+                              (["2"], lambda: Table.get_row_selection(filter=[0, 1], length=3)),
+                              (["x"], lambda: Console.get_option_selection("Menu", {1: "a"}))]:
+            with Batch(answers) as batch:
+                try:
+                    call()
+                except InvalidBatchAnswer:
+                    rejected.append("rejected" in batch.transcript[-1])
+        # [NOTE] Interactively each rejection sleeps 2s before asking again.
+        result = "OK" if rejected == [True, True, True] and perf_counter() - start < 1 else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_environment(self):
+        print(inspect.stack()[0][3])
+        with tempfile.TemporaryDirectory() as folder:
+            script = os.path.join(folder, "answers.txt")
+            with open(script, "w") as f:
+                f.write("# dates\n01/02/2023\n\n1\n")
+            batch = Batch.from_environment({"PROCESS_BATCH": script, "PROCESS_ANSWER_PROCESS_MENU": "3"})
+            interactive = Batch.from_environment(dict())
+        result = "OK" if batch.answers == ["01/02/2023", "1"] and batch.keyed == {"process_menu": ["3"]} \
+            and interactive is None else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_replay(self):
+        print(inspect.stack()[0][3])
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "transcript.json")
+            with Batch(keyed={"Start date": "1/2/2023", "selection": "*"}) as batch:
+                first = (Console.get_date("Start date"), list(range(2)[Console.get_row_selection(length=2)]))
+            batch.save(path)
+            with Batch.from_json(path):
+                second = (Console.get_date("Start date"), list(range(2)[Console.get_row_selection(length=2)]))
+        result = "OK" if first == second == ("01/02/2023", [0, 1]) else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def main(self):
+        self.test_prompt_key()
+        self.test_answers()
+        self.test_console()
+        self.test_reject()
+        self.test_environment()
+        self.test_replay()
+
+
+if __name__ == "__main__":
+
+    test = Test_Batch()
+    test.main()
@@ -0,0 +1,206 @@
+import io
+import os
+import sys
+import shutil
+import inspect
+import tempfile
+import threading
+from time import perf_counter
+
+from process import Process, Console
+from process import daemon
+from process.daemon import Daemon, DaemonUnavailable, JobFailed
+
+
+KEY = b"test_daemon"
+
+# [NOTE] A package laid out as process.template generates them.
+PACKAGE = {
+    "__init__.py": "from .process import Process\n",
+    "helpers.py": "VALUE = 1\n",
+    "process.py": """
+import os
+from process import Process as Base
+from .helpers import VALUE
+
+
+class Process(Base):
+
+    def dataIn(self):
+        return VALUE
+
+    def dataOut(self):
+        pass
+
+    def close(self, *names):
+        with open(os.path.join(os.path.dirname(__file__), "closed.txt"), "a") as f:
+            f.write("closed\\n")
+        return super().close(*names)
+"""}
+
+
+class _Process(Process):
+
+    built = 0
+
+    def __init__(self, username: str = None, password: str = None):
+        super().__init__(username, password)
+        _Process.built += 1
+
+    def dataIn(self):
+        print("reading")
+        return [1, 2]
+
+    def dataOut(self, first, second):
+        return first / (second - 2)
+
+    def main(self):
+        return Console.get_date("Start date")
+
+
+class Test_Daemon:
+
+    @classmethod
+    def setup_class(cls):
+        cls.folder = tempfile.mkdtemp()
+        cls.package = os.path.join(cls.folder, "daemon_package")
+        os.makedirs(cls.package)
+        for name, text in PACKAGE.items():
+            with open(os.path.join(cls.package, name), "w") as f:
+                f.write(text)
+        sys.path.insert(0, cls.folder)
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        # [NOTE] On a free port, with nothing preloaded.
+        cls.daemon = Daemon(("127.0.0.1", 0), KEY, preload=[])
+        cls.thread = threading.Thread(target=cls.daemon.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def teardown_class(cls):
+        daemon.command("stop", cls.daemon.address, KEY)
+        cls.thread.join(5)
+        sys.path.remove(cls.folder)
+        shutil.rmtree(cls.folder, ignore_errors=True)
+
+    def submit(self, call: str, process: str = "test_daemon:_Process", **kwargs):
+        return daemon.submit(process, call, address=self.daemon.address, key=KEY, **kwargs)
+
+    def _closed(self) -> int:
+        path = os.path.join(self.package, "closed.txt")
+        if not os.path.exists(path):
+            return 0
+        with open(path) as f:
+            return len(f.readlines())
+
+    def _edit(self, name: str, text: str):
+        path = os.path.join(self.package, name)
+        modified = os.stat(path).st_mtime
+        with open(path, "w") as f:
+            f.write(text)
+        # [NOTE] Later than the cached bytecode, whatever the clock resolution.
+        os.utime(path, (modified + 10, modified + 10))
+
+    def test_submit(self):
+        print(inspect.stack()[0][3])
+        stdout = io.StringIO()
+        first = self.submit("dataIn", stdout=stdout)
+        second = self.submit("dataIn", stdout=stdout)
+        status = daemon.command("ping", self.daemon.address, KEY)
+        built = sys.modules["test_daemon"]._Process.built # [NOTE] The daemon's copy of this module.
+        result = "OK" if first == second == [1, 2] and stdout.getvalue() == "reading\nreading\n" \
+            and built == 1 and "test_daemon:_Process" in status["processes"] else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_failure(self):
+        print(inspect.stack()[0][3])
+        try:
+            self.submit("dataOut", args=[1, 2], stderr=io.StringIO())
+            failed = None
+        except JobFailed as e:
+            failed = e
+        try:
+            self.submit("__init__")
+            refused = False
+        except JobFailed:
+            refused = True
+        result = "OK" if isinstance(failed.__cause__, ZeroDivisionError) and "ZeroDivisionError" in str(failed) \
+            and refused else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_batch(self):
+        print(inspect.stack()[0][3])
+        date = self.submit("main", answers={"Start date": "1/2/2023"})
+        try:
+            self.submit("main", answers=list())
+            missing = False
+        except JobFailed as e:
+            missing = "MissingBatchAnswer" in str(e)
+        result = "OK" if date == "01/02/2023" and missing else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_reload(self):
+        print(inspect.stack()[0][3])
+        before = self.submit("dataIn", "daemon_package:Process")
+        cached = self.submit("dataIn", "daemon_package:Process")
+        # [NOTE] Neither __init__.py nor process.py changes, only a module they import.
+        self._edit("helpers.py", "VALUE = 2\n")
+        after = self.submit("dataIn", "daemon_package:Process")
+        result = "OK" if (before, cached, after) == (1, 1, 2) and self._closed() == 1 else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_close(self):
+        print(inspect.stack()[0][3])
+        self.submit("dataIn", "daemon_package:Process")
+        closed = self._closed()
+        dropped = daemon.command("close", self.daemon.address, KEY)
+        status = daemon.command("ping", self.daemon.address, KEY)
+        result = "OK" if "daemon_package" in dropped and self._closed() == closed + 1 \
+            and not status["processes"] else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_unavailable(self):
+        print(inspect.stack()[0][3])
+        failures = 0
+        for address, key in [(("127.0.0.1", 1), KEY), (self.daemon.address, b"wrong")]:
+            try:
+                daemon.command("ping", address, key)
+            except DaemonUnavailable:
+                failures += 1
+        result = "OK" if failures == 2 else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_latency(self, jobs: int = 50):
+        print(inspect.stack()[0][3])
+        start = perf_counter()
+        for _ in range(jobs):
+            self.submit("dataIn", stdout=io.StringIO())
+        latency = (perf_counter() - start) / jobs
+        print(f"{latency * 1000:.2f}ms per job")
+        result = "OK" if latency < 0.01 else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def main(self):
+        self.setup_class()
+        try:
+            self.test_submit()
+            self.test_failure()
+            self.test_batch()
+            self.test_reload()
+            self.test_close()
+            self.test_unavailable()
+            self.test_latency()
+        finally:
+            self.teardown_class()
+
+
+if __name__ == "__main__":
+
+    test = Test_Daemon()
+    test.main()
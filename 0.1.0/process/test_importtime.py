@@ -0,0 +1,86 @@
+import os
+import sys
+import inspect
+import subprocess
+
+
+# [NOTE] Modules that must not load with the bare package.
+HEAVY = ["pandas", "numpy", "dateutil", "win32com", "win32gui", "win32api",
+         "win32ui", "msoffcrypto", "pyodbc", "office365", "process.table"]
+
+SUBSYSTEMS = {
+    "process": "import process",
+    "process.shared": "from process import Console, Table",
+    "process.table": "import process.table",
+    "process.scheduler": "from process import Scheduler",
+    "process.office (sharepoint)": "from process.office import SharePoint",
+    "process.office (desktop)": "from process.office import Excel, Word, Outlook, FileManager"}
+
+
+def _importtime(statement: str) -> tuple:
+    """_Runs statement in a fresh interpreter under -X importtime._
+
+    Returns:
+        tuple: _({top level module: cumulative microseconds}, modules loaded, error)_
+    """
+
+    script = f"{statement}\nimport sys\nprint(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", script],
+                            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    entries = dict()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2 and not "[us]" in line:
+            _, cumulative, name = line.split("|")
+            if not name.startswith("  "):
+                entries[name.strip()] = int(cumulative)
+    error = result.stderr.strip().splitlines()[-1] if result.returncode else None
+    return entries, set(result.stdout.split()), error
+
+
+def _total(statement: str, baseline: dict) -> tuple:
+    entries, modules, error = _importtime(statement)
+    return sum(us for name, us in entries.items() if not name in baseline), modules, error
+
+
+class Test_ImportTime:
+
+    """
+    _-X importtime totals are printed for review, the bare package and the
+     Console are asserted not to load the heavy dependencies._
+    """
+
+    BASELINE = _importtime("pass")[0]
+
+    def test_bare_package(self):
+        print(inspect.stack()[0][3])
+        total, modules, error = _total("import process", self.BASELINE)
+        loaded = [m for m in HEAVY if m in modules]
+        print(f"import process {total / 1000:.1f}ms | heavy modules loaded: {loaded or 'none'}")
+        result = "OK" if error is None and not loaded else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_console(self):
+        print(inspect.stack()[0][3])
+        total, modules, error = _total("from process import Console, Table", self.BASELINE)
+        loaded = [m for m in HEAVY if m in modules]
+        result = "OK" if error is None and not loaded else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_subsystems(self):
+        print(inspect.stack()[0][3])
+        for subsystem, statement in SUBSYSTEMS.items():
+            total, _, error = _total(statement, self.BASELINE)
+            print(f"{subsystem:<28} {error or f'{total / 1000:.1f}ms'}")
+
+    def main(self):
+        self.test_bare_package()
+        self.test_console()
+        self.test_subsystems()
+
+
+if __name__ == "__main__":
+
+    test = Test_ImportTime()
+    test.main()
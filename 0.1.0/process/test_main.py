@@ -1 +1,109 @@
-from .process.__main__ import Console
\ No newline at end of file
+import os
+import json
+import inspect
+import tempfile
+from time import perf_counter
+
+from process import Process
+from process.__main__ import Console, MenuRegistry, MenuEntry, PARSERS
+
+
+class _Process(Process):
+
+    def dataIn(self, path: str, rows: int, sheets: list = None):
+        return [path, rows]
+
+    def dataOut(self, path, rows):
+        pass
+
+    def report(self, options: dict, strict: "bool"):
+        pass
+
+
+class Test_Menu:
+
+    def test_build(self):
+        print(inspect.stack()[0][3])
+        registry = MenuRegistry.build(_Process, Console.__all__)
+        entries = {entry.name: entry for entry in registry.entries}
+        result = "OK" if entries["dataIn"].parameters == [["path", "str", True], ["rows", "int", True], ["sheets", "list", False]] \
+            and entries["report"].parameters == [["options", "dict", True], ["strict", "bool", True]] \
+            and entries["report"].title == "Report" and not "_sharepoint" in entries \
+            and list(registry.options().values())[-1] == "Go Back To Main" else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_parsers(self):
+        print(inspect.stack()[0][3])
+        result = "OK" if PARSERS["list"]("[a, b]") == ["a", "b"] and PARSERS["tuple"]("(1,2)") == ("1", "2") \
+            and PARSERS["dict"]("{a: 1, b: 2}") == {"a": "1", "b": "2"} and PARSERS["bool"]("yes") is True else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_cache(self):
+        print(inspect.stack()[0][3])
+        with tempfile.TemporaryDirectory() as cache:
+            built = MenuRegistry.of(_Process, Console.__all__, cache)
+            MenuRegistry._built.clear()
+            path = os.path.join(cache, os.listdir(cache)[0])
+            with open(path) as f:
+                saved = f.read()
+            loaded = MenuRegistry._load(path, [s[0] for s in json.loads(saved)["sources"]])
+            stale = MenuRegistry._load(path, [__file__])
+        result = "OK" if loaded is not None and [e.name for e in loaded.entries] == [e.name for e in built.entries] \
+            and isinstance(loaded.entries[0], MenuEntry) and stale is None else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_bind(self):
+        print(inspect.stack()[0][3])
+        api = _Process()
+        actions = MenuRegistry.build(_Process, Console.__all__).bind(api)
+        entry, func = next(action for action in actions.values() if action[0].name == "dataIn")
+        # [NOTE] Binding must not construct the services of the process.
+        result = "OK" if func("x.xlsx", 2) == ["x.xlsx", 2] and not api.timings else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_exclude(self):
+        print(inspect.stack()[0][3])
+        Small = type("Small", (_Process,), {"a": lambda self: None, "b": lambda self: None})
+        # [NOTE] Without a source file, the menu is still built when the disk cache is off.
+        Small.__module__ = "no_such_module"
+        with tempfile.TemporaryDirectory() as cache:
+            kept = [[e.name for e in MenuRegistry.of(Small, exclude, store).entries if e.name in ["a", "b"]]
+                    for exclude, store in [(["a"], None), ([], None), (["b"], cache), ([], cache)]]
+        result = "OK" if kept == [["b"], ["a", "b"], ["a"], ["a", "b"]] else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def bench_launch(self):
+        print(inspect.stack()[0][3])
+        # [NOTE] A large Process class, 500 functions with annotated parameters.
+        namespace = dict()
+        exec("\n".join(f"def step_{i}(self, path: str, rows: int, columns: list=None): pass" for i in range(500)), namespace)
+        Large = type("Large", (_Process,), {k: v for k, v in namespace.items() if k.startswith("step_")})
+        Large.__module__ = __name__
+        with tempfile.TemporaryDirectory() as cache:
+            start = perf_counter()
+            MenuRegistry.of(Large, Console.__all__, cache)
+            built = perf_counter() - start
+            MenuRegistry._built.clear()
+            start = perf_counter()
+            registry = MenuRegistry.of(Large, Console.__all__, cache)
+            cached = perf_counter() - start
+        print(f"{len(registry.entries)} entries | built {built:.4f}s | from the disk cache {cached:.4f}s")
+
+    def main(self):
+        self.test_build()
+        self.test_parsers()
+        self.test_cache()
+        self.test_bind()
+        self.test_exclude()
+        self.bench_launch()
+
+
+if __name__ == "__main__":
+
+    test = Test_Menu()
+    test.main()
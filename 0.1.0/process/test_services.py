@@ -0,0 +1,78 @@
+import inspect
+from types import SimpleNamespace
+
+import process as package
+from process import Process
+from process.services import Service, UnknownService
+
+
+class _Process(Process):
+
+    built = list()
+
+    def dataIn(self):
+        pass
+
+    def dataOut(self):
+        pass
+
+    # [NOTE] Stand-ins for the Office services, which need Windows.
+    excel = Service(lambda process: process.built.append("excel") or "Excel")
+    outlook = Service(lambda process: process.built.append("outlook") or "Outlook")
+    broken = Service(lambda process: 1 / 0)
+
+
+class Test_Services:
+
+    def test_lazy(self):
+        print(inspect.stack()[0][3])
+        process = _Process("user", "password")
+        process.built = list()
+        first, second = process.excel, process.excel
+        result = "OK" if first == second == "Excel" and process.built == ["excel"] \
+            and list(process.timings) == ["excel"] and isinstance(_Process.excel, Service) else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_warmup_close(self):
+        print(inspect.stack()[0][3])
+        process = _Process()
+        process.built = list()
+        timings = process.warmup("excel", "outlook", "broken")
+        closed = process.close("excel")
+        _ = process.excel
+        try:
+            process.warmup("missing")
+            unknown = False
+        except UnknownService:
+            unknown = True
+        result = "OK" if list(timings) == ["excel", "outlook"] and closed == ["excel"] \
+            and process.built == ["excel", "outlook", "excel"] and unknown else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def test_credentials(self):
+        print(inspect.stack()[0][3])
+        process = _Process("user", "password")
+        office = package.office
+        package.office = SimpleNamespace(SharePoint=lambda username, password: (username, password))
+        try:
+            held = process._Process__credentials
+            sharepoint = process.sharepoint
+        finally:
+            package.office = office
+        result = "OK" if held == sharepoint == ("user", "password") \
+            and not hasattr(process, "_Process__credentials") else "FAILED!"
+        print(result)
+        assert result == "OK"
+
+    def main(self):
+        self.test_lazy()
+        self.test_warmup_close()
+        self.test_credentials()
+
+
+if __name__ == "__main__":
+
+    test = Test_Services()
+    test.main()